@@ -3,6 +3,18 @@ ASGI config for job_portal project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Despliegue ASGI (search_jobs, my_applications y apply_to_job son vistas async):
+
+    uvicorn job_portal.asgi:application --host 0.0.0.0 --port 8000 --workers 4
+    daphne -b 0.0.0.0 -p 8000 job_portal.asgi:application
+
+El cuerpo de la petición se recibe en el bucle de eventos, así un worker
+atiende muchas subidas de CV lentas sin ocupar un hilo por cada una; el ORM y
+las vistas síncronas corren en el hilo de sync_to_async de cada petición.
+Con ASGI las conexiones persistentes no se reutilizan entre peticiones (cada
+una tiene su propio hilo): usar DJANGO_CONN_MAX_AGE=0 en el perfil production.
+Para comparar con WSGI: ``manage.py loadtest_compare`` (ver su ayuda).
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
@@ -42,7 +42,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'recruiter_app.middleware.StaticAssetMiddleware',
+    'recruiter_app.perf.PerfMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'recruiter_app.middleware.PrimaryStickinessMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -55,7 +58,8 @@ ROOT_URLCONF = 'job_portal.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # DjangoTemplates que además mide el tiempo de render (ver recruiter_app/perf.py)
+        'BACKEND': 'recruiter_app.perf.InstrumentedDjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -82,6 +86,108 @@ DATABASES = {
     }
 }
 
+# Perfil de producción para SQLite (DJANGO_DB_PROFILE=production):
+# - WAL: los lectores no se bloquean mientras alguien escribe.
+# - synchronous=NORMAL: seguro con WAL; evita un fsync por cada commit.
+# - mmap_size: lecturas desde memoria mapeada (128 MB).
+# - busy_timeout/timeout: espera al lock de escritura en vez de fallar con
+#   "database is locked".
+# - transaction_mode IMMEDIATE: las transacciones toman el lock de escritura
+#   al empezar, así la espera de busy_timeout sí se aplica (en DEFERRED, pasar
+#   de lectura a escritura falla de inmediato si otro proceso está escribiendo).
+# - CONN_MAX_AGE: reutiliza la conexión entre peticiones y paga los PRAGMA una
+#   vez. Bajo ASGI cada petición usa su propio hilo y las conexiones no se
+#   reutilizan: DJANGO_CONN_MAX_AGE=0 (ver job_portal/asgi.py).
+# Ver `manage.py benchmark_sqlite_concurrency` para comparar ambos perfiles.
+SQLITE_PRODUCTION_OPTIONS = {
+    'init_command': (
+        'PRAGMA journal_mode=WAL;'
+        'PRAGMA synchronous=NORMAL;'
+        'PRAGMA mmap_size=134217728;'
+        'PRAGMA busy_timeout=20000;'
+        'PRAGMA temp_store=MEMORY;'
+    ),
+    'timeout': 20,
+    'transaction_mode': 'IMMEDIATE',
+}
+DB_PROFILE = os.environ.get('DJANGO_DB_PROFILE', 'development')
+if DB_PROFILE == 'production':
+    DATABASES['default'].update({
+        'OPTIONS': SQLITE_PRODUCTION_OPTIONS,
+        'CONN_MAX_AGE': int(os.environ.get('DJANGO_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+    })
+
+# Réplicas de lectura (ver recruiter_app/routers.py): DJANGO_DB_REPLICAS es una
+# lista de archivos separados por comas. Para probar en local con dos SQLite:
+#   DJANGO_DB_REPLICAS=replica.sqlite3 python manage.py sync_replicas
+#   DJANGO_DB_REPLICAS=replica.sqlite3 python manage.py runserver
+# y volver a ejecutar sync_replicas para "replicar" los cambios de la primaria.
+DATABASE_REPLICAS = []
+for index, replica_name in enumerate(filter(None, os.environ.get('DJANGO_DB_REPLICAS', '').split(',')), 1):
+    alias = f'replica{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'NAME': os.path.join(BASE_DIR, replica_name.strip()),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+DATABASE_ROUTERS = ['recruiter_app.routers.PrimaryReplicaRouter']
+
+# Archivo de ofertas antiguas (ver recruiter_app/archive.py y `manage.py
+# archive_job_postings`). Con DJANGO_ARCHIVE_DB las tablas de archivo viven en
+# otra base SQLite, que se crea con `manage.py migrate --database archive`;
+# sin ella, en la principal.
+ARCHIVE_DATABASE = None
+if os.environ.get('DJANGO_ARCHIVE_DB'):
+    DATABASES['archive'] = {**DATABASES['default'], 'NAME': os.path.join(BASE_DIR, os.environ['DJANGO_ARCHIVE_DB'])}
+    ARCHIVE_DATABASE = 'archive'
+# Una oferta se archiva cuando tiene más de estos días y ninguna postulación pendiente
+ARCHIVE_AFTER_DAYS = 365
+# Segundos que un navegador sigue leyendo de la primaria después de escribir
+PRIMARY_STICKY_SECONDS = 10
+
+
+# Caché (ver recruiter_app/caching.py). Por defecto vive en la memoria de cada
+# proceso; con varios procesos se usa un backend compartido para que la
+# invalidación llegue a todos, p. ej.:
+#   DJANGO_CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+#   DJANGO_CACHE_LOCATION=/var/tmp/job_portal_cache
+# o django.core.cache.backends.redis.RedisCache con LOCATION=redis://host:6379
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('DJANGO_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('DJANGO_CACHE_LOCATION', 'job-portal'),
+    },
+}
+JOB_CACHE_ALIAS = 'default'
+JOB_CACHE_TIMEOUT = 300  # segundos
+
+# Sesiones y usuario autenticado en caché para que las páginas no consulten
+# django_session ni CustomUser en cada petición (ver recruiter_app/sessions.py
+# y recruiter_app/auth.py). El motor de sesiones en caché necesita una caché
+# compartida entre procesos: con LocMemCache un logout solo borraría la copia
+# del proceso que lo atiende (los demás seguirían sirviendo la sesión) y los
+# cambios guardados solo en la caché no llegarían a los otros procesos. Con
+# LocMemCache las sesiones van a la BD; la comprobación recruiter_app.E001
+# rechaza la combinación.
+if CACHES['default']['BACKEND'] == 'django.core.cache.backends.locmem.LocMemCache':
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+else:
+    SESSION_ENGINE = 'recruiter_app.sessions'
+SESSION_DB_SAVE_INTERVAL = 60  # Segundos entre escrituras en la BD de una misma sesión
+AUTHENTICATION_BACKENDS = ['recruiter_app.auth.CachedModelBackend']
+USER_CACHE_TIMEOUT = 60  # segundos
+
+
+# Métricas de rendimiento por vista (ver recruiter_app/perf.py). El agregado se
+# consulta en /perf/metrics/ (JSON) o /perf/metrics/?format=prometheus, solo staff.
+PERF_MONITORING = os.environ.get('DJANGO_PERF_MONITORING', '1') == '1'
+PERF_SERVER_TIMING = True  # Cabecera Server-Timing (visible en las herramientas del navegador)
+PERF_SLOW_QUERY_MS = 100
+PERF_N_PLUS_ONE_THRESHOLD = 5  # Misma consulta repetida en una petición
+PERF_WINDOW = 500  # Peticiones recientes por vista usadas para los percentiles
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
@@ -119,12 +225,25 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Estáticos propios, sin CDN (ver recruiter_app/assets.py): `manage.py
+# collectstatic` los copia a STATIC_ROOT con el hash del contenido en el nombre
+# y sus variantes .br/.gz, y StaticAssetMiddleware los sirve como inmutables.
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'recruiter_app.assets.PrecompressedManifestStaticFilesStorage'},
+}
+STATIC_MAX_AGE = 60  # segundos; para los nombres sin hash, que se revalidan con ETag
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'recruiter_app.CustomUser'
+
+# Backend de búsqueda de ofertas (ver recruiter_app/search.py)
+JOB_SEARCH_BACKEND = 'recruiter_app.search.SQLiteFTSBackend'
 LOGIN_REDIRECT_URL = 'dashboard'
 LOGOUT_REDIRECT_URL = 'home'
 
@@ -133,6 +252,32 @@ LOGOUT_REDIRECT_URL = 'home'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Subida de CVs: se escriben a disco por bloques, se validan mientras llegan y
+# se guardan una sola vez por contenido (ver recruiter_app/uploads.py)
+FILE_UPLOAD_HANDLERS = ['recruiter_app.uploads.CVUploadHandler']
+CV_MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5 MB
+CV_ALLOWED_CONTENT_TYPES = ('application/pdf',)
+# Un CV sin postulaciones se borra recién cuando lleva este tiempo sin usarse:
+# una postulación nueva puede estar reutilizando el archivo antes de confirmarse
+# (ver recruiter_app/purge.py y `manage.py sweep_orphan_cvs`).
+CV_ORPHAN_GRACE_SECONDS = 3600
+
+# Descarga de CVs (ver recruiter_app/downloads.py). En producción, con
+# 'x-accel-redirect' nginx debe exponer MEDIA_ROOT como location "internal"
+# en CV_ACCEL_REDIRECT_PREFIX; con 'x-sendfile' Apache necesita mod_xsendfile.
+CV_SENDFILE_BACKEND = os.environ.get('CV_SENDFILE_BACKEND') or None
+CV_ACCEL_REDIRECT_PREFIX = '/protected-media/'
+CV_CACHE_MAX_AGE = 3600
+
+# Cola de tareas en segundo plano (ver recruiter_app/taskqueue.py). Los workers
+# se inician con `python manage.py run_task_worker`; con TASKS_RUN_EAGERLY las
+# tareas se ejecutan al confirmar la transacción, sin worker (útil en desarrollo).
+TASKS_RUN_EAGERLY = False
+
+# Correos de notificación (en desarrollo se muestran en la consola)
+EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+DEFAULT_FROM_EMAIL = 'Feria de Empleabilidad UNTELS <no-reply@untels.edu.pe>'
+
 # Esto solo funciona en modo de desarrollo
 if DEBUG: # <-- La corrección está aquí, usar la variable DEBUG directamente
     pass
\ No newline at end of file
@@ -1,8 +1,6 @@
 # job_portal/urls.py
 from django.contrib import admin
 from django.urls import path, include
-from django.conf import settings
-from django.conf.urls.static import static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -10,6 +8,5 @@ urlpatterns = [
     path('', include('recruiter_app.urls')),
 ]
 
-# **Añade esta línea para servir los archivos en modo de desarrollo**
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+# MEDIA_ROOT no se sirve ni en desarrollo: solo contiene CVs, que se descargan
+# siempre por download_cv (comprueba que el reclutador sea el de la oferta).
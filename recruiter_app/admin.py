@@ -1,3 +1,83 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin
 
-# Register your models here.
+from .models import Answer, Application, CustomUser, EducationLevel, JobPosting, Question, QuestionOption, Task
+
+
+# Los listados del admin cargan las relaciones que usan __str__ y list_display
+# con JOIN o prefetch, para que el número de consultas no crezca con las filas.
+
+@admin.register(CustomUser)
+class CustomUserAdmin(UserAdmin):
+    list_display = ('username', 'email', 'is_company', 'is_staff')
+    list_filter = UserAdmin.list_filter + ('is_company',)
+    fieldsets = UserAdmin.fieldsets + (('Portal de empleo', {'fields': ('is_company',)}),)
+
+
+@admin.register(EducationLevel)
+class EducationLevelAdmin(admin.ModelAdmin):
+    list_display = ('name', 'rank')
+
+
+class QuestionInline(admin.TabularInline):
+    model = Question
+    extra = 0
+
+
+@admin.register(JobPosting)
+class JobPostingAdmin(admin.ModelAdmin):
+    list_display = ('title', 'recruiter', 'salary', 'min_education', 'applications_total', 'applications_pending', 'created_at')
+    list_select_related = ('recruiter', 'min_education')
+    list_filter = ('min_education',)
+    search_fields = ('title',)
+    raw_id_fields = ('recruiter',)
+    inlines = [QuestionInline]
+
+
+class QuestionOptionInline(admin.TabularInline):
+    model = QuestionOption
+    extra = 0
+
+
+@admin.register(Question)
+class QuestionAdmin(admin.ModelAdmin):
+    list_display = ('text', 'question_type', 'job_posting')
+    list_select_related = ('job_posting',)
+    raw_id_fields = ('job_posting',)
+    inlines = [QuestionOptionInline]
+
+
+class AnswerInline(admin.TabularInline):
+    model = Answer
+    extra = 0
+    raw_id_fields = ('question',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('question', 'application__applicant')
+
+
+@admin.register(Application)
+class ApplicationAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'status', 'submitted_at')
+    list_filter = ('status',)
+    list_select_related = ('job_posting', 'applicant')
+    raw_id_fields = ('job_posting', 'applicant')
+    inlines = [AnswerInline]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('job_posting', 'applicant').defer('cv_text')
+
+
+@admin.register(Answer)
+class AnswerAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'answer_text')
+    list_select_related = ('question', 'application__applicant')
+    raw_id_fields = ('application', 'question')
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'attempts', 'run_at', 'locked_by', 'finished_at')
+    list_filter = ('status', 'name')
+    search_fields = ('idempotency_key',)
+    readonly_fields = ('created_at', 'finished_at', 'last_error')
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class RecruiterAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'recruiter_app'
+
+    def ready(self):
+        # Registra los receptores de señales, las tareas en segundo plano y las comprobaciones.
+        from . import checks, signals, tasks  # noqa: F401
@@ -0,0 +1,133 @@
+# recruiter_app/archive.py
+"""
+Archivo de ofertas antiguas.
+
+Las ofertas con más de ``ARCHIVE_AFTER_DAYS`` días y sin postulaciones
+pendientes se mueven, con sus preguntas, opciones, postulaciones y
+respuestas, a ArchivedJobPosting/ArchivedApplication (``manage.py
+archive_job_postings``). Así las tablas activas y sus índices solo crecen
+con las ofertas vigentes, y los listados y búsquedas no recorren el histórico.
+
+Cada lote se copia primero al archivo (con ``ignore_conflicts``, así repetir
+un lote interrumpido no duplica nada) y después se borra de las tablas
+activas con ``DELETE ... WHERE id IN (...)`` como en recruiter_app/purge.py.
+Las tablas de archivo pueden estar en otra base (``ARCHIVE_DATABASE``, ver
+recruiter_app/routers.py); los CVs se quedan en su sitio.
+
+Lo archivado se consulta por un camino aparte, más lento y sin caché: las
+vistas archived_jobs, view_archived_applications y my_archived_applications.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from . import caching
+from .models import (
+    Answer, Application, ArchivedApplication, ArchivedJobPosting, JobPosting, Question, QuestionOption, Recommendation,
+)
+from .purge import delete_where
+
+DEFAULT_ARCHIVE_AFTER_DAYS = 365
+ARCHIVE_BATCH_SIZE = 100  # Ofertas por lote
+
+
+def archive_cutoff(days=None):
+    days = days if days is not None else getattr(settings, 'ARCHIVE_AFTER_DAYS', DEFAULT_ARCHIVE_AFTER_DAYS)
+    return timezone.now() - timedelta(days=days)
+
+
+def archivable_jobs(cutoff, include_pending=False):
+    """Ofertas creadas antes de ``cutoff`` y, salvo ``include_pending``, sin postulaciones pendientes."""
+    jobs = JobPosting.objects.filter(created_at__lt=cutoff)
+    if not include_pending:
+        pending = Application.objects.filter(job_posting=OuterRef('pk'), status='pending')
+        jobs = jobs.exclude(Exists(pending))
+    return jobs.order_by('created_at', 'id')
+
+
+def archived_copies(job_ids):
+    """ArchivedJobPosting y ArchivedApplication de las ofertas ``job_ids``, sin guardar."""
+    options = defaultdict(list)
+    for question_id, text in QuestionOption.objects.filter(question__job_posting_id__in=job_ids).order_by(
+        'id',
+    ).values_list('question_id', 'text'):
+        options[question_id].append(text)
+    questions, question_texts = defaultdict(list), {}
+    for question_id, job_id, text, question_type in Question.objects.filter(job_posting_id__in=job_ids).order_by(
+        'id',
+    ).values_list('id', 'job_posting_id', 'text', 'question_type'):
+        question_texts[question_id] = text
+        questions[job_id].append({
+            'id': question_id, 'text': text, 'question_type': question_type, 'options': options[question_id],
+        })
+
+    jobs = [
+        ArchivedJobPosting(
+            id=job.id, recruiter_id=job.recruiter_id, title=job.title, description=job.description,
+            salary=job.salary, min_education=job.min_education.name, created_at=job.created_at,
+            questions=questions[job.id],
+        )
+        for job in JobPosting.objects.filter(id__in=job_ids).select_related('min_education')
+    ]
+
+    answers = defaultdict(list)
+    for application_id, question_id, text in Answer.objects.filter(
+        application__job_posting_id__in=job_ids,
+    ).order_by('id').values_list('application_id', 'question_id', 'answer_text'):
+        answers[application_id].append({'question': question_texts.get(question_id, ''), 'answer': text})
+    applications = [
+        ArchivedApplication(
+            id=application.id, job_posting_id=application.job_posting_id, applicant_id=application.applicant_id,
+            applicant_username=application.applicant.username, cv=application.cv.name,
+            cv_sha256=application.cv_sha256, cv_filename=application.cv_filename, status=application.status,
+            submitted_at=application.submitted_at, answers=answers[application.id],
+        )
+        for application in Application.objects.filter(job_posting_id__in=job_ids).select_related(
+            'applicant',
+        ).only(
+            'id', 'job_posting_id', 'applicant__username', 'cv', 'cv_sha256', 'cv_filename', 'status', 'submitted_at',
+        )
+    ]
+    return jobs, applications
+
+
+def archive_batch(job_ids):
+    """Mueve las ofertas ``job_ids`` al archivo. Devuelve ``(ofertas, postulaciones)`` archivadas."""
+    jobs, applications = archived_copies(job_ids)
+    with transaction.atomic(using=router.db_for_write(ArchivedJobPosting)):
+        ArchivedJobPosting.objects.bulk_create(jobs, ignore_conflicts=True)
+        ArchivedApplication.objects.bulk_create(applications, ignore_conflicts=True)
+
+    application_ids = [application.id for application in applications]
+    question_ids = [question['id'] for job in jobs for question in job.questions]
+    with transaction.atomic():
+        delete_where(Answer, 'application_id', application_ids)
+        delete_where(Application, 'id', application_ids)
+        delete_where(QuestionOption, 'question_id', question_ids)
+        delete_where(Question, 'id', question_ids)
+        delete_where(Recommendation, 'job_posting_id', job_ids)
+        delete_where(JobPosting, 'id', job_ids)
+        # Los borrados en bloque no emiten señales: se invalida la caché a mano
+        for job_id in job_ids:
+            caching.invalidate_job(job_id)
+    return len(jobs), len(applications)
+
+
+def archive_jobs(cutoff, include_pending=False, batch_size=ARCHIVE_BATCH_SIZE, limit=None, log=None):
+    """Archiva por lotes las ofertas que cumplen la política. Devuelve ``(ofertas, postulaciones)``."""
+    log = log or (lambda message: None)
+    jobs_total = applications_total = 0
+    while limit is None or jobs_total < limit:
+        size = batch_size if limit is None else min(batch_size, limit - jobs_total)
+        job_ids = list(archivable_jobs(cutoff, include_pending).values_list('id', flat=True)[:size])
+        if not job_ids:
+            break
+        jobs, applications = archive_batch(job_ids)
+        jobs_total += jobs
+        applications_total += applications
+        log(f'{jobs_total} ofertas y {applications_total} postulaciones archivadas')
+    return jobs_total, applications_total
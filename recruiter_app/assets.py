@@ -0,0 +1,200 @@
+# recruiter_app/assets.py
+"""
+Archivos estáticos servidos por la propia aplicación.
+
+Los estilos y scripts propios están en recruiter_app/static/recruiter_app/
+(css/portal.css y un solo archivo con los scripts de las páginas,
+js/portal.js). Bootstrap también se sirve desde aquí, en
+recruiter_app/static/recruiter_app/vendor/bootstrap/ (guardado en el
+repositorio): ``manage.py vendor_static_assets`` lo vuelve a descargar y
+comprueba su integridad SRI al cambiar de versión.
+
+``manage.py collectstatic`` copia todo a ``STATIC_ROOT`` con
+``PrecompressedManifestStaticFilesStorage``: cada archivo recibe un nombre con
+el hash de su contenido (``portal.3f2a9c1b7d4e.js``) y, si vale la pena, sus
+variantes ``.br`` (si el paquete opcional ``brotli`` está instalado) y
+``.gz``. StaticAssetMiddleware (recruiter_app/middleware.py) sirve esos
+archivos antes de sesiones y autenticación, elige la variante según
+Accept-Encoding y marca los nombres con hash como inmutables durante un año:
+una visita repetida no vuelve a pedirlos. Los nombres sin hash se revalidan
+con ETag (respuesta 304 sin cuerpo).
+"""
+import gzip
+import mimetypes
+import os
+from urllib.parse import unquote
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers, quote_etag
+from django.utils.http import http_date
+
+try:
+    import brotli
+except ImportError:  # Dependencia opcional: sin ella solo se generan variantes .gz
+    brotli = None
+
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.svg', '.txt', '.json', '.html', '.xml', '.map')
+COMPRESS_MIN_SIZE = 1024  # bytes; por debajo la cabecera del formato come la ganancia
+COMPRESS_MIN_RATIO = 0.95  # Se descarta la variante si no ahorra al menos un 5%
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+DEFAULT_STATIC_MAX_AGE = 60
+
+# Estilos: Bootswatch 5.3.8, tema Litera (Bootstrap 5.3.8, https://bootswatch.com/litera/).
+# Scripts: Bootstrap 5.3.3 (https://getbootstrap.com/docs/5.3/getting-started/download/).
+# (URL, ruta dentro de recruiter_app/static, integridad SRI)
+VENDOR_ASSETS = (
+    (
+        'https://cdn.jsdelivr.net/npm/bootswatch@5.3.8/dist/litera/bootstrap.min.css',
+        'recruiter_app/vendor/bootstrap/bootstrap.min.css',
+        'sha384-g6vhFEtzOi0DDt7vbQKSu/YNZmo3NJPwXhjhyao/avcyLwyY4C+t630BOB6eoBpF',
+    ),
+    (
+        'https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js',
+        'recruiter_app/vendor/bootstrap/bootstrap.bundle.min.js',
+        'sha384-YvpcrYf0tY3lHB60NNkmXc5s9fDVZLESaAA55NDzOxhy9GkcIdslK1eN7N6jIeHz',
+    ),
+)
+
+
+def gzip_compress(data):
+    # mtime=0: el mismo archivo produce siempre los mismos bytes
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_compress(data):
+    return brotli.compress(data, quality=11)
+
+
+def encodings():
+    """``(codificación, extensión, compresor)`` en orden de preferencia."""
+    available = [('gzip', '.gz', gzip_compress)]
+    if brotli is not None:
+        available.insert(0, ('br', '.br', brotli_compress))
+    return available
+
+
+class PrecompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    ManifestStaticFilesStorage que además escribe las variantes comprimidas
+    de cada archivo con hash. Sin manifiesto (``collectstatic`` aún no se
+    ejecutó, p. ej. en desarrollo o en los tests) ``{% static %}`` devuelve
+    los nombres sin hash en lugar de fallar.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.immutable_names = set(self.hashed_files.values())
+
+    def stored_name(self, name):
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    def save_manifest(self):
+        super().save_manifest()
+        self.immutable_names = set(self.hashed_files.values())
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if not dry_run:
+            for name in sorted(set(self.hashed_files.values())):
+                self.compress(name)
+
+    def compress(self, name):
+        """Escribe ``<name>.br``/``<name>.gz`` junto al archivo. Devuelve las codificaciones escritas."""
+        if not name.endswith(COMPRESSIBLE_EXTENSIONS):
+            return []
+        path = self.path(name)
+        with open(path, 'rb') as file:
+            data = file.read()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return []
+        written = []
+        for encoding, extension, compress in encodings():
+            compressed = compress(data)
+            if len(compressed) < len(data) * COMPRESS_MIN_RATIO:
+                with open(path + extension, 'wb') as file:
+                    file.write(compressed)
+                written.append(encoding)
+        return written
+
+
+def accepted_encodings(header):
+    """Codificaciones de Accept-Encoding sin ``q=0``."""
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.partition(';')
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def static_path(request):
+    """Ruta en ``STATIC_ROOT`` del archivo pedido, o None si la petición no es de un estático recopilado."""
+    if request.method not in ('GET', 'HEAD') or not settings.STATIC_ROOT:
+        return None
+    prefix = settings.STATIC_URL
+    if not prefix or not request.path.startswith(prefix):
+        return None
+    try:
+        path = safe_join(settings.STATIC_ROOT, unquote(request.path[len(prefix):]))
+    except (SuspiciousFileOperation, ValueError):
+        return None
+    return path if os.path.isfile(path) else None
+
+
+def is_immutable(name):
+    return name in getattr(staticfiles_storage, 'immutable_names', ())
+
+
+def serve_static(request):
+    """
+    Respuesta para un archivo de ``STATIC_ROOT``, o None si la petición no es
+    de un estático recopilado (la atiende el resto de la aplicación).
+    """
+    path = static_path(request)
+    if path is None:
+        return None
+    name = os.path.relpath(path, settings.STATIC_ROOT).replace(os.sep, '/')
+
+    variants = [
+        (encoding, path + extension) for encoding, extension, _ in encodings() if os.path.isfile(path + extension)
+    ]
+    accepted = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    encoding, served = next(((encoding, variant) for encoding, variant in variants if encoding in accepted), (None, path))
+
+    stat = os.stat(path)
+    etag = quote_etag(f'{stat.st_size:x}-{int(stat.st_mtime):x}' + (f'-{encoding}' if encoding else ''))
+    headers = HttpResponse()
+    headers['ETag'] = etag
+    headers['Last-Modified'] = http_date(stat.st_mtime)
+    if is_immutable(name):
+        patch_cache_control(headers, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(headers, public=True, max_age=getattr(settings, 'STATIC_MAX_AGE', DEFAULT_STATIC_MAX_AGE))
+    if variants:
+        patch_vary_headers(headers, ('Accept-Encoding',))
+
+    conditional = get_conditional_response(request, etag=etag, last_modified=stat.st_mtime, response=headers)
+    if conditional is not headers:
+        return conditional  # 304 Not Modified
+
+    # El tipo es el del archivo original aunque se envíe la variante comprimida
+    content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    response = FileResponse(open(served, 'rb'), content_type=content_type)
+    if encoding:
+        response['Content-Encoding'] = encoding
+    for header in ('ETag', 'Last-Modified', 'Cache-Control', 'Vary'):
+        if header in headers:
+            response[header] = headers[header]
+    return response
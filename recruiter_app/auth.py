@@ -0,0 +1,60 @@
+# recruiter_app/auth.py
+"""
+Backend de autenticación que guarda en caché el usuario de la sesión.
+
+AuthenticationMiddleware resuelve ``request.user`` con ``get_user()`` en cada
+petición, es decir, una consulta a ``CustomUser`` por página. Aquí la fila se
+guarda en la caché (``JOB_CACHE_ALIAS``) durante ``USER_CACHE_TIMEOUT``
+segundos y se invalida al guardar o borrar el usuario (ver
+recruiter_app/signals.py). Las actualizaciones en bloque (``update()``) no
+emiten señales: esas tardan como mucho ese tiempo en verse.
+"""
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.db import transaction
+
+from .caching import get_cache
+from .models import CustomUser
+
+DEFAULT_USER_CACHE_TIMEOUT = 60
+
+
+def user_cache_key(user_id):
+    return f'user:{user_id}'
+
+
+def user_cache_timeout():
+    return getattr(settings, 'USER_CACHE_TIMEOUT', DEFAULT_USER_CACHE_TIMEOUT)
+
+
+def invalidate_user(user_id):
+    """Como invalidate_job: se repite al confirmar por si otra petición leyó los datos anteriores."""
+    def delete():
+        get_cache().delete(user_cache_key(user_id))
+
+    delete()
+    transaction.on_commit(delete)
+
+
+class CachedModelBackend(ModelBackend):
+    def get_user(self, user_id):
+        cache, key = get_cache(), user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            try:
+                user = CustomUser._default_manager.get(pk=user_id)
+            except CustomUser.DoesNotExist:
+                return None
+            cache.set(key, user, user_cache_timeout())
+        return user if self.user_can_authenticate(user) else None
+
+    async def aget_user(self, user_id):
+        cache, key = get_cache(), user_cache_key(user_id)
+        user = await cache.aget(key)
+        if user is None:
+            try:
+                user = await CustomUser._default_manager.aget(pk=user_id)
+            except CustomUser.DoesNotExist:
+                return None
+            await cache.aset(key, user, user_cache_timeout())
+        return user if self.user_can_authenticate(user) else None
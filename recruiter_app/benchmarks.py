@@ -0,0 +1,276 @@
+# recruiter_app/benchmarks.py
+"""
+Mide cada vista de recruiter_app/urls.py con el cliente de pruebas de Django
+sobre los datos existentes (normalmente los de ``generate_synthetic_data``).
+
+Cada URL con nombre tiene uno o más escenarios en ``SCENARIOS`` (método, rol
+del usuario y datos). Cada petición corre dentro de una transacción que se
+revierte, así que las vistas que escriben se pueden repetir y la base queda
+igual. El reporte es JSON con claves ordenadas para poder compararlo entre
+commits (``benchmark_views --compare``).
+"""
+import platform
+import subprocess
+import time
+from dataclasses import dataclass, field
+
+import django
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connections, transaction
+from django.test import Client
+from django.urls import URLPattern, reverse
+
+from .archive import archive_batch
+from . import perf, urls
+from .loadtest import SAMPLE_PDF, summarize
+from .management.commands.benchmark_job_writes import question_payload
+from .models import Application, CustomUser, JobPosting
+
+
+class Rollback(Exception):
+    """Deshace la transacción de una petición medida."""
+
+
+@dataclass
+class Fixtures:
+    """Objetos del conjunto de datos usados como argumentos de las vistas."""
+
+    company: CustomUser
+    student: CustomUser
+    staff: CustomUser
+    job: JobPosting
+    open_job: JobPosting  # Oferta a la que el estudiante todavía no postuló
+    application: Application
+    application_ids: list = field(default_factory=list)
+
+
+@dataclass
+class Scenario:
+    label: str
+    role: str = None  # 'company', 'student', 'staff' o None (anónimo)
+    method: str = 'get'
+    args: callable = lambda f: []
+    data: callable = lambda f: {}
+
+
+def job_form_data(fixtures):
+    base = {'title': 'Benchmark', 'description': 'Oferta de prueba', 'salary': '1500', 'min_education': 'Técnica'}
+    return {**base, **question_payload(3, 4)}
+
+
+def edit_form_data(fixtures):
+    existing = list(fixtures.job.questions.order_by('id').values_list('id', flat=True))
+    base = {'title': fixtures.job.title, 'description': 'Oferta editada', 'salary': '1600', 'min_education': 'Técnica'}
+    return {**base, **question_payload(len(existing), 4, existing=existing)}
+
+
+def apply_form_data(fixtures):
+    data = {'cv': SimpleUploadedFile('cv.pdf', SAMPLE_PDF, content_type='application/pdf')}
+    for question in fixtures.open_job.questions.prefetch_related('options'):
+        options = list(question.options.all())
+        data[f'answer_text_{question.id}'] = options[0].text if options else 'Respuesta de prueba'
+    return data
+
+
+def import_form_data(fixtures):
+    rows = ['title,description,salary,min_education,question_1,question_1_options']
+    rows += [f'Importada {index},Oferta importada,1500,Técnica,¿Turno?,Mañana||Tarde' for index in range(100)]
+    return {'file': SimpleUploadedFile('ofertas.csv', '\n'.join(rows).encode(), content_type='text/csv')}
+
+
+def archive_fixture_job(fixtures):
+    """Archiva la oferta de prueba (se revierte con el resto de la iteración); conserva los ids."""
+    archive_batch([fixtures.job.id])
+    return {}
+
+
+def job_args(fixtures):
+    return [fixtures.job.id]
+
+
+def application_args(fixtures):
+    return [fixtures.application.id]
+
+
+SCENARIOS = {
+    'home': [Scenario('home')],
+    'register_student': [Scenario('register_student')],
+    'register_company': [Scenario('register_company')],
+    'dashboard': [Scenario('dashboard', 'company')],
+    'create_job_posting': [
+        Scenario('create_job_posting', 'company'),
+        Scenario('create_job_posting:post', 'company', 'post', data=job_form_data),
+    ],
+    'list_jobs': [Scenario('list_jobs', 'company')],
+    'import_job_postings': [
+        Scenario('import_job_postings', 'company'),
+        Scenario('import_job_postings:post', 'company', 'post', data=import_form_data),
+    ],
+    'view_applications': [Scenario('view_applications', 'company', args=job_args)],
+    'edit_job_posting': [
+        Scenario('edit_job_posting', 'company', args=job_args),
+        Scenario('edit_job_posting:post', 'company', 'post', job_args, edit_form_data),
+    ],
+    'delete_job_posting': [Scenario('delete_job_posting:post', 'company', 'post', job_args)],
+    'received_applications': [
+        Scenario('received_applications', 'company'),
+        Scenario('received_applications:q', 'company', data=lambda f: {'q': 'python'}),
+    ],
+    'bulk_update_application_status': [Scenario(
+        'bulk_update_application_status:post', 'company', 'post',
+        data=lambda f: {'application_ids': f.application_ids, 'status': 'accepted'},
+    )],
+    'bulk_delete_applications': [Scenario(
+        'bulk_delete_applications:post', 'company', 'post', data=lambda f: {'application_ids': f.application_ids},
+    )],
+    'export_applications': [
+        Scenario('export_applications', 'company', args=job_args),
+        Scenario('export_applications:xlsx', 'company', args=job_args, data=lambda f: {'format': 'xlsx'}),
+        Scenario('export_applications:zip', 'company', args=job_args, data=lambda f: {'format': 'zip'}),
+    ],
+    'view_application_detail': [Scenario('view_application_detail', 'company', args=application_args)],
+    'download_cv': [Scenario('download_cv', 'company', args=application_args)],
+    'update_application_status': [Scenario(
+        'update_application_status:post', 'company', 'post', lambda f: [f.application.id, 'accepted'],
+    )],
+    'my_applications': [Scenario('my_applications', 'student')],
+    'search_jobs': [
+        Scenario('search_jobs', 'student'),
+        Scenario('search_jobs:q', 'student', data=lambda f: {'q': 'analista datos'}),
+    ],
+    'apply_to_job': [
+        Scenario('apply_to_job', 'student', args=lambda f: [f.open_job.id]),
+        Scenario('apply_to_job:post', 'student', 'post', lambda f: [f.open_job.id], apply_form_data),
+    ],
+    'archived_jobs': [Scenario('archived_jobs', 'company', data=archive_fixture_job)],
+    'view_archived_applications': [
+        Scenario('view_archived_applications', 'company', args=job_args, data=archive_fixture_job),
+    ],
+    'download_archived_cv': [
+        Scenario('download_archived_cv', 'company', args=application_args, data=archive_fixture_job),
+    ],
+    'my_archived_applications': [Scenario('my_archived_applications', 'student', data=archive_fixture_job)],
+    'delete_application': [Scenario('delete_application:post', 'company', 'post', application_args)],
+    'perf_metrics': [Scenario('perf_metrics', 'staff')],
+}
+
+
+def url_names():
+    """Nombres de las URLs propias de la app (sin las de django.contrib.auth incluidas)."""
+    return [pattern.name for pattern in urls.urlpatterns if isinstance(pattern, URLPattern) and pattern.name]
+
+
+def load_fixtures():
+    """
+    Elige los objetos de forma determinista: la oferta con más postulaciones
+    (el caso más pesado de los listados) y una postulación suya.
+    """
+    job = JobPosting.objects.filter(applications_total__gt=0).order_by('-applications_total', 'id').first()
+    if job is None:
+        raise LookupError('No hay ofertas con postulaciones; ejecuta generate_synthetic_data primero.')
+    application = job.applications.order_by('id').first()
+    student = application.applicant
+    open_job = JobPosting.objects.exclude(applications__applicant=student).order_by('-applications_total', 'id').first()
+    staff = CustomUser.objects.create_user('benchmark-staff', password=None, is_staff=True)
+    return Fixtures(
+        company=job.recruiter, student=student, staff=staff, job=job, open_job=open_job or job,
+        application=application,
+        application_ids=list(job.applications.order_by('id').values_list('id', flat=True)[:50]),
+    )
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class ViewBenchmark:
+    def __init__(self, iterations=20, warmup=2, only=None):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.only = set(only or ())
+
+    def measure(self, client, scenario, fixtures):
+        url = reverse(scenario.label.split(':')[0], args=scenario.args(fixtures))
+        request = getattr(client, scenario.method)
+        latencies, queries, statuses = [], [], set()
+        for iteration in range(self.warmup + self.iterations):
+            metrics = perf.RequestMetrics()
+            try:
+                with transaction.atomic():
+                    data = scenario.data(fixtures)
+                    with connections['default'].execute_wrapper(metrics):
+                        started = time.perf_counter()
+                        response = request(url, data)
+                        if response.streaming:
+                            # Consumir el contenido también cierra la respuesta (y el archivo)
+                            b''.join(response.streaming_content)
+                        elapsed = time.perf_counter() - started
+                    raise Rollback
+            except Rollback:
+                pass
+            if iteration >= self.warmup:
+                latencies.append(elapsed)
+                queries.append(metrics.queries)
+                statuses.add(response.status_code)
+        result = summarize(latencies, sum(latencies))
+        for volatile in ('elapsed_s', 'throughput_rps', 'errors'):
+            result.pop(volatile, None)
+        return {
+            **result,
+            'method': scenario.method.upper(),
+            'queries': max(queries),
+            'status': sorted(statuses),
+        }
+
+    def run(self):
+        report = {'views': {}, 'missing': []}
+        with transaction.atomic():
+            fixtures = load_fixtures()
+            clients = {None: Client(HTTP_HOST='localhost')}
+            for role in ('company', 'student', 'staff'):
+                clients[role] = Client(HTTP_HOST='localhost')
+                clients[role].force_login(getattr(fixtures, role))
+            for name in url_names():
+                if self.only and name not in self.only:
+                    continue
+                if name not in SCENARIOS:
+                    report['missing'].append(name)
+                    continue
+                for scenario in SCENARIOS[name]:
+                    report['views'][scenario.label] = self.measure(clients[scenario.role], scenario, fixtures)
+            transaction.set_rollback(True)
+        report['meta'] = {
+            'git': git_revision(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'iterations': self.iterations,
+            'dataset': {
+                'jobs': JobPosting.objects.count(),
+                'applications': Application.objects.count(),
+                'users': CustomUser.objects.count(),
+            },
+        }
+        return report
+
+
+def compare(baseline, current, threshold=0.2):
+    """
+    Filas ``(vista, p95 antes, p95 ahora, cambio, consultas antes, consultas ahora, regresión)``
+    para las vistas del reporte actual. Es regresión si el p95 sube más de
+    ``threshold`` o si aumentan las consultas.
+    """
+    rows = []
+    for label, after in sorted(current['views'].items()):
+        before = baseline['views'].get(label)
+        if before is None:
+            rows.append((label, None, after['p95_ms'], None, None, after['queries'], False))
+            continue
+        change = (after['p95_ms'] - before['p95_ms']) / before['p95_ms'] if before['p95_ms'] else 0
+        regression = change > threshold or after['queries'] > before['queries']
+        rows.append((label, before['p95_ms'], after['p95_ms'], change, before['queries'], after['queries'], regression))
+    return rows
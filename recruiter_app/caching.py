@@ -0,0 +1,140 @@
+# recruiter_app/caching.py
+"""
+Caché de las lecturas frecuentes del portal con claves versionadas.
+
+Cada clave incluye la versión de su espacio de nombres (``jobs`` para los
+resultados de búsqueda y sus facetas, ``job:<id>`` para el detalle de una
+oferta con sus preguntas y opciones, ``education`` para los niveles). Al modificar una oferta, una pregunta o una opción se
+incrementa la versión (ver recruiter_app/signals.py) y las entradas antiguas
+dejan de leerse; no hace falta borrarlas, caducan solas.
+
+Los valores se calculan siempre contra la primaria (``routers.primary_reads``):
+después de invalidar, una réplica atrasada podría volver a guardar los datos
+anteriores y servírselos a todos, incluido quien hizo el cambio.
+
+El backend es el alias ``JOB_CACHE_ALIAS`` de ``CACHES``. LocMemCache es
+propia de cada proceso: con varios procesos conviene un backend compartido
+(archivo, Redis o Memcached) para que la invalidación llegue a todos.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from .routers import primary_reads
+
+DEFAULT_TIMEOUT = 300
+
+
+def get_cache():
+    return caches[getattr(settings, 'JOB_CACHE_ALIAS', 'default')]
+
+
+def cache_timeout():
+    return getattr(settings, 'JOB_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+
+
+def get_version(namespace):
+    cache, key = get_cache(), f'version:{namespace}'
+    version = cache.get(key)
+    if version is None:
+        # Valor inicial único: si la clave se expulsó de la caché no se vuelve
+        # a una versión antigua cuyas entradas podrían seguir guardadas.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace):
+    cache, key = get_cache(), f'version:{namespace}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def _versioned_key(namespace, version, parts):
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'{namespace}:{version}:{digest}'
+
+
+def make_key(namespace, *parts):
+    return _versioned_key(namespace, get_version(namespace), parts)
+
+
+def get_or_set(namespace, parts, compute):
+    """Devuelve el valor guardado para ``parts`` o lo calcula con ``compute()`` en la primaria."""
+    def compute_on_primary():
+        with primary_reads():
+            return compute()
+
+    return get_cache().get_or_set(make_key(namespace, *parts), compute_on_primary, cache_timeout())
+
+
+# Versiones asíncronas para las vistas async (ver job_portal/asgi.py). Usan la
+# API async de la caché; ``compute`` es una función async.
+
+async def aget_version(namespace):
+    cache, key = get_cache(), f'version:{namespace}'
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+async def aget_or_set(namespace, parts, compute, cache_none=True):
+    cache = get_cache()
+    key = _versioned_key(namespace, await aget_version(namespace), parts)
+    missing = object()
+    value = await cache.aget(key, missing)
+    if value is missing:
+        # Como BaseCache.get_or_set: si otra petición lo guardó antes, gana la suya.
+        with primary_reads():
+            value = await compute()
+        if value is None and not cache_none:
+            return value
+        await cache.aadd(key, value, cache_timeout())
+        value = await cache.aget(key, value)
+    return value
+
+
+def invalidate_job(job_id):
+    """
+    Invalida los resultados de búsqueda y el detalle de la oferta ``job_id``.
+    Se repite al confirmar la transacción: una petición concurrente podría
+    haber guardado en caché los datos anteriores antes del commit.
+    """
+    def bump():
+        bump_version('jobs')
+        bump_version(f'job:{job_id}')
+
+    bump()
+    transaction.on_commit(bump)
+
+
+async def asearch_page(query, filters, cursor, page_size, compute):
+    """Página de resultados de search_jobs (KeysetPage); ``filters`` es la firma de JobFilters."""
+    return await aget_or_set('jobs', ('search', query or '', filters, cursor or '', page_size), compute)
+
+
+async def afacet_counts(query, filters, compute):
+    """Conteos de las facetas de search_jobs para una búsqueda y sus filtros."""
+    return await aget_or_set('jobs', ('facets', query or '', filters), compute)
+
+
+async def aeducation_levels(compute):
+    """Lista de niveles educativos; cambia muy poco (se invalida con sus señales)."""
+    return await aget_or_set('education', ('levels',), compute)
+
+
+async def ajob_detail(job_id, compute):
+    """
+    Oferta con sus preguntas y opciones, tal como las usa apply_to_job. Una
+    oferta inexistente (None) no se guarda: las altas en bloque (importación,
+    datos sintéticos) no invalidan ``job:<id>`` y el id daría 404 hasta que
+    caducara la entrada.
+    """
+    return await aget_or_set(f'job:{job_id}', ('detail',), compute, cache_none=False)
@@ -0,0 +1,28 @@
+# recruiter_app/checks.py
+"""Comprobaciones de configuración (``manage.py check``)."""
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, register
+from django.utils.module_loading import import_string
+
+CACHED_SESSION_ENGINE = 'recruiter_app.sessions'
+
+
+@register()
+def check_session_cache(app_configs, **kwargs):
+    """
+    El motor de sesiones en caché necesita una caché compartida entre
+    procesos: con LocMemCache un logout solo borra la sesión en el proceso que
+    lo atiende y los demás la siguen sirviendo.
+    """
+    if settings.SESSION_ENGINE != CACHED_SESSION_ENGINE:
+        return []
+    alias = settings.SESSION_CACHE_ALIAS
+    backend = settings.CACHES.get(alias, {}).get('BACKEND', '')
+    if not issubclass(import_string(backend), LocMemCache):
+        return []
+    return [Error(
+        f"SESSION_ENGINE '{CACHED_SESSION_ENGINE}' no puede usar la caché '{alias}' ({backend}): es propia de cada proceso.",
+        hint="Configure una caché compartida (archivo, Redis o Memcached) o use 'django.contrib.sessions.backends.db'.",
+        id='recruiter_app.E001',
+    )]
@@ -0,0 +1,81 @@
+# recruiter_app/counters.py
+"""
+Contadores de postulaciones guardados en ``JobPosting`` (total y por estado).
+
+Los servicios de recruiter_app/services.py los ajustan con expresiones F()
+dentro de la misma transacción que crea, cambia de estado o elimina las
+postulaciones, así que no hay lecturas previas ni carreras entre peticiones.
+Los cambios hechos por fuera de los servicios (p. ej. el admin o borrados en
+cascada de usuarios) se corrigen con ``manage.py reconcile_application_counters``.
+"""
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F, Q
+
+from .models import JobPosting
+
+TOTAL_FIELD = 'applications_total'
+STATUS_FIELDS = {
+    'pending': 'applications_pending',
+    'accepted': 'applications_accepted',
+    'rejected': 'applications_rejected',
+}
+COUNTER_FIELDS = JobPosting.COUNTER_FIELDS
+
+
+def apply_deltas(deltas):
+    """
+    Aplica ``{job_id: Counter(campo=delta)}``. Las ofertas con los mismos
+    deltas se actualizan juntas en un solo UPDATE.
+    """
+    jobs_by_change = defaultdict(list)
+    for job_id, delta in deltas.items():
+        change = tuple(sorted((field, value) for field, value in delta.items() if value))
+        if change:
+            jobs_by_change[change].append(job_id)
+    for change, job_ids in jobs_by_change.items():
+        JobPosting.objects.filter(id__in=job_ids).update(**{field: F(field) + value for field, value in change})
+
+
+def record_created(job_id, status='pending'):
+    apply_deltas({job_id: Counter({TOTAL_FIELD: 1, STATUS_FIELDS[status]: 1})})
+
+
+def record_status_changes(rows, new_status):
+    """``rows`` son pares ``(job_id, estado_anterior)`` de las postulaciones que cambian."""
+    deltas = defaultdict(Counter)
+    for job_id, old_status in rows:
+        if old_status != new_status:
+            deltas[job_id][STATUS_FIELDS[old_status]] -= 1
+            deltas[job_id][STATUS_FIELDS[new_status]] += 1
+    apply_deltas(deltas)
+
+
+def record_deleted(queryset):
+    """Descuenta las postulaciones de ``queryset``; se llama antes de eliminarlas."""
+    deltas = defaultdict(Counter)
+    grouped = queryset.order_by().values('job_posting_id', 'status').annotate(n=Count('id'))
+    for row in grouped:
+        deltas[row['job_posting_id']][TOTAL_FIELD] -= row['n']
+        deltas[row['job_posting_id']][STATUS_FIELDS[row['status']]] -= row['n']
+    apply_deltas(deltas)
+
+
+def actual_counts():
+    """Anotaciones con los valores reales de cada contador, calculados con COUNT."""
+    return {
+        f'actual_{TOTAL_FIELD}': Count('applications'),
+        **{
+            f'actual_{field}': Count('applications', filter=Q(applications__status=status))
+            for status, field in STATUS_FIELDS.items()
+        },
+    }
+
+
+def find_drift(queryset=None):
+    """Ofertas cuyos contadores no coinciden con las postulaciones reales."""
+    queryset = (queryset if queryset is not None else JobPosting.objects.all()).only('id', *COUNTER_FIELDS)
+    drifted = queryset.annotate(**actual_counts()).exclude(
+        **{field: F(f'actual_{field}') for field in COUNTER_FIELDS}
+    )
+    return drifted.order_by('id')
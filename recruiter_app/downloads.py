@@ -0,0 +1,130 @@
+# recruiter_app/downloads.py
+"""
+Entrega de archivos protegidos (CVs) después de comprobar permisos.
+
+Si ``CV_SENDFILE_BACKEND`` está configurado, Django solo responde las
+cabeceras y el servidor web envía los bytes (``X-Sendfile`` para Apache/
+lighttpd, ``X-Accel-Redirect`` para nginx). Si no, se usa ``FileResponse``
+(que aprovecha ``wsgi.file_wrapper``/sendfile) con soporte de ETag,
+If-None-Match y peticiones Range.
+"""
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
+from django.utils.http import http_date, parse_etags
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_AGE = 3600
+
+
+def parse_range(header, size):
+    """
+    Interpreta una cabecera Range de un solo rango. Devuelve ``(inicio, fin)``
+    inclusivos, ``None`` si no aplica (se envía el archivo completo) o
+    ``False`` si el rango no se puede satisfacer.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None  # Rangos múltiples o unidades desconocidas: respuesta completa
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        length = int(end)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def iter_range(file, start, length):
+    """Lee ``length`` bytes desde ``start`` por bloques y cierra el archivo al terminar."""
+    try:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(STREAM_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def sendfile_response(storage, name):
+    """Respuesta vacía que delega el envío al servidor web, o None si no está configurado."""
+    backend = getattr(settings, 'CV_SENDFILE_BACKEND', None)
+    if backend == 'x-sendfile':
+        response = HttpResponse()
+        response['X-Sendfile'] = storage.path(name)
+    elif backend == 'x-accel-redirect':
+        prefix = getattr(settings, 'CV_ACCEL_REDIRECT_PREFIX', '/protected-media/')
+        response = HttpResponse()
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(name)
+    else:
+        return None
+    return response
+
+
+def serve_file(request, storage, name, filename, etag=None, content_type='application/pdf'):
+    """
+    Responde con el archivo ``name`` de ``storage``. ``etag`` debe identificar el
+    contenido (p. ej. su SHA-256); si no se indica se deriva de tamaño y fecha.
+    """
+    size = storage.size(name)
+    modified = storage.get_modified_time(name).timestamp()
+    etag = quote_etag(etag or f'{size:x}-{int(modified):x}')
+
+    headers = HttpResponse()
+    headers['ETag'] = etag
+    headers['Last-Modified'] = http_date(modified)
+    headers['Accept-Ranges'] = 'bytes'
+    patch_cache_control(headers, private=True, max_age=getattr(settings, 'CV_CACHE_MAX_AGE', DEFAULT_MAX_AGE))
+
+    conditional = get_conditional_response(request, etag=etag, last_modified=modified, response=headers)
+    if conditional is not headers:
+        return conditional  # 304 Not Modified o 412 Precondition Failed
+
+    response = sendfile_response(storage, name)
+    if response is None:
+        response = _file_response(request, storage, name, size, etag)
+        if response.status_code == 416:
+            return response
+
+    response['Content-Type'] = content_type
+    for header in ('ETag', 'Last-Modified', 'Accept-Ranges', 'Cache-Control'):
+        response[header] = headers[header]
+    response['Content-Disposition'] = f"inline; filename*=UTF-8''{quote(filename)}"
+    return response
+
+
+def _file_response(request, storage, name, size, etag):
+    range_header = request.META.get('HTTP_RANGE')
+    if_range = request.META.get('HTTP_IF_RANGE')
+    # If-Range: solo se atiende el rango si el cliente tiene la misma versión.
+    if range_header and if_range and etag not in parse_etags(if_range):
+        range_header = None
+    byte_range = parse_range(range_header, size) if range_header and request.method == 'GET' else None
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+    if byte_range is None:
+        return FileResponse(storage.open(name), filename=os.path.basename(name))
+
+    start, end = byte_range
+    length = end - start + 1
+    response = StreamingHttpResponse(iter_range(storage.open(name), start, length), status=206)
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    response['Content-Length'] = str(length)
+    return response
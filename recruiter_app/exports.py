@@ -0,0 +1,242 @@
+# recruiter_app/exports.py
+"""
+Exportación de las postulaciones de una oferta: una fila por postulación y una
+columna por pregunta con el texto de la respuesta.
+
+Todo se genera mientras se envía la respuesta: las postulaciones se leen con
+``iterator(chunk_size=...)`` (las respuestas de cada bloque en una consulta
+más) y cada formato produce bytes por partes, así que la memoria no depende
+del número de postulantes. El XLSX y el ZIP se escriben con ``zipfile`` sobre
+un búfer que se vacía en cada parte, sin archivo temporal en disco; el XLSX
+usa cadenas en línea para no acumular la tabla de cadenas compartidas.
+"""
+import csv
+import os
+import re
+import zipfile
+from itertools import chain
+from xml.sax.saxutils import escape
+
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from .downloads import STREAM_CHUNK_SIZE
+from .models import Answer
+
+EXPORT_CHUNK_SIZE = 2000
+FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+    'zip': ('application/zip', 'zip'),
+}
+BASE_COLUMNS = ('ID', 'Usuario', 'Email', 'Estado', 'Fecha de postulación', 'CV')
+# Excel interpreta como fórmula un texto que empieza con estos caracteres
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+# Caracteres de control que XML 1.0 no admite
+XML_INVALID_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def header(questions):
+    return [*BASE_COLUMNS, *(question.text for question in questions)]
+
+
+def iter_rows(job, questions, chunk_size=EXPORT_CHUNK_SIZE):
+    """Filas de valores (sin la cabecera) en el orden de ``header(questions)``."""
+    applications = (
+        job.applications.select_related('applicant')
+        .only('id', 'job_posting', 'status', 'submitted_at', 'cv_filename', 'applicant__username', 'applicant__email')
+        .prefetch_related(Prefetch('answers', queryset=Answer.objects.only('application_id', 'question_id', 'answer_text')))
+        .order_by('id')
+    )
+    statuses = dict(applications.model._meta.get_field('status').choices)
+    for application in applications.iterator(chunk_size=chunk_size):
+        answers = {answer.question_id: answer.answer_text for answer in application.answers.all()}
+        yield [
+            application.id,
+            application.applicant.username,
+            application.applicant.email,
+            statuses.get(application.status, application.status),
+            timezone.localtime(application.submitted_at).strftime('%Y-%m-%d %H:%M'),
+            application.cv_filename,
+            *(answers.get(question.id, '') for question in questions),
+        ]
+
+
+class Echo:
+    """Pseudo archivo para ``csv.writer``: devuelve lo escrito en lugar de guardarlo."""
+
+    def write(self, value):
+        return value
+
+
+def csv_cell(value):
+    """Neutraliza las respuestas que Excel ejecutaría como fórmula."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(job, questions):
+    writer = csv.writer(Echo())
+    # BOM para que Excel detecte UTF-8
+    yield '\ufeff' + writer.writerow([csv_cell(value) for value in header(questions)])
+    for row in iter_rows(job, questions):
+        yield writer.writerow([csv_cell(value) for value in row])
+
+
+class ZipBuffer:
+    """Destino de escritura para ``zipfile`` que se vacía en cada parte enviada."""
+
+    def __init__(self):
+        self.chunks = []
+        self.size = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks, self.size = [], 0
+        return data
+
+
+def stream_zip(entries):
+    """
+    ZIP generado por partes a partir de ``(nombre, compresión, partes)``. Como
+    el búfer no admite seek, zipfile escribe los tamaños después de cada
+    archivo (data descriptor) y nada se guarda en disco.
+    """
+    buffer = ZipBuffer()
+    now = timezone.localtime().timetuple()[:6]
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name, compression, chunks in entries:
+            info = zipfile.ZipInfo(name, date_time=now)
+            info.compress_type = compression
+            with archive.open(info, 'w') as entry:
+                for chunk in chunks:
+                    entry.write(chunk)
+                    if buffer.size >= STREAM_CHUNK_SIZE:
+                        yield buffer.drain()
+            yield buffer.drain()
+    yield buffer.drain()
+
+
+def column_letter(index):
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def xlsx_row(number, values):
+    cells = []
+    for index, value in enumerate(values):
+        ref = f'{column_letter(index)}{number}'
+        if isinstance(value, int):
+            cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+        elif value:
+            text = escape(XML_INVALID_RE.sub('', str(value)))
+            cells.append(f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+
+def sheet_chunks(job, questions):
+    yield (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+    ).encode()
+    yield xlsx_row(1, header(questions)).encode()
+    rows = []
+    for number, row in enumerate(iter_rows(job, questions), start=2):
+        rows.append(xlsx_row(number, row))
+        if len(rows) >= 500:
+            yield ''.join(rows).encode()
+            rows = []
+    yield (''.join(rows) + '</sheetData></worksheet>').encode()
+
+
+XLSX_PARTS = (
+    ('[Content_Types].xml', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    )),
+    ('_rels/.rels', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/></Relationships>'
+    )),
+    ('xl/workbook.xml', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Postulaciones" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    )),
+    ('xl/_rels/workbook.xml.rels', (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/></Relationships>'
+    )),
+)
+
+
+def stream_xlsx(job, questions):
+    entries = [(name, zipfile.ZIP_DEFLATED, [content.encode()]) for name, content in XLSX_PARTS]
+    entries.append(('xl/worksheets/sheet1.xml', zipfile.ZIP_DEFLATED, sheet_chunks(job, questions)))
+    return stream_zip(entries)
+
+
+def iter_file(storage, name):
+    with storage.open(name) as file:
+        while chunk := file.read(STREAM_CHUNK_SIZE):
+            yield chunk
+
+
+def cv_entries(job, chunk_size=EXPORT_CHUNK_SIZE):
+    """Un archivo ``cvs/<id>-<usuario>-<nombre>`` por postulación cuyo CV existe."""
+    applications = (
+        job.applications.select_related('applicant')
+        .only('id', 'job_posting', 'cv', 'cv_filename', 'applicant__username').order_by('id')
+    )
+    for application in applications.iterator(chunk_size=chunk_size):
+        storage, name = application.cv.storage, application.cv.name
+        if not name or not storage.exists(name):
+            continue
+        filename = os.path.basename(application.cv_filename or name)
+        # Los PDF ya vienen comprimidos: se guardan sin volver a comprimir
+        yield (
+            f'cvs/{application.id}-{application.applicant.username}-{filename}',
+            zipfile.ZIP_STORED, iter_file(storage, name),
+        )
+
+
+def stream_bundle(job, questions):
+    """ZIP con ``postulaciones.csv`` y los CVs."""
+    csv_chunks = (text.encode() for text in stream_csv(job, questions))
+    entries = [('postulaciones.csv', zipfile.ZIP_DEFLATED, csv_chunks)]
+    return stream_zip(chain(entries, cv_entries(job)))
+
+
+def stream_export(job, questions, export_format):
+    if export_format == 'xlsx':
+        return stream_xlsx(job, questions)
+    if export_format == 'zip':
+        return stream_bundle(job, questions)
+    return stream_csv(job, questions)
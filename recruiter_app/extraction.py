@@ -0,0 +1,133 @@
+# recruiter_app/extraction.py
+"""
+Extracción del texto de los CVs en PDF para el índice de candidatos.
+
+Si ``pypdf`` está instalado se usa ese paquete. Si no, un extractor mínimo
+con la biblioteca estándar recorre los flujos de contenido (comprimidos con
+FlateDecode o sin comprimir) y recoge las cadenas de los operadores de texto
+(Tj, TJ, ' y "). Alcanza para los PDFs que generan los procesadores de texto;
+los escaneados (solo imágenes) quedan sin texto.
+"""
+import logging
+import re
+import zlib
+
+try:
+    import pypdf
+except ImportError:  # Dependencia opcional
+    pypdf = None
+
+logger = logging.getLogger(__name__)
+
+# Límite del texto guardado por CV; el resto no aporta a la búsqueda.
+MAX_TEXT_LENGTH = 100_000
+
+STREAM_RE = re.compile(rb'stream\r?\n(.*?)\r?\n?endstream', re.DOTALL)
+OPERATOR_RE = re.compile(rb"[A-Za-z'\"*]+")
+NAME_RE = re.compile(rb'/[^\s/\[\]()<>{}%]*')
+NUMBER_RE = re.compile(rb'[+-]?(?:\d+\.?\d*|\.\d+)')
+WHITESPACE_RE = re.compile(r'\s+')
+ESCAPES = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f'}
+SHOW_OPERATORS = {b'Tj', b'TJ', b"'", b'"'}
+# Operadores que mueven el cursor a otra línea o bloque: separan palabras.
+BREAK_OPERATORS = {b'Td', b'TD', b'T*', b'Tm', b'ET', b"'", b'"'}
+# Un desplazamiento en un arreglo TJ mayor a este valor equivale a un espacio.
+WORD_GAP = 200
+
+
+def extract_pdf_text(file):
+    """Devuelve el texto del PDF abierto ``file`` normalizado a una sola línea."""
+    try:
+        if pypdf is not None:
+            reader = pypdf.PdfReader(file)
+            text = ' '.join(page.extract_text() or '' for page in reader.pages)
+        else:
+            text = extract_text_fallback(file.read())
+    except Exception:
+        # Un PDF dañado no debe reintentarse indefinidamente: se indexa vacío.
+        logger.warning('No se pudo extraer el texto del CV %s', getattr(file, 'name', ''), exc_info=True)
+        return ''
+    return WHITESPACE_RE.sub(' ', text).strip()[:MAX_TEXT_LENGTH]
+
+
+def extract_text_fallback(data):
+    parts = []
+    for match in STREAM_RE.finditer(data):
+        content = match.group(1)
+        try:
+            content = zlib.decompress(content)
+        except zlib.error:
+            pass  # Flujo sin comprimir (o con otro filtro, que se ignora)
+        if b'BT' in content:
+            parts.append(content_text(content))
+    return ' '.join(parts)
+
+
+def content_text(content):
+    """Texto mostrado por un flujo de contenido de página."""
+    parts, pending = [], []
+    i, size = 0, len(content)
+    while i < size:
+        char = content[i:i + 1]
+        if char == b'(':
+            literal, i = read_literal(content, i)
+            pending.append(decode_literal(literal))
+        elif char == b'%':
+            end = content.find(b'\n', i)
+            i = size if end < 0 else end
+        elif char == b'/':
+            i = NAME_RE.match(content, i).end()  # Nombres (/F1): no son operadores
+        elif char.isalpha() or char in (b"'", b'"'):
+            operator = OPERATOR_RE.match(content, i).group()
+            i += len(operator)
+            if operator in SHOW_OPERATORS:
+                parts.append(''.join(pending))
+            if operator in BREAK_OPERATORS:
+                parts.append(' ')
+            pending = []
+        else:
+            number = NUMBER_RE.match(content, i)
+            if number:
+                if float(number.group()) < -WORD_GAP:
+                    pending.append(' ')
+                i = number.end()
+            else:
+                i += 1
+    return ''.join(parts)
+
+
+def read_literal(content, start):
+    """Lee una cadena literal ``(...)`` con paréntesis anidados; devuelve (bytes, fin)."""
+    depth, i, out = 0, start, bytearray()
+    while i < len(content):
+        char = content[i:i + 1]
+        if char == b'\\':
+            escaped = content[i + 1:i + 2]
+            octal = re.match(rb'[0-7]{1,3}', content[i + 1:i + 4])
+            if octal:
+                out.append(int(octal.group(), 8) & 0xFF)
+                i += 1 + len(octal.group())
+                continue
+            if escaped not in (b'\n', b'\r'):
+                out += ESCAPES.get(escaped, escaped)
+            i += 2
+            continue
+        if char == b'(':
+            depth += 1
+            if depth > 1:
+                out += char
+        elif char == b')':
+            depth -= 1
+            if depth == 0:
+                return bytes(out), i + 1
+            out += char
+        else:
+            out += char
+        i += 1
+    return bytes(out), i
+
+
+def decode_literal(raw):
+    if raw.startswith(b'\xfe\xff'):
+        return raw[2:].decode('utf-16-be', errors='ignore')
+    return raw.decode('latin-1')
@@ -0,0 +1,126 @@
+# recruiter_app/facets.py
+"""
+Filtros de search_jobs (rango de salario, nivel educativo y antigüedad) con
+el número de ofertas de cada opción.
+
+Los conteos de todas las opciones salen de una sola consulta de agregación:
+cada opción es un ``COUNT(...) FILTER (WHERE ...)`` sobre las ofertas que
+coinciden con el texto buscado. Al contar las opciones de un grupo se aplican
+los filtros activos de los otros grupos pero no el del propio grupo, así cada
+número indica cuántas ofertas quedarían al elegir esa opción.
+"""
+from datetime import timedelta
+
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from . import caching
+from .models import EducationLevel
+
+# (clave, etiqueta, mínimo incluido, máximo excluido)
+SALARY_RANGES = (
+    ('hasta-1500', 'Hasta S/ 1,500', None, 1500),
+    ('1500-3000', 'S/ 1,500 a 3,000', 1500, 3000),
+    ('3000-5000', 'S/ 3,000 a 5,000', 3000, 5000),
+    ('desde-5000', 'S/ 5,000 a más', 5000, None),
+)
+# (clave, etiqueta, días)
+POSTED_WITHIN = (
+    ('24h', 'Últimas 24 horas', 1),
+    ('7d', 'Última semana', 7),
+    ('30d', 'Último mes', 30),
+)
+GROUPS = ('salary', 'education', 'posted')
+
+
+def salary_q(key):
+    for range_key, _, low, high in SALARY_RANGES:
+        if range_key == key:
+            q = Q()
+            if low is not None:
+                q &= Q(salary__gte=low)
+            if high is not None:
+                q &= Q(salary__lt=high)
+            return q
+    return None
+
+
+def posted_q(key, now):
+    for posted_key, _, days in POSTED_WITHIN:
+        if posted_key == key:
+            return Q(created_at__gte=now - timedelta(days=days))
+    return None
+
+
+class JobFilters:
+    """Filtros activos leídos de ``request.GET``; los valores desconocidos se ignoran."""
+
+    def __init__(self, params, now=None):
+        # Minuto actual: las consultas y la firma de caché no cambian en cada segundo
+        self.now = (now or timezone.now()).replace(second=0, microsecond=0)
+        self.salary = params.get('salary') if salary_q(params.get('salary')) is not None else None
+        self.posted = params.get('posted') if posted_q(params.get('posted'), self.now) is not None else None
+        education = params.get('education', '')
+        self.education = int(education) if education.isdigit() else None
+
+    def group_q(self, group):
+        if group == 'salary' and self.salary:
+            return salary_q(self.salary)
+        if group == 'education' and self.education:
+            return Q(min_education_id=self.education)
+        if group == 'posted' and self.posted:
+            return posted_q(self.posted, self.now)
+        return Q()
+
+    def q(self, exclude=None):
+        """Condición de todos los filtros activos salvo el grupo ``exclude``."""
+        condition = Q()
+        for group in GROUPS:
+            if group != exclude:
+                condition &= self.group_q(group)
+        return condition
+
+    def signature(self):
+        """Identifica los filtros en las claves de caché."""
+        posted_now = self.now.isoformat() if self.posted else None
+        return (self.salary, self.education, self.posted, posted_now)
+
+    @property
+    def active(self):
+        return any((self.salary, self.education, self.posted))
+
+
+async def aeducation_levels():
+    """``[(id, nombre)]`` de los niveles educativos, desde la caché."""
+    async def load():
+        return [level async for level in EducationLevel.objects.values_list('id', 'name')]
+
+    return await caching.aeducation_levels(load)
+
+
+async def afacet_counts(queryset, filters):
+    """
+    Conteos por opción de cada grupo para ``queryset`` (ofertas ya filtradas
+    por texto, sin los filtros de facetas). Devuelve listas de
+    ``{'value', 'label', 'count', 'active'}`` por grupo.
+    """
+    levels = await aeducation_levels()
+    options = {
+        'salary': [(key, label, salary_q(key)) for key, label, _, _ in SALARY_RANGES],
+        'education': [(level_id, name, Q(min_education_id=level_id)) for level_id, name in levels],
+        'posted': [(key, label, posted_q(key, filters.now)) for key, label, _ in POSTED_WITHIN],
+    }
+    aggregates = {
+        f'{group}_{index}': Count('id', filter=condition & filters.q(exclude=group))
+        for group, choices in options.items()
+        for index, (_, _, condition) in enumerate(choices)
+    }
+    counts = await queryset.order_by().aaggregate(**aggregates)
+    active = {'salary': filters.salary, 'education': filters.education, 'posted': filters.posted}
+    return {
+        group: [
+            {'value': value, 'label': label, 'count': counts[f'{group}_{index}'], 'active': value == active[group]}
+            for index, (value, label, _) in enumerate(choices)
+        ]
+        for group, choices in options.items()
+    }
@@ -1,12 +1,24 @@
 # recruiter_app/forms.py
+import os
+
 from django import forms
 from django.contrib.auth.models import User
-from django.forms import modelformset_factory, inlineformset_factory
+from django.core.exceptions import ValidationError
+from django.forms import BaseModelFormSet, modelformset_factory, inlineformset_factory
 
 # Importa todos los modelos necesarios, incluyendo 'Answer' y 'QuestionOption'
-from .models import JobPosting, Question, Application, CustomUser, Answer, QuestionOption
+from .models import JobPosting, Question, Application, CustomUser, Answer, EducationLevel, QuestionOption
+from .search import get_search_backend
+from .storage import file_sha256
+from .uploads import PDF_SIGNATURE, max_cv_size, size_error, validate_cv_header
 
 class JobPostingForm(forms.ModelForm):
+    # El nivel se envía por nombre, igual que cuando era un campo de texto
+    min_education = forms.ModelChoiceField(
+        queryset=EducationLevel.objects.all(), to_field_name='name', label='Educación Mínima',
+        empty_label='Selecciona un nivel', widget=forms.Select(attrs={'class': 'form-control'}),
+    )
+
     class Meta:
         model = JobPosting
         fields = ['title', 'description', 'salary', 'min_education']
@@ -20,9 +32,39 @@ class JobPostingForm(forms.ModelForm):
             'title': forms.TextInput(attrs={'class': 'form-control'}),
             'description': forms.Textarea(attrs={'class': 'form-control'}),
             'salary': forms.NumberInput(attrs={'class': 'form-control'}),
-            'min_education': forms.TextInput(attrs={'class': 'form-control'}),
         }
 
+class PrebuiltFieldsMixin:
+    """
+    Formulario que usa los campos ``fields`` ya construidos en lugar de una
+    copia profunda de ``base_fields``. Crear un formulario por fila de una
+    importación ya no copia todos sus campos y widgets. Los campos se
+    comparten entre formularios: no se deben modificar.
+    """
+    def __init__(self, *args, fields, **kwargs):
+        self.base_fields = {}  # Nada que copiar en BaseForm.__init__
+        super().__init__(*args, **kwargs)
+        self.fields = fields
+
+class JobImportForm(PrebuiltFieldsMixin, JobPostingForm):
+    """JobPostingForm para una fila de import_job_postings, con los campos de job_import_fields()."""
+    def _get_validation_exclusions(self):
+        # El nivel ya se validó contra ``levels``: se evita el exists() por fila
+        # que haría ForeignKey.validate en full_clean().
+        return {*super()._get_validation_exclusions(), 'min_education'}
+
+def job_import_fields(levels):
+    """
+    Campos de JobImportForm. ``levels`` son los niveles educativos por nombre,
+    cargados una vez para todo el archivo.
+    """
+    fields = JobPostingForm().fields
+    field = fields['min_education']
+    fields['min_education'] = PreloadedObjectChoiceField(
+        levels, field.queryset, to_field_name='name', label=field.label,
+    )
+    return fields
+
 class QuestionForm(forms.ModelForm):
     class Meta:
         model = Question
@@ -36,6 +78,56 @@ class QuestionForm(forms.ModelForm):
             'question_type': forms.Select(attrs={'class': 'form-control'}),
         }
 
+class QuestionImportForm(PrebuiltFieldsMixin, QuestionForm):
+    """QuestionForm para las preguntas de una fila de import_job_postings."""
+
+class FormsetObjectChoiceField(forms.ModelChoiceField):
+    """
+    Campo ``id`` de un model formset que valida contra los objetos que el
+    formset ya cargó, en lugar de hacer una consulta por formulario.
+    """
+    def __init__(self, formset, *args, **kwargs):
+        self.formset = formset
+        super().__init__(*args, **kwargs)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            obj = self.formset._existing_object(self.formset.model._meta.pk.to_python(value))
+        except ValidationError:
+            obj = None
+        if obj is None:
+            raise ValidationError(self.error_messages['invalid_choice'], code='invalid_choice', params={'value': value})
+        return obj
+
+class PreloadedObjectChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField que valida contra ``objects`` (``{valor: objeto}`` según
+    ``to_field_name``) ya cargados, sin consultar la BD por cada formulario.
+    """
+    def __init__(self, objects, *args, **kwargs):
+        self.objects = objects
+        super().__init__(*args, **kwargs)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        obj = self.objects.get(str(value).strip())
+        if obj is None:
+            raise ValidationError(self.error_messages['invalid_choice'], code='invalid_choice', params={'value': value})
+        return obj
+
+class BaseQuestionFormSet(BaseModelFormSet):
+    def add_fields(self, form, index):
+        super().add_fields(form, index)
+        pk_name = self.model._meta.pk.name
+        field = form.fields.get(pk_name)
+        if isinstance(field, forms.ModelChoiceField):
+            form.fields[pk_name] = FormsetObjectChoiceField(
+                self, field.queryset, initial=field.initial, required=False, widget=field.widget,
+            )
+
 class ApplicationForm(forms.ModelForm):
     class Meta:
         model = Application
@@ -44,9 +136,39 @@ class ApplicationForm(forms.ModelForm):
             'cv': 'Curriculum Vitae (CV)',
         }
         widgets = {
-            'cv': forms.FileInput(attrs={'class': 'form-control'}),
+            'cv': forms.FileInput(attrs={'class': 'form-control', 'accept': '.pdf,application/pdf'}),
         }
 
+    def __init__(self, *args, upload_errors=None, **kwargs):
+        # Errores detectados por CVUploadHandler mientras se recibía el archivo
+        self.upload_errors = upload_errors or {}
+        super().__init__(*args, **kwargs)
+        if 'cv' in self.upload_errors:
+            # El archivo se descartó al subirlo: se informa el motivo en clean_cv
+            # en lugar del genérico "campo obligatorio".
+            self.fields['cv'].required = False
+
+    def clean_cv(self):
+        if 'cv' in self.upload_errors:
+            raise forms.ValidationError(self.upload_errors['cv'])
+        cv = self.cleaned_data.get('cv')
+        if cv and hasattr(cv, 'content_type'):
+            if cv.size > max_cv_size():
+                raise forms.ValidationError(size_error())
+            cv.seek(0)
+            error = validate_cv_header(cv.content_type, cv.read(len(PDF_SIGNATURE)))
+            cv.seek(0)
+            if error:
+                raise forms.ValidationError(error)
+        return cv
+
+    def save(self, commit=True):
+        cv = self.cleaned_data.get('cv')
+        if cv and hasattr(cv, 'content_type'):
+            self.instance.cv_sha256 = file_sha256(cv)
+            self.instance.cv_filename = os.path.basename(cv.name)[:255]
+        return super().save(commit)
+
 class StudentRegistrationForm(forms.ModelForm):
     password = forms.CharField(label="Contraseña", widget=forms.PasswordInput(attrs={'class': 'form-control'}))
     password2 = forms.CharField(label="Confirmar Contraseña", widget=forms.PasswordInput(attrs={'class': 'form-control'}))
@@ -99,4 +221,61 @@ class AnswerForm(forms.ModelForm):
             'answer_text': forms.Textarea(attrs={'class': 'form-control'}),
         }
 
+class IntegerListField(forms.Field):
+    """Lista de enteros enviada como varios valores con el mismo nombre (checkboxes)."""
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value):
+        if not value:
+            return []
+        try:
+            return sorted({int(item) for item in value})
+        except (TypeError, ValueError):
+            raise forms.ValidationError('La selección contiene identificadores inválidos.')
+
+class BulkApplicationForm(forms.Form):
+    """
+    Selección de postulaciones para las acciones en bloque: una lista de IDs o,
+    con ``select_all``, todas las que cumplan el filtro (oferta, estado y
+    búsqueda de candidatos).
+    """
+    application_ids = IntegerListField(required=False)
+    select_all = forms.BooleanField(required=False)
+    job_id = forms.IntegerField(required=False)
+    current_status = forms.ChoiceField(choices=[('', 'Todos')] + Application.STATUS_CHOICES, required=False)
+    q = forms.CharField(required=False)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if not cleaned_data.get('application_ids') and not cleaned_data.get('select_all'):
+            raise forms.ValidationError('Selecciona al menos una postulación.')
+        return cleaned_data
+
+    def get_queryset(self, recruiter):
+        """Postulaciones seleccionadas que pertenecen a ofertas de ``recruiter``."""
+        queryset = Application.objects.filter(job_posting__recruiter=recruiter)
+        data = self.cleaned_data
+        if not data.get('select_all'):
+            queryset = queryset.filter(id__in=data['application_ids'])
+        if data.get('job_id'):
+            queryset = queryset.filter(job_posting_id=data['job_id'])
+        if data.get('current_status'):
+            queryset = queryset.filter(status=data['current_status'])
+        if data.get('q'):
+            matches = get_search_backend().search_candidates(Application.objects.all(), data['q'])
+            queryset = queryset.filter(id__in=matches.values('id'))
+        return queryset
+
+class BulkStatusForm(BulkApplicationForm):
+    status = forms.ChoiceField(choices=Application.STATUS_CHOICES)
+
+class JobImportUploadForm(forms.Form):
+    file = forms.FileField(
+        label='Archivo CSV o JSONL',
+        widget=forms.FileInput(attrs={'class': 'form-control', 'accept': '.csv,.jsonl,.json'}),
+    )
+    dry_run = forms.BooleanField(
+        label='Solo validar', required=False, widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+    )
+
 AnswerFormSet = inlineformset_factory(Application, Answer, form=AnswerForm, extra=0, can_delete=False)
\ No newline at end of file
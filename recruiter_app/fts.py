@@ -0,0 +1,153 @@
+# recruiter_app/fts.py
+"""
+Índices FTS5 de contenido externo para SQLite.
+
+Cada índice se sincroniza con su tabla de origen mediante triggers, de modo
+que cualquier escritura (save, bulk_create, update, borrados en cascada o SQL
+directo) queda reflejada sin pasar por señales de Django. Este módulo no
+importa modelos para poder usarse desde las migraciones.
+"""
+
+TOKENIZER = 'unicode61 remove_diacritics 2'
+
+
+class FTSIndex:
+    """Describe una tabla virtual FTS5 ligada a una tabla de contenido."""
+
+    def __init__(self, table, content_table, columns):
+        self.table = table
+        self.content_table = content_table
+        self.columns = tuple(columns)
+
+    def _values(self, alias):
+        return ', '.join(f'{alias}.{column}' for column in self.columns)
+
+    def create_sql(self):
+        columns = ', '.join(self.columns)
+        old, new = self._values('old'), self._values('new')
+        delete_old = (
+            f"INSERT INTO {self.table}({self.table}, rowid, {columns}) "
+            f"VALUES ('delete', old.id, {old});"
+        )
+        insert_new = f'INSERT INTO {self.table}(rowid, {columns}) VALUES (new.id, {new});'
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+            f"{columns}, content='{self.content_table}', content_rowid='id', "
+            f"tokenize='{TOKENIZER}')",
+            f'CREATE TRIGGER IF NOT EXISTS {self.table}_ai AFTER INSERT ON {self.content_table} '
+            f'BEGIN {insert_new} END',
+            f'CREATE TRIGGER IF NOT EXISTS {self.table}_ad AFTER DELETE ON {self.content_table} '
+            f'BEGIN {delete_old} END',
+            f'CREATE TRIGGER IF NOT EXISTS {self.table}_au AFTER UPDATE OF {columns} '
+            f'ON {self.content_table} BEGIN {delete_old} {insert_new} END',
+        ]
+
+    def drop_sql(self):
+        return [
+            f'DROP TRIGGER IF EXISTS {self.table}_au',
+            f'DROP TRIGGER IF EXISTS {self.table}_ad',
+            f'DROP TRIGGER IF EXISTS {self.table}_ai',
+            f'DROP TABLE IF EXISTS {self.table}',
+        ]
+
+    def install(self, connection):
+        """
+        Crea la tabla y los triggers si no existen. Es idempotente: se vuelve
+        a ejecutar tras cada migrate porque SQLite elimina los triggers cuando
+        Django reconstruye la tabla de contenido al alterar columnas.
+        """
+        if connection.vendor != 'sqlite':
+            return False
+        with connection.cursor() as cursor:
+            for statement in self.create_sql():
+                cursor.execute(statement)
+        return True
+
+    def uninstall(self, connection):
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            for statement in self.drop_sql():
+                cursor.execute(statement)
+
+    def rebuild(self, connection):
+        """Regenera el índice completo desde la tabla de contenido."""
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('rebuild')")
+            cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('optimize')")
+
+
+class CandidateIndex(FTSIndex):
+    """
+    Índice de postulaciones: una fila por ``Application`` con el texto de su CV
+    y todas sus respuestas concatenadas. Como combina dos tablas, el índice
+    guarda su propia copia del texto (no es de contenido externo) y los
+    triggers de ambas tablas actualizan solo la fila de la postulación afectada.
+    """
+
+    def __init__(self, table, application_table, answer_table):
+        super().__init__(table, application_table, ['cv_text', 'answers'])
+        self.answer_table = answer_table
+
+    def _answers_of(self, application_id):
+        return (
+            f"(SELECT coalesce(group_concat(answer_text, ' '), '') FROM {self.answer_table} "
+            f"WHERE application_id = {application_id})"
+        )
+
+    def _refresh_answers(self, application_id):
+        return (
+            f'UPDATE {self.table} SET answers = {self._answers_of(application_id)} '
+            f'WHERE rowid = {application_id};'
+        )
+
+    def create_sql(self):
+        table, applications, answers = self.table, self.content_table, self.answer_table
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+            f"cv_text, answers, tokenize='{TOKENIZER}')",
+            f'CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {applications} BEGIN '
+            f"INSERT INTO {table}(rowid, cv_text, answers) VALUES (new.id, new.cv_text, ''); END",
+            f'CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {applications} BEGIN '
+            f'DELETE FROM {table} WHERE rowid = old.id; END',
+            f'CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE OF cv_text ON {applications} BEGIN '
+            f'UPDATE {table} SET cv_text = new.cv_text WHERE rowid = new.id; END',
+            # Las respuestas llegan con bulk_create justo después de la postulación:
+            # basta con añadir el texto nuevo en lugar de recalcular todo.
+            f'CREATE TRIGGER IF NOT EXISTS {table}_answer_ai AFTER INSERT ON {answers} BEGIN '
+            f"UPDATE {table} SET answers = answers || ' ' || new.answer_text "
+            f'WHERE rowid = new.application_id; END',
+            f'CREATE TRIGGER IF NOT EXISTS {table}_answer_ad AFTER DELETE ON {answers} BEGIN '
+            f"{self._refresh_answers('old.application_id')} END",
+            f'CREATE TRIGGER IF NOT EXISTS {table}_answer_au AFTER UPDATE OF answer_text, application_id '
+            f"ON {answers} BEGIN {self._refresh_answers('old.application_id')} "
+            f"{self._refresh_answers('new.application_id')} END",
+        ]
+
+    def drop_sql(self):
+        return [
+            f'DROP TRIGGER IF EXISTS {self.table}_answer_au',
+            f'DROP TRIGGER IF EXISTS {self.table}_answer_ad',
+            f'DROP TRIGGER IF EXISTS {self.table}_answer_ai',
+        ] + super().drop_sql()
+
+    def rebuild(self, connection):
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(
+                f'INSERT INTO {self.table}(rowid, cv_text, answers) '
+                f"SELECT a.id, a.cv_text, {self._answers_of('a.id')} FROM {self.content_table} a"
+            )
+            cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES ('optimize')")
+
+
+JOB_POSTING_INDEX = FTSIndex(
+    'recruiter_app_jobposting_fts', 'recruiter_app_jobposting', ['title', 'description'],
+)
+CANDIDATE_INDEX = CandidateIndex(
+    'recruiter_app_application_fts', 'recruiter_app_application', 'recruiter_app_answer',
+)
@@ -0,0 +1,211 @@
+# recruiter_app/imports.py
+"""
+Importación masiva de ofertas con sus preguntas y opciones desde CSV o JSONL
+(``import_job_postings`` y la vista ``import_job_postings``).
+
+JSONL: un objeto por línea::
+
+    {"title": "...", "description": "...", "salary": "1500", "min_education": "Técnica",
+     "questions": [{"text": "...", "question_type": "closed", "options": ["Sí", "No"]}]}
+
+CSV: columnas ``title``, ``description``, ``salary``, ``min_education`` y por
+cada pregunta ``question_<n>``, ``question_<n>_type`` y ``question_<n>_options``
+(textos separados por ``||``, como en el formulario de ofertas). Sin tipo, una
+pregunta con opciones es cerrada.
+
+Cada fila se valida con JobImportForm/QuestionImportForm, igual que en
+create_job_posting. Las filas válidas se insertan por lotes, cada lote en su
+transacción con un bulk_create por modelo; las inválidas se reportan con su
+número de línea y no detienen la importación.
+"""
+import csv
+import io
+import json
+import re
+from dataclasses import dataclass, field
+
+from django.db import transaction
+
+from . import caching
+from .forms import JobImportForm, QuestionForm, QuestionImportForm, job_import_fields
+from .models import EducationLevel, JobPosting, Question, QuestionOption
+from .services import parse_options
+from .taskqueue import enqueue_many
+
+IMPORT_BATCH_SIZE = 1000
+FORMATS = ('csv', 'jsonl')
+QUESTION_COLUMN_RE = re.compile(r'^question_(\d+)$')
+
+
+class ImportFormatError(ValueError):
+    """El archivo no tiene el formato esperado (no solo una fila inválida)."""
+
+
+def detect_format(filename):
+    for import_format in FORMATS:
+        if filename.lower().endswith(f'.{import_format}'):
+            return import_format
+    if filename.lower().endswith('.json'):
+        return 'jsonl'
+    raise ImportFormatError('Formato no soportado: usa un archivo .csv o .jsonl.')
+
+
+def text_stream(file):
+    """Texto línea a línea de un archivo binario (UploadedFile o abierto en 'rb')."""
+    return io.TextIOWrapper(getattr(file, 'file', file), encoding='utf-8-sig', newline='')
+
+
+def read_jsonl(stream):
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            yield line_number, {'__all__': [f'JSON inválido: {error.msg}.']}
+            continue
+        if not isinstance(record, dict):
+            yield line_number, {'__all__': ['Cada línea debe ser un objeto JSON.']}
+            continue
+        yield line_number, record
+
+
+def csv_record(row):
+    """Convierte las columnas ``question_<n>*`` de una fila CSV en la lista ``questions``."""
+    numbers = sorted(int(match.group(1)) for match in map(QUESTION_COLUMN_RE.match, row) if match)
+    questions = []
+    for number in numbers:
+        text = (row.get(f'question_{number}') or '').strip()
+        if not text:
+            continue
+        questions.append({
+            'text': text,
+            'question_type': (row.get(f'question_{number}_type') or '').strip(),
+            'options': parse_options(row.get(f'question_{number}_options')),
+        })
+    record = {name: row.get(name) for name in ('title', 'description', 'salary', 'min_education')}
+    record['questions'] = questions
+    return record
+
+
+def read_csv(stream):
+    reader = csv.DictReader(stream)
+    if not reader.fieldnames or 'title' not in reader.fieldnames:
+        raise ImportFormatError('El CSV debe tener una fila de cabecera con al menos la columna "title".')
+    for row in reader:
+        # La cabecera es la línea 1; un campo con saltos de línea ocupa varias
+        yield reader.line_num, csv_record(row)
+
+
+def read_records(file, import_format):
+    """Pares ``(línea, registro)``; el registro es un dict de errores si la línea no se pudo leer."""
+    stream = text_stream(file)
+    return read_csv(stream) if import_format == 'csv' else read_jsonl(stream)
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    questions: int = 0
+    options: int = 0
+    errors: list = field(default_factory=list)  # [(línea, {campo: [mensajes]})]
+
+
+class JobImporter:
+    """
+    Valida e inserta las ofertas de ``recruiter``. Con ``dry_run`` solo valida.
+    ``log`` recibe el progreso después de cada lote.
+    """
+
+    def __init__(self, recruiter, batch_size=IMPORT_BATCH_SIZE, dry_run=False, log=None):
+        self.recruiter = recruiter
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.log = log or (lambda message: None)
+        self.levels = {level.name: level for level in EducationLevel.objects.all()}
+        # Un formulario nuevo por fila, pero con los campos construidos una sola
+        # vez: copiarlos para cada fila era la mayor parte del tiempo de una
+        # importación grande.
+        self.job_fields = job_import_fields(self.levels)
+        self.question_fields = QuestionForm().fields
+        self.result = ImportResult()
+
+    def run(self, file, import_format):
+        batch = []
+        for line_number, record in read_records(file, import_format):
+            valid = self.validate(line_number, record)
+            if valid is not None:
+                batch.append(valid)
+            if len(batch) >= self.batch_size:
+                self.save_batch(batch)
+                batch = []
+        if batch:
+            self.save_batch(batch)
+        return self.result
+
+    def validate(self, line_number, record):
+        """``(oferta, [(pregunta, opciones)])`` sin guardar, o None si la fila tiene errores."""
+        if '__all__' in record:
+            self.result.errors.append((line_number, record))
+            return None
+        errors = {}
+        job_form = JobImportForm(
+            {name: record.get(name) for name in ('title', 'description', 'salary', 'min_education')},
+            fields=self.job_fields,
+        )
+        if not job_form.is_valid():
+            errors.update(job_form.errors.get_json_data())
+        questions = record.get('questions') or []
+        if not isinstance(questions, list):
+            questions = []
+            errors['questions'] = [{'message': 'Debe ser una lista de preguntas.', 'code': 'invalid'}]
+
+        saved = []
+        for index, data in enumerate(questions):
+            data = data if isinstance(data, dict) else {'text': data}
+            options = data.get('options') or []
+            if isinstance(options, str):
+                options = parse_options(options)
+            question_type = data.get('question_type') or ('closed' if options else 'open')
+            question_form = QuestionImportForm(
+                {'text': data.get('text'), 'question_type': question_type}, fields=self.question_fields,
+            )
+            if not question_form.is_valid():
+                for name, messages in question_form.errors.get_json_data().items():
+                    errors[f'questions[{index}].{name}'] = messages
+                continue
+            question = question_form.save(commit=False)
+            texts = [str(text).strip() for text in options if str(text).strip()]
+            # Las preguntas abiertas no tienen opciones, como en save_job_posting
+            saved.append((question, texts if question.question_type == 'closed' else []))
+
+        if errors:
+            self.result.errors.append((line_number, {
+                name: [message['message'] for message in messages] for name, messages in errors.items()
+            }))
+            return None
+        job = job_form.save(commit=False)
+        job.recruiter = self.recruiter
+        return job, saved
+
+    def save_batch(self, batch):
+        questions = [question for _, pairs in batch for question, _ in pairs]
+        options_count = sum(len(texts) for _, pairs in batch for _, texts in pairs)
+        if not self.dry_run:
+            with transaction.atomic():
+                jobs = JobPosting.objects.bulk_create([job for job, _ in batch])
+                for job, (_, pairs) in zip(jobs, batch):
+                    for question, _ in pairs:
+                        question.job_posting = job
+                Question.objects.bulk_create(questions)
+                QuestionOption.objects.bulk_create(
+                    QuestionOption(question=question, text=text)
+                    for _, pairs in batch for question, texts in pairs for text in texts
+                )
+                # Las escrituras en bloque no emiten señales: se invalidan los listados
+                transaction.on_commit(lambda: caching.bump_version('jobs'))
+                enqueue_many('refresh_job_recommendations', [{'job_id': job.pk} for job in jobs])
+        self.result.created += len(batch)
+        self.result.questions += len(questions)
+        self.result.options += options_count
+        self.log(f'{self.result.created} ofertas, {len(self.result.errors)} filas con errores')
@@ -0,0 +1,133 @@
+# recruiter_app/loadtest.py
+"""
+Utilidades para pruebas de carga contra un servidor local (runserver, gunicorn
+o uvicorn). Solo usan la biblioteca estándar: cada cliente simulado mantiene
+sus cookies de sesión y CSRF como lo haría un navegador.
+"""
+import http.cookiejar
+import re
+import statistics
+import time
+import urllib.parse
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+CSRF_INPUT_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+UPLOAD_CHUNK_SIZE = 1024
+
+# PDF mínimo válido usado como CV en las postulaciones simuladas.
+SAMPLE_PDF = (
+    b'%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n'
+    b'2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n'
+    b'3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\n'
+    b'trailer<</Root 1 0 R>>\n%%EOF\n'
+)
+
+
+def encode_multipart(fields, files):
+    """Codifica ``fields`` y ``files`` ({nombre: (archivo, contenido, tipo)}) como multipart/form-data."""
+    boundary = uuid.uuid4().hex
+    lines = []
+    for name, value in fields.items():
+        lines += [f'--{boundary}', f'Content-Disposition: form-data; name="{name}"', '', str(value)]
+    body = '\r\n'.join(lines).encode() + (b'\r\n' if lines else b'')
+    for name, (filename, content, content_type) in files.items():
+        body += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: {content_type}\r\n\r\n'
+        ).encode() + content + b'\r\n'
+    body += f'--{boundary}--\r\n'.encode()
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+def trickle(body, delay, chunk_size=UPLOAD_CHUNK_SIZE):
+    """Entrega ``body`` en trozos con una pausa entre ellos (cliente con conexión lenta)."""
+    for start in range(0, len(body), chunk_size):
+        if start:
+            time.sleep(delay)
+        yield body[start:start + chunk_size]
+
+
+class SimulatedUser:
+    """Cliente HTTP con sesión propia contra ``base_url``."""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+
+    def request(self, path, data=None, content_type=None, content_length=None):
+        request = urllib.request.Request(self.base_url + path, data=data)
+        if content_type:
+            request.add_header('Content-Type', content_type)
+        if content_length is not None:
+            # Necesario cuando ``data`` es un iterable (subida en trozos)
+            request.add_header('Content-Length', str(content_length))
+        request.add_header('Referer', self.base_url + path)
+        with self.opener.open(request, timeout=60) as response:
+            return response.status, response.read().decode('utf-8', 'replace')
+
+    def csrf_token(self, path):
+        _, html = self.request(path)
+        match = CSRF_INPUT_RE.search(html)
+        if not match:
+            raise RuntimeError(f'No se encontró el token CSRF en {path}')
+        return match.group(1)
+
+    def login(self, username, password):
+        token = self.csrf_token('/accounts/login/')
+        data = urllib.parse.urlencode({
+            'csrfmiddlewaretoken': token, 'username': username, 'password': password,
+        }).encode()
+        self.request('/accounts/login/', data, 'application/x-www-form-urlencoded')
+
+    def get(self, path):
+        """GET medido: devuelve (estado, segundos)."""
+        started = time.perf_counter()
+        status, _ = self.request(path)
+        return status, time.perf_counter() - started
+
+    def apply(self, job_id, answers, upload_delay=0, cv=SAMPLE_PDF):
+        """
+        Postula a la oferta. Con ``upload_delay`` el cuerpo se envía en trozos
+        de ``UPLOAD_CHUNK_SIZE`` bytes con esa pausa entre ellos.
+        """
+        path = f'/apply/{job_id}/'
+        fields = {'csrfmiddlewaretoken': self.csrf_token(path), **answers}
+        body, content_type = encode_multipart(fields, {'cv': ('cv.pdf', cv, 'application/pdf')})
+        started = time.perf_counter()
+        if upload_delay:
+            status, _ = self.request(path, trickle(body, upload_delay), content_type, len(body))
+        else:
+            status, _ = self.request(path, body, content_type)
+        return status, time.perf_counter() - started
+
+
+def run_concurrently(task, items, concurrency):
+    """Ejecuta ``task(item)`` en paralelo y devuelve (resultados, segundos totales)."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(task, items))
+    return results, time.perf_counter() - started
+
+
+def summarize(latencies, elapsed, errors=0):
+    """Resumen de throughput y latencias en milisegundos."""
+    ordered = sorted(latencies)
+    if not ordered:
+        return {'requests': 0, 'errors': errors}
+
+    def percentile(fraction):
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 2)
+
+    return {
+        'requests': len(ordered),
+        'errors': errors,
+        'elapsed_s': round(elapsed, 3),
+        'throughput_rps': round(len(ordered) / elapsed, 2) if elapsed else None,
+        'mean_ms': round(statistics.fmean(ordered) * 1000, 2),
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+    }
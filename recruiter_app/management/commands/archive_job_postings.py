@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from recruiter_app.archive import ARCHIVE_BATCH_SIZE, archivable_jobs, archive_cutoff, archive_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        'Mueve a las tablas de archivo las ofertas con más de ARCHIVE_AFTER_DAYS '
+        'días y sin postulaciones pendientes, con sus preguntas, postulaciones y '
+        'respuestas (ver recruiter_app/archive.py). Pensado para ejecutarse '
+        'periódicamente, p. ej. cada noche.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, help='Antigüedad mínima en días (por defecto ARCHIVE_AFTER_DAYS).')
+        parser.add_argument(
+            '--include-pending', action='store_true', help='Archiva también ofertas con postulaciones pendientes.',
+        )
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE, help='Ofertas por lote.')
+        parser.add_argument('--limit', type=int, help='Máximo de ofertas a archivar en esta ejecución.')
+        parser.add_argument('--dry-run', action='store_true', help='Solo cuenta las ofertas que se archivarían.')
+        parser.add_argument(
+            '--vacuum', action='store_true', help='Compacta después la base principal (SQLite) para liberar espacio.',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = archive_cutoff(options['days'])
+        if options['dry_run']:
+            count = archivable_jobs(cutoff, options['include_pending']).count()
+            self.stdout.write(f'{count} ofertas anteriores a {cutoff:%Y-%m-%d} se archivarían.')
+            return
+
+        log = self.stdout.write if options['verbosity'] > 1 else None
+        started = time.perf_counter()
+        jobs, applications = archive_jobs(
+            cutoff, options['include_pending'], options['batch_size'], options['limit'], log,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'{jobs} ofertas y {applications} postulaciones archivadas en {time.perf_counter() - started:.2f} s.'
+        ))
+        if options['vacuum'] and connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('VACUUM')
+                cursor.execute('PRAGMA optimize')
+            self.stdout.write('Base principal compactada.')
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from recruiter_app.models import CustomUser, JobPosting
+
+WRITE_PREFIXES = ('INSERT', 'UPDATE', 'DELETE')
+
+
+def question_payload(questions, options, prefix='questions', existing=()):
+    """Datos POST de un formset de ``questions`` preguntas cerradas con ``options`` opciones."""
+    data = {
+        f'{prefix}-TOTAL_FORMS': str(questions),
+        f'{prefix}-INITIAL_FORMS': str(len(existing)),
+        f'{prefix}-MIN_NUM_FORMS': '0',
+        f'{prefix}-MAX_NUM_FORMS': '1000',
+    }
+    for index in range(questions):
+        data[f'{prefix}-{index}-text'] = f'Pregunta {index}'
+        data[f'{prefix}-{index}-question_type'] = 'closed'
+        data[f'options_for_{prefix}-{index}'] = '||'.join(f'Opción {n}' for n in range(options))
+        if index < len(existing):
+            data[f'{prefix}-{index}-id'] = str(existing[index])
+    return data
+
+
+class Command(BaseCommand):
+    help = (
+        'Cuenta las consultas de escritura de create_job_posting y edit_job_posting '
+        'para una oferta con N preguntas x M opciones. Todo se revierte al terminar.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--questions', type=int, default=50)
+        parser.add_argument('--options', type=int, default=20)
+
+    def measure(self, client, url, data):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(url, data)
+        if response.status_code != 302:
+            raise RuntimeError(f'{url} respondió {response.status_code}')
+        writes = sum(1 for query in queries if query['sql'].lstrip().upper().startswith(WRITE_PREFIXES))
+        return len(queries), writes
+
+    def handle(self, *args, **options):
+        questions, option_count = options['questions'], options['options']
+        base = {'title': 'Benchmark', 'description': 'Oferta de prueba', 'salary': '1000', 'min_education': 'Técnica'}
+        with transaction.atomic():
+            user = CustomUser.objects.create_user('benchmark-writes', is_company=True)
+            client = Client(HTTP_HOST='localhost')
+            client.force_login(user)
+
+            total, writes = self.measure(client, reverse('create_job_posting'), {**base, **question_payload(questions, option_count)})
+            self.stdout.write(f'create_job_posting: {total} consultas, {writes} escrituras')
+
+            job = JobPosting.objects.filter(recruiter=user).latest('id')
+            existing = list(job.questions.order_by('id').values_list('id', flat=True))
+            data = {**base, **question_payload(questions, option_count, existing=existing)}
+            # Cambia el texto de cada pregunta y la mitad de sus opciones.
+            for index in range(questions):
+                data[f'questions-{index}-text'] = f'Pregunta editada {index}'
+                data[f'options_for_questions-{index}'] = '||'.join(
+                    f'Opción {n}' if n % 2 else f'Opción nueva {n}' for n in range(option_count)
+                )
+            total, writes = self.measure(client, reverse('edit_job_posting', args=[job.id]), data)
+            self.stdout.write(f'edit_job_posting: {total} consultas, {writes} escrituras')
+            transaction.set_rollback(True)
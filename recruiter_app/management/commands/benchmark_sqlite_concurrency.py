@@ -0,0 +1,138 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections, transaction
+from django.db.models import Count
+
+from recruiter_app.loadtest import summarize
+from recruiter_app.models import Answer, Application, CustomUser, EducationLevel, JobPosting, Question
+
+PROFILES = ('development', 'production')
+
+
+def profile_settings(profile, name):
+    """Configuración de conexión de ``profile`` apuntando al archivo ``name``."""
+    database = {**settings.DATABASES['default'], 'NAME': name, 'OPTIONS': {}, 'CONN_MAX_AGE': 0}
+    if profile == 'production':
+        database.update({
+            'OPTIONS': settings.SQLITE_PRODUCTION_OPTIONS, 'CONN_MAX_AGE': 600, 'CONN_HEALTH_CHECKS': True,
+        })
+    return database
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara el perfil SQLite por defecto con el de producción (WAL, busy '
+        'timeout, transacciones IMMEDIATE, conexiones persistentes) usando '
+        'escritores y lectores concurrentes sobre bases temporales. Reporta JSON.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=8)
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=5.0, help='Segundos por perfil.')
+        parser.add_argument('--questions', type=int, default=5, help='Respuestas por postulación.')
+        parser.add_argument('--profile', choices=PROFILES, action='append', help='Perfil a medir (por defecto ambos).')
+
+    def handle(self, *args, **options):
+        directory = tempfile.mkdtemp(prefix='sqlite-bench-')
+        report = {}
+        try:
+            for profile in options['profile'] or PROFILES:
+                alias = f'bench_{profile}'
+                name = os.path.join(directory, f'{profile}.sqlite3')
+                # configure_settings completa las claves por defecto (TEST, AUTOCOMMIT...)
+                connections.settings[alias] = connections.configure_settings(
+                    {'default': profile_settings(profile, name)}
+                )['default']
+                call_command('migrate', database=alias, verbosity=0)
+                job_id, question_ids, user_ids = self.seed(alias, options)
+                report[profile] = self.run(alias, job_id, question_ids, user_ids, options)
+                connections[alias].close()
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        self.stdout.write(json.dumps(report, indent=2))
+
+    def seed(self, alias, options):
+        recruiter = CustomUser.objects.db_manager(alias).create(username='bench-empresa', is_company=True)
+        job = JobPosting.objects.using(alias).create(
+            recruiter=recruiter, title='Practicante', description='Oferta de prueba', salary=1000,
+            min_education=EducationLevel.objects.using(alias).get(name='Técnica'),
+        )
+        questions = Question.objects.using(alias).bulk_create(
+            Question(job_posting=job, text=f'Pregunta {i}', question_type='open') for i in range(options['questions'])
+        )
+        users = CustomUser.objects.db_manager(alias).bulk_create(
+            CustomUser(username=f'bench-alumno-{i}') for i in range(options['writers'])
+        )
+        return job.id, [q.id for q in questions], [u.id for u in users]
+
+    def run(self, alias, job_id, question_ids, user_ids, options):
+        deadline = time.monotonic() + options['duration']
+        results = {'write': ([], [0]), 'read': ([], [0])}
+        lock = threading.Lock()
+
+        def write(user_id):
+            # Como apply_to_job: una lectura previa y luego las inserciones en
+            # la misma transacción (en DEFERRED es el caso que provoca "locked").
+            with transaction.atomic(using=alias):
+                Application.objects.using(alias).filter(job_posting_id=job_id, applicant_id=user_id).exists()
+                application = Application.objects.using(alias).create(
+                    job_posting_id=job_id, applicant_id=user_id, cv='cvs/benchmark.pdf',
+                )
+                Answer.objects.using(alias).bulk_create(
+                    Answer(application=application, question_id=q, answer_text='Respuesta') for q in question_ids
+                )
+
+        def read(_):
+            list(
+                JobPosting.objects.using(alias).annotate(applications_count=Count('applications'))
+                .order_by('-created_at', '-id')[:20]
+            )
+            Application.objects.using(alias).filter(job_posting_id=job_id).order_by('-submitted_at')[:20].count()
+
+        def worker(kind, operation, argument):
+            latencies, errors = results[kind]
+            connection = connections[alias]
+            try:
+                while time.monotonic() < deadline:
+                    started = time.perf_counter()
+                    try:
+                        operation(argument)
+                    except OperationalError:
+                        with lock:
+                            errors[0] += 1
+                    else:
+                        with lock:
+                            latencies.append(time.perf_counter() - started)
+                    # Fin de "petición": con CONN_MAX_AGE=0 se cierra la conexión.
+                    connection.close_if_unusable_or_obsolete()
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=('write', write, user_id)) for user_id in user_ids]
+        threads += [threading.Thread(target=worker, args=('read', read, None)) for _ in range(options['readers'])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        with connections[alias].cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            journal_mode = cursor.fetchone()[0]
+        return {
+            'journal_mode': journal_mode,
+            'writers': len(user_ids),
+            'readers': options['readers'],
+            'writes': summarize(results['write'][0], elapsed, errors=results['write'][1][0]),
+            'reads': summarize(results['read'][0], elapsed, errors=results['read'][1][0]),
+        }
@@ -0,0 +1,52 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from recruiter_app.benchmarks import ViewBenchmark, compare
+
+
+class Command(BaseCommand):
+    help = (
+        'Mide cada vista de recruiter_app/urls.py con el cliente de pruebas sobre '
+        'los datos actuales (ver generate_synthetic_data) y reporta p50/p95 y número '
+        'de consultas en JSON. Las escrituras se revierten.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--view', action='append', help='Solo esta URL (se puede repetir).')
+        parser.add_argument('--output', help='Guarda el reporte JSON en este archivo.')
+        parser.add_argument('--compare', help='Reporte anterior contra el que comparar.')
+        parser.add_argument(
+            '--threshold', type=float, default=0.2,
+            help='Aumento relativo del p95 que se considera regresión (0.2 = 20%%).',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            report = ViewBenchmark(options['iterations'], options['warmup'], options['view']).run()
+        except LookupError as error:
+            raise CommandError(error)
+        output = json.dumps(report, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                file.write(output + '\n')
+        else:
+            self.stdout.write(output)
+        if report['missing']:
+            self.stderr.write(f"Vistas sin escenario de benchmark: {', '.join(report['missing'])}")
+
+        if options['compare']:
+            with open(options['compare']) as file:
+                baseline = json.load(file)
+            rows = compare(baseline, report, options['threshold'])
+            for label, before, after, change, queries_before, queries_after, regression in rows:
+                change_text = f'{change:+.0%}' if change is not None else 'n/a'
+                mark = '  REGRESIÓN' if regression else ''
+                self.stdout.write(
+                    f'{label:40} p95 {before} -> {after} ms ({change_text}), '
+                    f'consultas {queries_before} -> {queries_after}{mark}'
+                )
+            if any(row[-1] for row in rows):
+                raise CommandError('Hay regresiones respecto al reporte anterior.')
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from recruiter_app import recommendations
+from recruiter_app.recommendations import BATCH_SIZE, PROFILE_TERMS, RECOMMENDATIONS_PER_STUDENT, RecommendationBuilder
+
+
+class Command(BaseCommand):
+    help = (
+        'Recalcula las recomendaciones de ofertas de todos los estudiantes '
+        '(ver recruiter_app/recommendations.py). Conviene ejecutarlo '
+        'periódicamente para que los perfiles incluyan las postulaciones nuevas.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--k', type=int, default=RECOMMENDATIONS_PER_STUDENT, help='Recomendaciones por estudiante.')
+        parser.add_argument('--profile-terms', type=int, default=PROFILE_TERMS, help='Términos por perfil.')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        log = self.stdout.write if options['verbosity'] > 1 else None
+        builder = RecommendationBuilder(options['k'], options['profile_terms'], options['batch_size'], log)
+        started = time.perf_counter()
+        jobs, students, total = builder.run()
+        engine = 'SciPy' if recommendations.sparse is not None else 'Python'
+        self.stdout.write(self.style.SUCCESS(
+            f'{total} recomendaciones para {students} estudiantes sobre {jobs} ofertas '
+            f'en {time.perf_counter() - started:.2f} s ({engine}).'
+        ))
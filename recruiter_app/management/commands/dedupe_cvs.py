@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from recruiter_app.models import Application
+from recruiter_app.storage import file_sha256
+
+
+class Command(BaseCommand):
+    help = (
+        'Mueve los CVs guardados con el nombre original al esquema direccionado por '
+        'contenido y elimina las copias duplicadas que ya no usa ninguna postulación.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Solo informa lo que haría.')
+
+    def handle(self, *args, **options):
+        moved = removed = missing = 0
+        applications = Application.objects.filter(cv_sha256='').exclude(cv='').only('id', 'cv', 'cv_filename')
+        for application in applications.iterator(chunk_size=500):
+            storage, old_name = application.cv.storage, application.cv.name
+            if not storage.exists(old_name):
+                missing += 1
+                continue
+            if options['dry_run']:
+                moved += 1
+                continue
+
+            with storage.open(old_name) as content:
+                digest = file_sha256(content)
+                new_name = storage.save(old_name, content)
+            Application.objects.filter(pk=application.pk).update(
+                cv=new_name, cv_sha256=digest, cv_filename=application.cv_filename or old_name.rsplit('/', 1)[-1],
+            )
+            moved += 1
+            if new_name != old_name and not Application.objects.filter(cv=old_name).exists():
+                storage.delete(old_name)
+                removed += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{moved} CVs migrados, {removed} archivos duplicados eliminados, {missing} archivos no encontrados.'
+        ))
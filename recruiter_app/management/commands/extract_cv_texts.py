@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from recruiter_app.models import Application
+from recruiter_app.search import get_search_backend
+from recruiter_app.taskqueue import enqueue_many
+from recruiter_app.tasks import cv_text_key, extract_cv_text
+
+
+class Command(BaseCommand):
+    help = (
+        'Encola la extracción de texto de los CVs que aún no se procesaron '
+        '(postulaciones anteriores a la indexación de candidatos).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sync', action='store_true', help='Extrae en este proceso en lugar de encolar.')
+        parser.add_argument('--all', action='store_true', help='Vuelve a procesar también los CVs ya extraídos.')
+        parser.add_argument('--rebuild-index', action='store_true', help='Reconstruye después el índice de candidatos.')
+
+    def handle(self, *args, **options):
+        applications = Application.objects.exclude(cv='')
+        if not options['all']:
+            applications = applications.filter(cv_text_extracted_at__isnull=True)
+        ids = list(applications.values_list('id', flat=True))
+
+        if options['sync']:
+            for application_id in ids:
+                extract_cv_text(application_id)
+            self.stdout.write(self.style.SUCCESS(f'{len(ids)} CVs procesados.'))
+        else:
+            # Las claves evitan duplicar tareas que ya estén en cola.
+            enqueue_many('extract_cv_text', [{'application_id': i} for i in ids], key_func=cv_text_key)
+            self.stdout.write(self.style.SUCCESS(f'{len(ids)} CVs enviados a la cola de tareas.'))
+
+        if options['rebuild_index']:
+            total = get_search_backend().rebuild_candidates()
+            self.stdout.write(self.style.SUCCESS(f'Índice de candidatos reconstruido: {total} postulaciones.'))
@@ -0,0 +1,34 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from recruiter_app.models import CustomUser
+from recruiter_app.synthetic import PRESETS, USERNAME_PREFIX, SyntheticDataGenerator, delete_synthetic_data
+
+
+class Command(BaseCommand):
+    help = (
+        'Genera un conjunto de datos sintético y reproducible (empresas, estudiantes, '
+        'ofertas con preguntas, postulaciones con respuestas y CVs) para las pruebas '
+        'de rendimiento. Usar solo en bases de desarrollo.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--preset', choices=PRESETS, default='small')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=1000, help='Ofertas por transacción.')
+        parser.add_argument('--flush', action='store_true', help='Elimina antes los datos sintéticos existentes.')
+        for name in PRESETS['small']:
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int, dest=name, help='Reemplaza el valor del preset.')
+
+    def handle(self, *args, **options):
+        if options['flush']:
+            self.stdout.write(f'{delete_synthetic_data(options["batch_size"])} filas sintéticas eliminadas.')
+        elif CustomUser.objects.filter(username__startswith=USERNAME_PREFIX).exists():
+            raise CommandError('Ya hay datos sintéticos; usa --flush para regenerarlos.')
+
+        scale = {**PRESETS[options['preset']], **{name: options[name] for name in PRESETS['small'] if options[name] is not None}}
+        log = self.stdout.write if options['verbosity'] > 0 else None
+        generator = SyntheticDataGenerator(seed=options['seed'], batch_size=options['batch_size'], log=log, **scale)
+        created = generator.run()
+        self.stdout.write(json.dumps({'seed': options['seed'], 'scale': scale, 'created': created}, indent=2))
@@ -0,0 +1,50 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from recruiter_app.imports import FORMATS, IMPORT_BATCH_SIZE, ImportFormatError, JobImporter, detect_format
+from recruiter_app.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = (
+        'Importa ofertas con sus preguntas y opciones desde un archivo CSV o JSONL '
+        '(formato en recruiter_app/imports.py). Las filas inválidas se reportan con '
+        'su número de línea y el resto se importa.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Archivo .csv o .jsonl.')
+        parser.add_argument('--recruiter', required=True, help='Usuario de la empresa dueña de las ofertas.')
+        parser.add_argument('--format', choices=FORMATS, help='Por defecto se deduce de la extensión.')
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE, help='Ofertas por transacción.')
+        parser.add_argument('--dry-run', action='store_true', help='Solo valida, no guarda nada.')
+
+    def handle(self, *args, **options):
+        try:
+            recruiter = CustomUser.objects.get(username=options['recruiter'], is_company=True)
+        except CustomUser.DoesNotExist:
+            raise CommandError(f"No existe la empresa {options['recruiter']}.")
+
+        log = self.stdout.write if options['verbosity'] > 1 else None
+        importer = JobImporter(recruiter, options['batch_size'], options['dry_run'], log)
+        started = time.perf_counter()
+        try:
+            import_format = options['format'] or detect_format(options['path'])
+            with open(options['path'], 'rb') as file:
+                result = importer.run(file, import_format)
+        except (OSError, ImportFormatError, UnicodeDecodeError) as error:
+            raise CommandError(str(error))
+
+        for line_number, errors in result.errors:
+            for name, messages in errors.items():
+                self.stderr.write(f"Línea {line_number}: {name}: {' '.join(messages)}")
+        self.stdout.write(json.dumps({
+            'dry_run': options['dry_run'],
+            'created': result.created,
+            'questions': result.questions,
+            'options': result.options,
+            'invalid_rows': len(result.errors),
+            'elapsed_s': round(time.perf_counter() - started, 3),
+        }, indent=2))
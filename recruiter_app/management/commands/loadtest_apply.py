@@ -0,0 +1,77 @@
+import json
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+
+from recruiter_app.loadtest import SimulatedUser, run_concurrently, summarize
+from recruiter_app.models import CustomUser, JobPosting
+
+USERNAME_PREFIX = 'loadtest-'
+
+
+def ensure_students(count, password):
+    """Crea los estudiantes de prueba que falten, con una sola inserción."""
+    usernames = [f'{USERNAME_PREFIX}{index}' for index in range(count)]
+    existing = set(CustomUser.objects.filter(username__in=usernames).values_list('username', flat=True))
+    hashed = make_password(password)
+    CustomUser.objects.bulk_create(
+        CustomUser(username=name, password=hashed, is_company=False)
+        for name in usernames if name not in existing
+    )
+    return usernames
+
+
+def sample_answers(job):
+    """Respuestas válidas para las preguntas de ``job`` (la primera opción o un texto)."""
+    answers = {}
+    for question in job.questions.prefetch_related('options'):
+        options = list(question.options.all())
+        answers[f'answer_text_{question.id}'] = options[0].text if options else 'Respuesta de prueba'
+    return answers
+
+
+class Command(BaseCommand):
+    help = (
+        'Simula postulantes concurrentes enviando apply_to_job contra un servidor '
+        'local ya iniciado y reporta throughput y latencias en JSON.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('job_id', type=int, help='Oferta a la que se postula.')
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--applicants', type=int, default=50)
+        parser.add_argument('--concurrency', type=int, default=10)
+        parser.add_argument('--password', default='loadtest-pass')
+        parser.add_argument(
+            '--cleanup', action='store_true',
+            help='Elimina los usuarios de prueba (y sus postulaciones) al terminar.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            job = JobPosting.objects.get(id=options['job_id'])
+        except JobPosting.DoesNotExist:
+            raise CommandError(f"La oferta {options['job_id']} no existe.")
+
+        answers = sample_answers(job)
+        usernames = ensure_students(options['applicants'], options['password'])
+        users = []
+        for username in usernames:
+            user = SimulatedUser(options['base_url'])
+            user.login(username, options['password'])
+            users.append(user)
+
+        def apply(user):
+            try:
+                return user.apply(job.id, answers)
+            except OSError:
+                return None, None
+
+        results, elapsed = run_concurrently(apply, users, options['concurrency'])
+        latencies = [latency for status, latency in results if status == 200]
+        report = summarize(latencies, elapsed, errors=len(results) - len(latencies))
+        report.update({'endpoint': 'apply_to_job', 'concurrency': options['concurrency']})
+        self.stdout.write(json.dumps(report, indent=2))
+
+        if options['cleanup']:
+            CustomUser.objects.filter(username__startswith=USERNAME_PREFIX).delete()
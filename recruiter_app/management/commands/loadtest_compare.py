@@ -0,0 +1,82 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from recruiter_app.loadtest import SimulatedUser, run_concurrently, summarize
+from recruiter_app.models import CustomUser, JobPosting
+
+from .loadtest_apply import USERNAME_PREFIX, ensure_students, sample_answers
+
+ENDPOINTS = ('search_jobs', 'my_applications', 'apply_to_job')
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara el mismo proyecto servido por WSGI (gunicorn/runserver) y por ASGI '
+        '(uvicorn/daphne): estudiantes concurrentes buscan ofertas, ven sus '
+        'postulaciones y postulan subiendo el CV lentamente. Los servidores se '
+        'inician aparte; el reporte JSON tiene throughput y latencias por endpoint.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('job_id', type=int, help='Oferta a la que se postula.')
+        parser.add_argument('--wsgi-url', help='Por ejemplo http://127.0.0.1:8000 (gunicorn -w 1 --threads 8).')
+        parser.add_argument('--asgi-url', help='Por ejemplo http://127.0.0.1:8001 (uvicorn --workers 1).')
+        parser.add_argument('--students', type=int, default=50)
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument(
+            '--upload-delay', type=float, default=0.05,
+            help='Pausa en segundos entre cada KB del CV subido (0 para subir de una vez).',
+        )
+        parser.add_argument('--password', default='loadtest-pass')
+        parser.add_argument(
+            '--cleanup', action='store_true',
+            help='Elimina los usuarios de prueba (y sus postulaciones) al terminar.',
+        )
+
+    def handle(self, *args, **options):
+        servers = {name: options[f'{name}_url'] for name in ('wsgi', 'asgi') if options[f'{name}_url']}
+        if not servers:
+            raise CommandError('Indica --wsgi-url, --asgi-url o ambos.')
+        try:
+            job = JobPosting.objects.get(id=options['job_id'])
+        except JobPosting.DoesNotExist:
+            raise CommandError(f"La oferta {options['job_id']} no existe.")
+
+        answers = sample_answers(job)
+        usernames = ensure_students(options['students'], options['password'])
+        report = {
+            'students': options['students'],
+            'concurrency': options['concurrency'],
+            'upload_delay_s': options['upload_delay'],
+        }
+        for name, base_url in servers.items():
+            users = []
+            for username in usernames:
+                user = SimulatedUser(base_url)
+                user.login(username, options['password'])
+                users.append(user)
+
+            def session(user):
+                # La secuencia de un estudiante: buscar, revisar sus postulaciones y postular
+                results = {}
+                for endpoint, call in (
+                    ('search_jobs', lambda: user.get('/search-jobs/?q=analista')),
+                    ('my_applications', lambda: user.get('/my-applications/')),
+                    ('apply_to_job', lambda: user.apply(job.id, answers, options['upload_delay'])),
+                ):
+                    try:
+                        results[endpoint] = call()
+                    except OSError:
+                        results[endpoint] = (None, None)
+                return results
+
+            results, elapsed = run_concurrently(session, users, options['concurrency'])
+            report[name] = {'base_url': base_url, 'elapsed_s': round(elapsed, 3)}
+            for endpoint in ENDPOINTS:
+                latencies = [latency for status, latency in (r[endpoint] for r in results) if status == 200]
+                report[name][endpoint] = summarize(latencies, elapsed, errors=len(results) - len(latencies))
+        self.stdout.write(json.dumps(report, indent=2))
+
+        if options['cleanup']:
+            CustomUser.objects.filter(username__startswith=USERNAME_PREFIX).delete()
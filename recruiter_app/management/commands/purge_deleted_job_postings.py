@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from recruiter_app.models import JobPosting
+from recruiter_app.purge import PURGE_BATCH_SIZE, purge_job
+
+
+class Command(BaseCommand):
+    help = (
+        'Borra por lotes las ofertas eliminadas que aún no se purgaron (por '
+        'ejemplo, si no había un worker de tareas activo) con sus postulaciones '
+        'y los CVs que quedaron sin usar.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PURGE_BATCH_SIZE, help='Filas por transacción.')
+
+    def handle(self, *args, **options):
+        job_ids = list(JobPosting.all_objects.filter(deleted_at__isnull=False).values_list('id', flat=True))
+        totals = {}
+        for job_id in job_ids:
+            for model, count in purge_job(job_id, options['batch_size']).items():
+                totals[model._meta.verbose_name_plural] = totals.get(model._meta.verbose_name_plural, 0) + count
+            if options['verbosity'] > 1:
+                self.stdout.write(f'Oferta {job_id} purgada.')
+        summary = ', '.join(f'{count} {name}' for name, count in totals.items()) or 'nada que borrar'
+        self.stdout.write(self.style.SUCCESS(f'{len(job_ids)} ofertas purgadas ({summary}).'))
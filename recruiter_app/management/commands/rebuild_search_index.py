@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from recruiter_app.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye los índices de búsqueda de texto completo de las ofertas y de los candidatos.'
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        total = backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Índice reconstruido con {backend.__class__.__name__}: {total} ofertas.'
+        ))
+        total = backend.rebuild_candidates()
+        self.stdout.write(self.style.SUCCESS(f'Índice de candidatos reconstruido: {total} postulaciones.'))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from recruiter_app.counters import COUNTER_FIELDS, find_drift
+from recruiter_app.models import JobPosting
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara los contadores de postulaciones de cada oferta con las '
+        'postulaciones reales y corrige las que no coinciden.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Solo informa las diferencias.')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        fixed = 0
+        batch = []
+        for job in find_drift().iterator(chunk_size=options['batch_size']):
+            if options['verbosity'] > 1:
+                stored = ', '.join(f'{field}={getattr(job, field)}' for field in COUNTER_FIELDS)
+                actual = ', '.join(f'{field}={getattr(job, "actual_" + field)}' for field in COUNTER_FIELDS)
+                self.stdout.write(f'Oferta {job.pk}: {stored} -> {actual}')
+            for field in COUNTER_FIELDS:
+                setattr(job, field, getattr(job, f'actual_{field}'))
+            batch.append(job)
+            fixed += 1
+            if len(batch) >= options['batch_size']:
+                self.save(batch, options['dry_run'])
+                batch = []
+        self.save(batch, options['dry_run'])
+
+        verb = 'con diferencias' if options['dry_run'] else 'corregidas'
+        self.stdout.write(self.style.SUCCESS(f'{fixed} ofertas {verb}.'))
+
+    def save(self, jobs, dry_run):
+        if jobs and not dry_run:
+            with transaction.atomic():
+                JobPosting.objects.bulk_update(jobs, COUNTER_FIELDS)
@@ -0,0 +1,30 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from recruiter_app.taskqueue import default_worker_id, requeue_stale, run_pending, run_worker
+
+
+class Command(BaseCommand):
+    help = 'Ejecuta un worker de la cola de tareas en segundo plano (recruiter_app.taskqueue).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sleep', type=float, default=1.0, help='Segundos de espera cuando la cola está vacía.')
+        parser.add_argument('--burst', action='store_true', help='Procesa la cola pendiente y termina.')
+        parser.add_argument('--worker-id', default=None)
+
+    def handle(self, *args, **options):
+        worker_id = options['worker_id'] or default_worker_id()
+        if options['burst']:
+            requeue_stale()
+            processed = run_pending(worker_id)
+            self.stdout.write(self.style.SUCCESS(f'{processed} tareas procesadas.'))
+            return
+
+        stopping = []
+        # SIGTERM/SIGINT terminan la tarea en curso antes de salir.
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: stopping.append(True))
+        self.stdout.write(f'Worker {worker_id} esperando tareas...')
+        run_worker(worker_id, poll_interval=options['sleep'], stop=lambda: bool(stopping))
+        self.stdout.write('Worker detenido.')
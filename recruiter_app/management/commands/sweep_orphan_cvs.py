@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from recruiter_app.purge import PURGE_BATCH_SIZE, chunked, cv_orphan_grace, remove_orphan_cvs, stored_cvs
+
+
+class Command(BaseCommand):
+    help = (
+        'Borra los CVs de la carpeta de CVs que no usa ninguna postulación (activa '
+        'o archivada) y que no se modificaron ni reutilizaron durante el periodo de gracia.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace', type=int, default=None,
+            help=f'Segundos desde la última modificación (por defecto CV_ORPHAN_GRACE_SECONDS, {cv_orphan_grace()}).',
+        )
+
+    def handle(self, *args, **options):
+        removed = 0
+        for names in chunked(stored_cvs(), PURGE_BATCH_SIZE):
+            removed += remove_orphan_cvs(names, grace=options['grace'])
+        self.stdout.write(self.style.SUCCESS(f'{removed} CVs huérfanos eliminados.'))
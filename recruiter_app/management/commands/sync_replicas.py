@@ -0,0 +1,45 @@
+import os
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+def copy_database(source, target):
+    """
+    Copia consistente de la base SQLite ``source`` en ``target`` con la API de
+    backup. Se escribe en un archivo temporal y se reemplaza de una vez, así
+    los lectores de la réplica nunca ven una copia a medias.
+    """
+    temporary = f'{target}.tmp'
+    source_connection, target_connection = sqlite3.connect(source), sqlite3.connect(temporary)
+    try:
+        source_connection.backup(target_connection)
+        target_connection.execute('PRAGMA journal_mode=DELETE')
+    finally:
+        target_connection.close()
+        source_connection.close()
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(target + suffix):
+            os.remove(target + suffix)
+    os.replace(temporary, target)
+
+
+class Command(BaseCommand):
+    help = (
+        'Copia la base primaria en las réplicas de DATABASE_REPLICAS. Simula la '
+        'replicación para probar en local con varios archivos SQLite.'
+    )
+
+    def handle(self, *args, **options):
+        replicas = getattr(settings, 'DATABASE_REPLICAS', [])
+        if not replicas:
+            raise CommandError('No hay réplicas configuradas (DJANGO_DB_REPLICAS).')
+        primary = connections['default'].settings_dict
+        if primary['ENGINE'] != 'django.db.backends.sqlite3':
+            raise CommandError('sync_replicas solo copia bases SQLite; use la replicación del motor.')
+        for alias in replicas:
+            connections[alias].close()
+            copy_database(primary['NAME'], connections[alias].settings_dict['NAME'])
+            self.stdout.write(self.style.SUCCESS(f'{alias}: copiada desde la primaria.'))
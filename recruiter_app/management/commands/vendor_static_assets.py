@@ -0,0 +1,45 @@
+import base64
+import hashlib
+import os
+import re
+import urllib.request
+
+from django.core.management.base import BaseCommand, CommandError
+
+from recruiter_app.assets import VENDOR_ASSETS
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'static')
+# Los .map no se copian: ManifestStaticFilesStorage fallaría al no encontrarlos
+SOURCE_MAP_RE = re.compile(rb'\n?/[*/]# sourceMappingURL=\S+(?: \*/)?\s*$')
+
+
+def integrity(data, algorithm='sha384'):
+    return f'{algorithm}-{base64.b64encode(hashlib.new(algorithm, data).digest()).decode()}'
+
+
+class Command(BaseCommand):
+    help = (
+        'Descarga los archivos de terceros (Bootstrap) a recruiter_app/static/'
+        'recruiter_app/vendor/, comprobando su integridad SRI. Se ejecuta al '
+        'cambiar de versión; los archivos descargados se guardan en el repositorio.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--timeout', type=float, default=30, help='Segundos por descarga.')
+
+    def handle(self, *args, **options):
+        for url, name, expected in VENDOR_ASSETS:
+            try:
+                with urllib.request.urlopen(url, timeout=options['timeout']) as response:
+                    data = response.read()
+            except OSError as exc:
+                raise CommandError(f'No se pudo descargar {url}: {exc}')
+            algorithm = expected.split('-', 1)[0]
+            if integrity(data, algorithm) != expected:
+                raise CommandError(f'{url} no coincide con la integridad esperada {expected}.')
+            path = os.path.join(STATIC_DIR, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as file:
+                file.write(SOURCE_MAP_RE.sub(b'\n', data))
+            self.stdout.write(f'{name} ({len(data) // 1024} KB)')
+        self.stdout.write(self.style.SUCCESS(f'{len(VENDOR_ASSETS)} archivos actualizados.'))
@@ -0,0 +1,73 @@
+# recruiter_app/middleware.py
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from . import routers
+from .assets import serve_static
+
+
+class PrimaryStickinessMiddleware:
+    """
+    Prepara el estado de enrutamiento de cada petición (ver recruiter_app/routers.py).
+    Si la petición escribió en la base de datos deja una cookie para que las
+    siguientes lean de la primaria mientras las réplicas se ponen al día.
+    Funciona con WSGI y ASGI (las vistas async no pasan por un hilo extra).
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = self.start(request)
+        try:
+            return self.finish(self.get_response(request))
+        finally:
+            routers.end_request(token)
+
+    async def __acall__(self, request):
+        token = self.start(request)
+        try:
+            return self.finish(await self.get_response(request))
+        finally:
+            routers.end_request(token)
+
+    def start(self, request):
+        return routers.start_request(pinned=routers.STICKY_COOKIE in request.COOKIES)
+
+    def finish(self, response):
+        if routers.current_state().wrote:
+            response.set_cookie(
+                routers.STICKY_COOKIE, '1', max_age=routers.sticky_seconds(), httponly=True, samesite='Lax',
+            )
+        return response
+
+
+class StaticAssetMiddleware:
+    """
+    Sirve los archivos recopilados en ``STATIC_ROOT`` con sus variantes
+    precomprimidas y cabeceras de caché (ver recruiter_app/assets.py). Va
+    primero en MIDDLEWARE: un estático no abre la sesión ni resuelve el usuario.
+    Las demás peticiones siguen su camino sin cambios.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = serve_static(request)
+        return response if response is not None else self.get_response(request)
+
+    async def __acall__(self, request):
+        response = serve_static(request)
+        return response if response is not None else await self.get_response(request)
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+from recruiter_app.fts import JOB_POSTING_INDEX
+
+
+def create_index(apps, schema_editor):
+    # FTS5 solo existe en SQLite; otros motores usan SimpleSearchBackend.
+    if JOB_POSTING_INDEX.install(schema_editor.connection):
+        JOB_POSTING_INDEX.rebuild(schema_editor.connection)
+
+
+def drop_index(apps, schema_editor):
+    JOB_POSTING_INDEX.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_app', '0002_alter_application_status_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
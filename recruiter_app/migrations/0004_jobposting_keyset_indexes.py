@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-17 15:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_app', '0003_jobposting_fts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['-created_at', '-id'], name='job_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['recruiter', '-created_at', '-id'], name='job_recruiter_created_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-17 15:45
+
+import recruiter_app.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_app', '0004_jobposting_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='cv_filename',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='cv_sha256',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='cv',
+            field=models.FileField(storage=recruiter_app.storage.cv_storage, upload_to='cvs/'),
+        ),
+    ]
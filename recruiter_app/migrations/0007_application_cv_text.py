@@ -0,0 +1,37 @@
+# Generated by Django 5.1.15 on 2026-10-17 15:53
+
+from django.db import migrations, models
+
+from recruiter_app.fts import CANDIDATE_INDEX
+
+
+def create_index(apps, schema_editor):
+    # Las postulaciones existentes entran con sus respuestas; el texto de los
+    # CVs se agrega al ejecutar `manage.py extract_cv_texts`.
+    if CANDIDATE_INDEX.install(schema_editor.connection):
+        CANDIDATE_INDEX.rebuild(schema_editor.connection)
+
+
+def drop_index(apps, schema_editor):
+    CANDIDATE_INDEX.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_app', '0006_task_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='cv_text',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='cv_text_extracted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.15 on 2026-10-17 16:02
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_counters(apps, schema_editor):
+    JobPosting = apps.get_model('recruiter_app', 'JobPosting')
+    jobs = JobPosting.objects.annotate(
+        total=Count('applications'),
+        pending=Count('applications', filter=Q(applications__status='pending')),
+        accepted=Count('applications', filter=Q(applications__status='accepted')),
+        rejected=Count('applications', filter=Q(applications__status='rejected')),
+    ).filter(total__gt=0)
+    for job in jobs.iterator(chunk_size=500):
+        JobPosting.objects.filter(pk=job.pk).update(
+            applications_total=job.total, applications_pending=job.pending,
+            applications_accepted=job.accepted, applications_rejected=job.rejected,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_app', '0007_application_cv_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='applications_accepted',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='applications_pending',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='applications_rejected',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='applications_total',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
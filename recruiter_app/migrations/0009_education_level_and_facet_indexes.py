@@ -0,0 +1,119 @@
+# Generated by Django 5.1.15 on 2026-10-17 16:08
+
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Niveles iniciales con las palabras que identifican cada uno en el texto libre
+# anterior. Se revisan de menor a mayor nivel: "Técnico o universitario" queda
+# como Técnica, que es el mínimo que pide la oferta.
+LEVELS = [
+    ('Sin requisito', 0, ()),
+    ('Secundaria', 10, ('secundari',)),
+    ('Técnica', 20, ('tecnic',)),
+    ('Universitaria', 30, ('universit', 'pregrado')),
+    ('Bachiller', 40, ('bachiller',)),
+    ('Titulado', 50, ('titul', 'licenciad')),
+    ('Maestría', 60, ('maestr', 'magister', 'posgrado')),
+]
+
+
+def normalize(text):
+    text = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in text if not unicodedata.combining(char)).lower().strip()
+
+
+def create_levels(apps, schema_editor):
+    EducationLevel = apps.get_model('recruiter_app', 'EducationLevel')
+    EducationLevel.objects.bulk_create(EducationLevel(name=name, rank=rank) for name, rank, _ in LEVELS)
+
+
+def assign_levels(apps, schema_editor):
+    EducationLevel = apps.get_model('recruiter_app', 'EducationLevel')
+    JobPosting = apps.get_model('recruiter_app', 'JobPosting')
+    levels = {level.name: level for level in EducationLevel.objects.all()}
+    next_rank = max(level.rank for level in levels.values()) + 10
+
+    for text in JobPosting.objects.values_list('min_education', flat=True).distinct():
+        normalized = normalize(text)
+        match = next((
+            name for name, _, keywords in LEVELS
+            if (not keywords and not normalized) or any(keyword in normalized for keyword in keywords)
+        ), None)
+        if match is None:
+            # Valor sin equivalente: se conserva como un nivel nuevo
+            match = text.strip()
+            if match not in levels:
+                levels[match] = EducationLevel.objects.create(name=match, rank=next_rank)
+                next_rank += 10
+        JobPosting.objects.filter(min_education=text).update(min_education_level=levels[match])
+
+
+def restore_text(apps, schema_editor):
+    JobPosting = apps.get_model('recruiter_app', 'JobPosting')
+    for job in JobPosting.objects.select_related('min_education_level').iterator(chunk_size=500):
+        JobPosting.objects.filter(pk=job.pk).update(min_education=job.min_education_level.name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_app', '0008_jobposting_application_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EducationLevel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('rank', models.PositiveSmallIntegerField(unique=True)),
+            ],
+            options={
+                'ordering': ['rank'],
+            },
+        ),
+        migrations.RunPython(create_levels, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='jobposting',
+            name='min_education_level',
+            field=models.ForeignKey(
+                null=True, db_index=False, on_delete=django.db.models.deletion.PROTECT,
+                to='recruiter_app.educationlevel',
+            ),
+        ),
+        migrations.RunPython(assign_levels, restore_text),
+        # Sin cambios en la base; al revertir, la columna de texto se vuelve a
+        # crear con '' en las filas existentes antes de restore_text.
+        migrations.AlterField(
+            model_name='jobposting',
+            name='min_education',
+            field=models.CharField(max_length=100, blank=True),
+        ),
+        migrations.RemoveField(
+            model_name='jobposting',
+            name='min_education',
+        ),
+        migrations.RenameField(
+            model_name='jobposting',
+            old_name='min_education_level',
+            new_name='min_education',
+        ),
+        migrations.AlterField(
+            model_name='jobposting',
+            name='min_education',
+            field=models.ForeignKey(
+                db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='job_postings',
+                to='recruiter_app.educationlevel',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['salary'], name='job_salary_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['min_education', '-created_at', '-id'], name='job_education_created_idx'),
+        ),
+    ]
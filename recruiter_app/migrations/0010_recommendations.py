@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:08
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_app', '0009_education_level_and_facet_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecommendationTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100, unique=True)),
+                ('idf', models.FloatField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Recommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('job_posting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='recruiter_app.jobposting')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['student', '-score'], name='recommendation_student_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job_posting', 'student'), name='recommendation_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='StudentTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100)),
+                ('weight', models.FloatField()),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'student'], name='student_term_idx')],
+            },
+        ),
+    ]
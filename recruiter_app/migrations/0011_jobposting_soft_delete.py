@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_app', '0010_recommendations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', False)), fields=['deleted_at'], name='job_deleted_idx'),
+        ),
+    ]
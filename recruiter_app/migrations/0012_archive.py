@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:13
+
+import django.db.models.deletion
+import recruiter_app.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruiter_app', '0011_jobposting_soft_delete'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedJobPosting',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('recruiter_id', models.BigIntegerField()),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField()),
+                ('salary', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('min_education', models.CharField(max_length=100)),
+                ('created_at', models.DateTimeField()),
+                ('questions', models.JSONField(default=list)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['recruiter_id', '-created_at', '-id'], name='archived_job_recruiter_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedApplication',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('applicant_id', models.BigIntegerField()),
+                ('applicant_username', models.CharField(max_length=150)),
+                ('cv', models.FileField(storage=recruiter_app.storage.cv_storage, upload_to='cvs/')),
+                ('cv_sha256', models.CharField(blank=True, max_length=64)),
+                ('cv_filename', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('pending', 'Pendiente'), ('accepted', 'Aceptado'), ('rejected', 'Rechazado')], max_length=20)),
+                ('submitted_at', models.DateTimeField()),
+                ('answers', models.JSONField(default=list)),
+                ('job_posting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='recruiter_app.archivedjobposting')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['applicant_id', '-submitted_at'], name='archived_app_applicant_idx'), models.Index(fields=['cv'], name='archived_app_cv_idx')],
+            },
+        ),
+    ]
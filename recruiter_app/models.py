@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 
+from .storage import cv_storage
+
 class CustomUser(AbstractUser):
     """
     Modelo de usuario personalizado para diferenciar entre empresas y estudiantes.
@@ -8,6 +10,26 @@ class CustomUser(AbstractUser):
     """
     is_company = models.BooleanField(default=False)
 
+class EducationLevel(models.Model):
+    """
+    Nivel educativo mínimo de una oferta. Es una tabla pequeña para que el
+    filtro por educación sea una comparación de enteros indexada en lugar de
+    texto libre con variantes ("tecnico", "Técnica"...).
+    """
+    name = models.CharField(max_length=100, unique=True)
+    rank = models.PositiveSmallIntegerField(unique=True)  # Orden de menor a mayor nivel
+
+    class Meta:
+        ordering = ['rank']
+
+    def __str__(self):
+        return self.name
+
+class ActiveJobPostingManager(models.Manager):
+    """Oculta las ofertas eliminadas que el purgador aún no borró (ver recruiter_app/purge.py)."""
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
 class JobPosting(models.Model):
     """
     Modelo para la publicación de ofertas de empleo.
@@ -16,12 +38,53 @@ class JobPosting(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
     salary = models.DecimalField(max_digits=10, decimal_places=2)
-    min_education = models.CharField(max_length=100)
+    # Sin índice propio: lo cubre job_education_created_idx, que empieza por esta columna
+    min_education = models.ForeignKey(
+        EducationLevel, on_delete=models.PROTECT, related_name='job_postings', db_index=False,
+    )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Contadores de postulaciones mantenidos por recruiter_app/counters.py. Sin
+    # CHECK de no negativos: una desviación no debe romper las escrituras, se
+    # corrige con reconcile_application_counters.
+    applications_total = models.IntegerField(default=0, editable=False)
+    applications_pending = models.IntegerField(default=0, editable=False)
+    applications_accepted = models.IntegerField(default=0, editable=False)
+    applications_rejected = models.IntegerField(default=0, editable=False)
+    # Eliminación diferida: la oferta desaparece de inmediato de ``objects`` y
+    # la tarea purge_job_posting la borra después por lotes con lo que depende de ella.
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = ActiveJobPostingManager()
+    all_objects = models.Manager()
+
+    COUNTER_FIELDS = ('applications_total', 'applications_pending', 'applications_accepted', 'applications_rejected')
+
+    class Meta:
+        indexes = [
+            # Respaldan la paginación por cursor sobre (created_at, id)
+            models.Index(fields=['-created_at', '-id'], name='job_created_idx'),
+            models.Index(fields=['recruiter', '-created_at', '-id'], name='job_recruiter_created_idx'),
+            # Filtros de search_jobs (ver recruiter_app/facets.py). El de fecha
+            # usa job_created_idx, que empieza por created_at.
+            models.Index(fields=['salary'], name='job_salary_idx'),
+            models.Index(fields=['min_education', '-created_at', '-id'], name='job_education_created_idx'),
+            # Ofertas pendientes de purgar; parcial, así no crece con las activas
+            models.Index(fields=['deleted_at'], name='job_deleted_idx', condition=models.Q(deleted_at__isnull=False)),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # Al editar una oferta no se reescriben los contadores: el valor cargado
+        # en memoria puede estar atrasado y pisaría los incrementos con F().
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
 class Question(models.Model):
     """
     Modelo para preguntas personalizadas en una oferta de empleo.
@@ -45,16 +108,33 @@ class QuestionOption(models.Model):
         return self.text
     
     
+class ActiveApplicationManager(models.Manager):
+    """Oculta las postulaciones de ofertas eliminadas mientras se purgan."""
+    def get_queryset(self):
+        return super().get_queryset().filter(job_posting__deleted_at__isnull=True)
+
 class Application(models.Model):
     """
     Modelo para la postulación de un estudiante a una oferta de empleo.
     """
+    STATUS_CHOICES = [('pending', 'Pendiente'), ('accepted', 'Aceptado'), ('rejected', 'Rechazado')]
+
     job_posting = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='applications')
     applicant = models.ForeignKey('recruiter_app.CustomUser', on_delete=models.CASCADE, related_name='my_applications')
-    cv = models.FileField(upload_to='cvs/')
-    status = models.CharField(max_length=20, choices=[('pending', 'Pendiente'), ('accepted', 'Aceptado'), ('rejected', 'Rechazado')], default='pending')
+    cv = models.FileField(upload_to='cvs/', storage=cv_storage)
+    # Hash del contenido (los CVs se guardan una sola vez por hash) y nombre original
+    cv_sha256 = models.CharField(max_length=64, blank=True, db_index=True)
+    cv_filename = models.CharField(max_length=255, blank=True)
+    # Texto del CV extraído en segundo plano (tarea extract_cv_text) para el
+    # índice de candidatos; los listados lo excluyen con defer().
+    cv_text = models.TextField(blank=True, editable=False)
+    cv_text_extracted_at = models.DateTimeField(null=True, blank=True, editable=False)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     submitted_at = models.DateTimeField(auto_now_add=True)
-    
+
+    objects = ActiveApplicationManager()
+    all_objects = models.Manager()
+
     def __str__(self):
         return f'Postulación para {self.job_posting.title} de {self.applicant.username}'
 
@@ -67,4 +147,130 @@ class Answer(models.Model):
     answer_text = models.TextField()
 
     def __str__(self):
-        return f'Respuesta a {self.question.text} por {self.application.applicant.username}'
\ No newline at end of file
+        return f'Respuesta a {self.question.text} por {self.application.applicant.username}'
+
+
+class Task(models.Model):
+    """
+    Tarea en segundo plano guardada en la base de datos (ver recruiter_app/taskqueue.py).
+    La ejecutan los procesos de `manage.py run_task_worker`.
+    """
+    STATUS_CHOICES = [
+        ('queued', 'En cola'),
+        ('running', 'En ejecución'),
+        ('done', 'Completada'),
+        ('failed', 'Fallida'),
+    ]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    # Evita encolar dos veces el mismo trabajo (p. ej. un reintento del navegador)
+    idempotency_key = models.CharField(max_length=200, unique=True, null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_at = models.DateTimeField()
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Consulta del worker: la siguiente tarea en cola cuyo run_at ya pasó
+            models.Index(fields=['status', 'run_at', 'id'], name='task_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.name} #{self.pk} ({self.status})'
+
+
+class Recommendation(models.Model):
+    """
+    Oferta recomendada a un estudiante, precalculada por recruiter_app/recommendations.py.
+    Cada estudiante tiene como mucho RECOMMENDATIONS_PER_STUDENT filas.
+    """
+    student = models.ForeignKey('recruiter_app.CustomUser', on_delete=models.CASCADE, related_name='recommendations')
+    job_posting = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='+')
+    score = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['job_posting', 'student'], name='recommendation_unique'),
+        ]
+        indexes = [
+            # Lectura del dashboard: las mejores recomendaciones de un estudiante
+            models.Index(fields=['student', '-score'], name='recommendation_student_idx'),
+        ]
+
+
+class RecommendationTerm(models.Model):
+    """IDF de cada término de las ofertas, calculado en la última reconstrucción."""
+    term = models.CharField(max_length=100, unique=True)
+    idf = models.FloatField()
+
+
+class StudentTerm(models.Model):
+    """
+    Peso de un término en el perfil de un estudiante (sus postulaciones y su
+    CV). Indexado por término para puntuar una oferta nueva solo contra los
+    estudiantes que comparten alguno de sus términos.
+    """
+    student = models.ForeignKey('recruiter_app.CustomUser', on_delete=models.CASCADE, related_name='+')
+    term = models.CharField(max_length=100)
+    weight = models.FloatField()
+
+    class Meta:
+        indexes = [models.Index(fields=['term', 'student'], name='student_term_idx')]
+
+
+class ArchivedJobPosting(models.Model):
+    """
+    Oferta antigua movida fuera de las tablas activas por archive_job_postings
+    (ver recruiter_app/archive.py). Conserva el id original. Las preguntas y
+    sus opciones se guardan en ``questions``. No tiene claves foráneas hacia
+    las tablas activas para poder vivir en otra base (``ARCHIVE_DATABASE``).
+    """
+    id = models.BigIntegerField(primary_key=True)
+    recruiter_id = models.BigIntegerField()
+    title = models.CharField(max_length=200)
+    description = models.TextField()
+    salary = models.DecimalField(max_digits=10, decimal_places=2)
+    min_education = models.CharField(max_length=100)
+    created_at = models.DateTimeField()
+    # [{"id": ..., "text": ..., "question_type": ..., "options": [...]}]
+    questions = models.JSONField(default=list)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['recruiter_id', '-created_at', '-id'], name='archived_job_recruiter_idx'),
+        ]
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedApplication(models.Model):
+    """
+    Postulación de una oferta archivada, con sus respuestas en ``answers``. El
+    texto extraído del CV no se archiva: solo servía al índice de candidatos.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    job_posting = models.ForeignKey(ArchivedJobPosting, on_delete=models.CASCADE, related_name='applications')
+    applicant_id = models.BigIntegerField()
+    applicant_username = models.CharField(max_length=150)
+    cv = models.FileField(upload_to='cvs/', storage=cv_storage)
+    cv_sha256 = models.CharField(max_length=64, blank=True)
+    cv_filename = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    submitted_at = models.DateTimeField()
+    # [{"question": ..., "answer": ...}]
+    answers = models.JSONField(default=list)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['applicant_id', '-submitted_at'], name='archived_app_applicant_idx'),
+            models.Index(fields=['cv'], name='archived_app_cv_idx'),
+        ]
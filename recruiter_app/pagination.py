@@ -0,0 +1,144 @@
+# recruiter_app/pagination.py
+"""
+Paginación por cursor (keyset) para los listados de ofertas.
+
+En lugar de OFFSET, cada página filtra por los valores de ordenación de la
+última fila de la página anterior, de modo que el costo de cualquier página es
+el mismo y se apoya en los índices compuestos de ``JobPosting``.
+"""
+import base64
+import binascii
+import datetime
+import json
+
+from django.conf import settings
+from django.core.exceptions import BadRequest, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class KeysetPage:
+    """Una página de resultados y el cursor para pedir la siguiente."""
+
+    def __init__(self, items, next_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """Como DjangoJSONEncoder pero sin recortar los microsegundos de las fechas."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values):
+    payload = json.dumps(values, cls=CursorEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, fields):
+    """
+    Valores del cursor convertidos con ``to_python()`` de cada campo de la
+    ordenación. El cursor llega en la URL: cualquier valor que no sea del tipo
+    del campo es una petición inválida (400), no un error del servidor.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, binascii.Error):
+        raise BadRequest('Cursor de paginación inválido.')
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise BadRequest('Cursor de paginación inválido.')
+    try:
+        values = [field.to_python(value) for field, value in zip(fields, values)]
+    except (ValidationError, TypeError, ValueError):
+        raise BadRequest('Cursor de paginación inválido.')
+    if any(value is None for value in values):
+        raise BadRequest('Cursor de paginación inválido.')
+    return values
+
+
+def ordering_fields(queryset, ordering):
+    """Campo del modelo (o de la anotación, p. ej. ``search_rank``) de cada columna de ``ordering``."""
+    fields = []
+    for field in ordering:
+        name = field.lstrip('-')
+        annotation = queryset.query.annotations.get(name)
+        fields.append(annotation.output_field if annotation is not None else queryset.model._meta.get_field(name))
+    return fields
+
+
+def get_page_size(request):
+    """Tamaño de página pedido en ``?page_size=`` o el configurado en settings."""
+    default = getattr(settings, 'JOB_LIST_PAGE_SIZE', DEFAULT_PAGE_SIZE)
+    try:
+        size = int(request.GET.get('page_size', default))
+    except ValueError:
+        size = default
+    return max(1, min(size, MAX_PAGE_SIZE))
+
+
+def _after(ordering, values):
+    """
+    Construye la condición "fila posterior al cursor" para una ordenación
+    compuesta, p. ej. para ('-created_at', '-id'):
+    created_at < v0 OR (created_at = v0 AND id < v1).
+    """
+    condition = Q()
+    for position, field in enumerate(ordering):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        step = Q(**{f'{name}__{lookup}': values[position]})
+        for previous, value in zip(ordering[:position], values):
+            step &= Q(**{previous.lstrip('-'): value})
+        condition |= step
+    return condition
+
+
+def _page_queryset(queryset, ordering, cursor, page_size):
+    if cursor:
+        queryset = queryset.filter(_after(ordering, decode_cursor(cursor, ordering_fields(queryset, ordering))))
+    # Se pide una fila extra solo para saber si existe una página siguiente.
+    return queryset.order_by(*ordering)[:page_size + 1]
+
+
+def _build_page(items, ordering, page_size):
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, field.lstrip('-')) for field in ordering])
+    return KeysetPage(items, next_cursor)
+
+
+def keyset_paginate(queryset, ordering, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Devuelve la página de ``queryset`` posterior a ``cursor`` según
+    ``ordering``, que debe terminar en un campo único (normalmente ``id``).
+    """
+    ordering = tuple(ordering)
+    items = list(_page_queryset(queryset, ordering, cursor, page_size))
+    return _build_page(items, ordering, page_size)
+
+
+async def akeyset_paginate(queryset, ordering, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """Versión asíncrona de ``keyset_paginate`` (ORM asíncrono)."""
+    ordering = tuple(ordering)
+    items = [item async for item in _page_queryset(queryset, ordering, cursor, page_size)]
+    return _build_page(items, ordering, page_size)
@@ -0,0 +1,294 @@
+# recruiter_app/perf.py
+"""
+Métricas de rendimiento por vista.
+
+``PerfMiddleware`` mide cada petición (tiempo total, número y tiempo de
+consultas SQL, tiempo de render de plantillas), marca las consultas lentas y
+los patrones N+1 (la misma consulta repetida muchas veces en una petición),
+añade la cabecera ``Server-Timing`` y acumula todo en ``STATS`` agrupado por
+el nombre de la URL. ``perf_metrics`` (solo staff) expone el agregado como
+JSON o en formato de texto de Prometheus.
+
+El agregado vive en la memoria de cada proceso: con varios workers cada uno
+reporta lo suyo. Para el tiempo de plantillas, ``TEMPLATES`` usa el backend
+``InstrumentedDjangoTemplates``. En respuestas en streaming solo se mide
+hasta que la vista devuelve la respuesta, no el envío del contenido.
+"""
+import logging
+import statistics
+import threading
+import time
+from collections import Counter, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.template.backends.django import DjangoTemplates
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_MS = 100
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+DEFAULT_WINDOW = 500
+UNRESOLVED = 'unresolved'
+
+_current = ContextVar('recruiter_app_request_metrics', default=None)
+
+
+def monitoring_enabled():
+    return getattr(settings, 'PERF_MONITORING', False)
+
+
+def slow_query_seconds():
+    return getattr(settings, 'PERF_SLOW_QUERY_MS', DEFAULT_SLOW_QUERY_MS) / 1000
+
+
+def n_plus_one_threshold():
+    return getattr(settings, 'PERF_N_PLUS_ONE_THRESHOLD', DEFAULT_N_PLUS_ONE_THRESHOLD)
+
+
+class RequestMetrics:
+    """Mediciones de una petición."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.template_depth = 0
+        self.slow_queries = []
+        self.statements = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        # Envoltorio de connection.execute_wrapper()
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.queries += 1
+            self.db_time += elapsed
+            self.statements[sql] += 1
+            if elapsed >= slow_query_seconds():
+                self.slow_queries.append((elapsed, sql))
+
+    def repeated_statements(self):
+        """Consultas idénticas (salvo parámetros) repetidas al menos el umbral de N+1."""
+        threshold = n_plus_one_threshold()
+        return [(sql, count) for sql, count in self.statements.items() if count >= threshold]
+
+
+class ViewStats:
+    """Acumulado de una vista: totales desde el arranque y ventana de tiempos recientes."""
+
+    def __init__(self, window):
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.slow_queries = 0
+        self.n_plus_one = 0
+        self.recent = deque(maxlen=window)
+        self.last_n_plus_one = None
+
+    def as_dict(self):
+        recent = sorted(self.recent)
+
+        def percentile(fraction):
+            return round(recent[min(len(recent) - 1, int(fraction * len(recent)))] * 1000, 2) if recent else None
+
+        return {
+            'requests': self.count,
+            'errors': self.errors,
+            'mean_ms': round(statistics.fmean(recent) * 1000, 2) if recent else None,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'max_ms': round(recent[-1] * 1000, 2) if recent else None,
+            'queries_per_request': round(self.queries / self.count, 2),
+            'db_ms_per_request': round(self.db_time * 1000 / self.count, 2),
+            'template_ms_per_request': round(self.template_time * 1000 / self.count, 2),
+            'slow_queries': self.slow_queries,
+            'n_plus_one': self.n_plus_one,
+            'last_n_plus_one': self.last_n_plus_one,
+        }
+
+
+class PerfStats:
+    """Agregado en memoria de todas las vistas, seguro entre hilos."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.views = {}
+
+    def record(self, view, wall_time, metrics, status_code):
+        repeated = metrics.repeated_statements()
+        window = getattr(settings, 'PERF_WINDOW', DEFAULT_WINDOW)
+        with self.lock:
+            stats = self.views.get(view)
+            if stats is None:
+                stats = self.views[view] = ViewStats(window)
+            stats.count += 1
+            stats.errors += status_code >= 500
+            stats.total_time += wall_time
+            stats.queries += metrics.queries
+            stats.db_time += metrics.db_time
+            stats.template_time += metrics.template_time
+            stats.slow_queries += len(metrics.slow_queries)
+            stats.recent.append(wall_time)
+            if repeated:
+                stats.n_plus_one += 1
+                sql, count = max(repeated, key=lambda item: item[1])
+                stats.last_n_plus_one = {'sql': sql[:500], 'count': count}
+
+    def reset(self):
+        with self.lock:
+            self.views.clear()
+
+    def snapshot(self):
+        with self.lock:
+            return {view: stats.as_dict() for view, stats in sorted(self.views.items())}
+
+    def prometheus(self):
+        """Texto en el formato de exposición de Prometheus."""
+        with self.lock:
+            views = sorted(self.views.items())
+            lines = [
+                '# HELP recruiter_request_seconds Tiempo total de las peticiones por vista.',
+                '# TYPE recruiter_request_seconds summary',
+            ]
+            for view, stats in views:
+                recent = sorted(stats.recent)
+                for quantile in (0.5, 0.95):
+                    if recent:
+                        value = recent[min(len(recent) - 1, int(quantile * len(recent)))]
+                        lines.append(f'recruiter_request_seconds{{view="{view}",quantile="{quantile}"}} {value:.6f}')
+                lines.append(f'recruiter_request_seconds_sum{{view="{view}"}} {stats.total_time:.6f}')
+                lines.append(f'recruiter_request_seconds_count{{view="{view}"}} {stats.count}')
+            counters = (
+                ('recruiter_request_errors_total', 'Respuestas 5xx.', 'errors', '{}'),
+                ('recruiter_db_queries_total', 'Consultas SQL ejecutadas.', 'queries', '{}'),
+                ('recruiter_db_seconds_total', 'Tiempo en consultas SQL.', 'db_time', '{:.6f}'),
+                ('recruiter_template_seconds_total', 'Tiempo de render de plantillas.', 'template_time', '{:.6f}'),
+                ('recruiter_slow_queries_total', 'Consultas más lentas que PERF_SLOW_QUERY_MS.', 'slow_queries', '{}'),
+                ('recruiter_n_plus_one_total', 'Peticiones con un patrón N+1.', 'n_plus_one', '{}'),
+            )
+            for name, help_text, attribute, value_format in counters:
+                lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+                lines += [
+                    f'{name}{{view="{view}"}} {value_format.format(getattr(stats, attribute))}'
+                    for view, stats in views
+                ]
+        return '\n'.join(lines) + '\n'
+
+
+STATS = PerfStats()
+
+
+def server_timing(wall_time, metrics):
+    return (
+        f'app;dur={wall_time * 1000:.1f}, '
+        f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.queries} queries", '
+        f'tpl;dur={metrics.template_time * 1000:.1f}'
+    )
+
+
+class PerfMiddleware:
+    """Mide cada petición y la agrega en ``STATS`` (ver el docstring del módulo)."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not monitoring_enabled():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                self.watch_queries(stack, metrics)
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, time.perf_counter() - started, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                # Las consultas de una petición ASGI corren en su hilo de
+                # sync_to_async: los envoltorios se instalan en las conexiones
+                # de ese hilo, no en las del bucle de eventos.
+                await sync_to_async(self.watch_queries)(stack, metrics)
+                try:
+                    response = await self.get_response(request)
+                finally:
+                    await sync_to_async(stack.close)()
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, time.perf_counter() - started, metrics)
+
+    def watch_queries(self, stack, metrics):
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics))
+
+    def finish(self, request, response, wall_time, metrics):
+        match = request.resolver_match
+        view = (match.url_name or match.view_name) if match else UNRESOLVED
+        STATS.record(view, wall_time, metrics, response.status_code)
+        self.log_flags(view, metrics)
+        if getattr(settings, 'PERF_SERVER_TIMING', True):
+            response['Server-Timing'] = server_timing(wall_time, metrics)
+        return response
+
+    def log_flags(self, view, metrics):
+        for elapsed, sql in metrics.slow_queries:
+            logger.warning('Consulta lenta en %s (%.1f ms): %s', view, elapsed * 1000, sql[:500])
+        for sql, count in metrics.repeated_statements():
+            logger.warning('Posible N+1 en %s: %d veces %s', view, count, sql[:500])
+
+
+class TimedTemplate:
+    """Plantilla que suma su tiempo de render a la petición en curso."""
+
+    def __init__(self, template):
+        self.template = template
+
+    def __getattr__(self, name):
+        return getattr(self.template, name)
+
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return self.template.render(context, request)
+        # Solo cuenta la plantilla exterior si una plantilla renderiza otra.
+        metrics.template_depth += 1
+        started = time.perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            metrics.template_depth -= 1
+            if not metrics.template_depth:
+                metrics.template_time += time.perf_counter() - started
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """Backend de plantillas de Django que mide el tiempo de render."""
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name))
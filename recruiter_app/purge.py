@@ -0,0 +1,146 @@
+# recruiter_app/purge.py
+"""
+Borrado diferido de ofertas eliminadas.
+
+delete_job_posting solo marca ``JobPosting.deleted_at``: los managers
+``objects`` de JobPosting y Application dejan de devolver la oferta y sus
+postulaciones en ese mismo momento. La tarea purge_job_posting (o
+``manage.py purge_deleted_job_postings``) borra después las filas con
+``DELETE ... WHERE id IN (...)`` en lotes de ``PURGE_BATCH_SIZE``, cada uno en
+su propia transacción, sin pasar por el Collector de Django: el bloqueo de
+escritura de SQLite se toma y se suelta por cada lote en lugar de mantenerse
+mientras se borran miles de postulaciones.
+
+Los CVs no se borran al confirmar: los archivos se comparten entre
+postulaciones con el mismo contenido, y una postulación nueva puede estar
+reutilizando el archivo antes de confirmarse (ContentAddressedStorage.save).
+Cada lote encola la tarea sweep_orphan_cvs para cuando pase
+``CV_ORPHAN_GRACE_SECONDS``. Esa tarea borra los archivos que siguen sin
+postulaciones y que nadie reutilizó en ese tiempo: al reutilizar un archivo,
+save() actualiza su fecha de modificación. ``manage.py sweep_orphan_cvs``
+barre toda la carpeta de CVs.
+"""
+import logging
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections, router, transaction
+
+from .models import Answer, Application, ArchivedApplication, JobPosting, Question, QuestionOption, Recommendation
+from .taskqueue import enqueue
+
+logger = logging.getLogger(__name__)
+
+PURGE_BATCH_SIZE = 500
+DEFAULT_CV_ORPHAN_GRACE = 3600  # segundos
+
+
+def delete_where(model, column, ids):
+    """
+    ``DELETE FROM <tabla> WHERE <columna> IN (...)``; devuelve las filas
+    borradas. Las listas largas se parten para no pasar del límite de
+    parámetros por consulta.
+    """
+    connection = connections[router.db_for_write(model)]
+    table, column = connection.ops.quote_name(model._meta.db_table), connection.ops.quote_name(column)
+    ids, deleted = list(ids), 0
+    with connection.cursor() as cursor:
+        for start in range(0, len(ids), PURGE_BATCH_SIZE):
+            chunk = ids[start:start + PURGE_BATCH_SIZE]
+            cursor.execute(f'DELETE FROM {table} WHERE {column} IN ({", ".join(["%s"] * len(chunk))})', chunk)
+            deleted += cursor.rowcount
+    return deleted
+
+
+def cv_orphan_grace():
+    return getattr(settings, 'CV_ORPHAN_GRACE_SECONDS', DEFAULT_CV_ORPHAN_GRACE)
+
+
+def schedule_cv_sweep(names):
+    """Encola el barrido de los CVs ``names`` para cuando termine el periodo de gracia."""
+    names = sorted(set(filter(None, names)))
+    if names:
+        enqueue('sweep_orphan_cvs', delay=cv_orphan_grace(), names=names)
+
+
+def remove_orphan_cvs(names, grace=None):
+    """
+    Borra del storage los CVs de ``names`` que ya no usa ninguna postulación y
+    que no se modificaron (ni reutilizaron) en los últimos ``grace`` segundos.
+    """
+    names = set(filter(None, names))
+    if not names:
+        return 0
+    used = set()
+    for chunk in chunked(sorted(names), PURGE_BATCH_SIZE):
+        used.update(Application.all_objects.filter(cv__in=chunk).values_list('cv', flat=True))
+        # Las postulaciones archivadas siguen usando sus CVs (ver recruiter_app/archive.py)
+        used.update(ArchivedApplication.objects.filter(cv__in=chunk).values_list('cv', flat=True))
+    storage = Application._meta.get_field('cv').storage
+    cutoff = time.time() - (cv_orphan_grace() if grace is None else grace)
+    removed = 0
+    for name in sorted(names - used):
+        try:
+            # La fecha se mira después de consultar la BD: un archivo reutilizado
+            # por una postulación aún sin confirmar ya tiene la fecha actual.
+            if storage.get_modified_time(name).timestamp() > cutoff:
+                continue
+            storage.delete(name)
+            removed += 1
+        except FileNotFoundError:
+            continue
+        except OSError:
+            logger.exception('No se pudo borrar el CV %s', name)
+    return removed
+
+
+def stored_cvs(directory='cvs'):
+    """Nombres de todos los archivos de ``directory`` en el storage de CVs."""
+    storage = Application._meta.get_field('cv').storage
+    if not storage.exists(directory):
+        return
+    directories, files = storage.listdir(directory)
+    for name in files:
+        yield f'{directory}/{name}'
+    for subdirectory in directories:
+        yield from stored_cvs(f'{directory}/{subdirectory}')
+
+
+def chunked(items, size):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def purge_job(job_id, batch_size=PURGE_BATCH_SIZE):
+    """
+    Borra la oferta eliminada ``job_id`` con sus postulaciones, respuestas,
+    preguntas, opciones y recomendaciones. Si se interrumpe, volver a
+    ejecutarla continúa donde quedó. Devuelve las filas borradas por modelo.
+    """
+    deleted = Counter()
+    if not JobPosting.all_objects.filter(id=job_id, deleted_at__isnull=False).exists():
+        return deleted  # Ya purgada, o no está eliminada
+
+    applications = Application.all_objects.filter(job_posting_id=job_id).order_by('id')
+    while rows := list(applications.values_list('id', 'cv')[:batch_size]):
+        ids = [application_id for application_id, _ in rows]
+        with transaction.atomic():
+            deleted[Answer] += delete_where(Answer, 'application_id', ids)
+            deleted[Application] += delete_where(Application, 'id', ids)
+            schedule_cv_sweep([cv for _, cv in rows])
+
+    questions = Question.objects.filter(job_posting_id=job_id).order_by('id').values_list('id', flat=True)
+    while ids := list(questions[:batch_size]):
+        with transaction.atomic():
+            deleted[QuestionOption] += delete_where(QuestionOption, 'question_id', ids)
+            deleted[Answer] += delete_where(Answer, 'question_id', ids)
+            deleted[Question] += delete_where(Question, 'id', ids)
+
+    recommendations = Recommendation.objects.filter(job_posting_id=job_id).values_list('id', flat=True)
+    while ids := list(recommendations[:batch_size]):
+        deleted[Recommendation] += delete_where(Recommendation, 'id', ids)
+
+    deleted[JobPosting] += delete_where(JobPosting, 'id', [job_id])
+    return deleted
@@ -0,0 +1,259 @@
+# recruiter_app/recommendations.py
+"""
+Recomendaciones de ofertas para estudiantes ("Recomendadas para ti" en el
+dashboard), precalculadas en la tabla Recommendation.
+
+Cada oferta es un vector TF-IDF de su título (con peso doble) y su
+descripción. El perfil de un estudiante es la suma de los vectores de las
+ofertas a las que postuló más el de su último CV, recortado a sus
+``PROFILE_TERMS`` términos más pesados. La afinidad es el coseno entre
+ambos y se guardan las ``RECOMMENDATIONS_PER_STUDENT`` mejores ofertas a las
+que el estudiante aún no postuló.
+
+- ``RecommendationBuilder`` (``manage.py build_recommendations``) recalcula
+  todo: vocabulario, IDF, perfiles y recomendaciones. Si NumPy y SciPy están
+  instalados el producto perfiles × ofertas es un producto de matrices
+  dispersas por bloques; si no, se recorre un índice invertido en Python.
+- ``refresh_job(job_id)`` (tarea refresh_job_recommendations, al crear o
+  editar una oferta) puntúa solo esa oferta contra los perfiles guardados,
+  con el IDF de la última reconstrucción, y la inserta donde supere a la
+  peor recomendación del estudiante. Las postulaciones nuevas cambian los
+  perfiles recién en la siguiente reconstrucción.
+"""
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+from django.db import transaction
+from django.db.models import Max
+
+from .models import Application, JobPosting, Recommendation, RecommendationTerm, StudentTerm
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # Dependencias opcionales
+    np = sparse = None
+
+RECOMMENDATIONS_PER_STUDENT = 10
+PROFILE_TERMS = 100
+TITLE_WEIGHT = 2
+CV_WEIGHT = 1.0  # Peso del CV frente a la suma de las ofertas postuladas (ya normalizada)
+BATCH_SIZE = 1000  # Filas por bulk_create y estudiantes por bloque del producto
+MAX_TERM_LENGTH = 100
+
+TOKEN_RE = re.compile(r'[a-z0-9]{3,}')
+STOPWORDS = frozenset("""
+    las los del una uno unos unas por para con sin sus que como mas muy entre sobre desde hasta este esta
+    estos estas ese esa eso son ser sera hay tiene tener donde cuando nos les the and for with you our are
+""".split())
+
+
+def normalize(text):
+    text = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in text if not unicodedata.combining(char)).lower()
+
+
+def tokenize(text):
+    return [token for token in TOKEN_RE.findall(normalize(text)) if token not in STOPWORDS and len(token) <= MAX_TERM_LENGTH]
+
+
+def posting_terms(title, description):
+    return Counter(tokenize(title) * TITLE_WEIGHT + tokenize(description))
+
+
+def normalized(vector):
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    return {term: weight / norm for term, weight in vector.items()} if norm else {}
+
+
+def weigh(counts, idf, default_idf=None):
+    """Vector TF-IDF normalizado ``{término: peso}`` con tf sublineal (1 + log tf)."""
+    vector = {}
+    for term, count in counts.items():
+        term_idf = idf.get(term, default_idf)
+        if term_idf:
+            vector[term] = (1 + math.log(count)) * term_idf
+    return normalized(vector)
+
+
+def truncated(vector, size):
+    return normalized(dict(heapq.nlargest(size, vector.items(), key=itemgetter(1))))
+
+
+class RecommendationBuilder:
+    """Reconstruye todas las recomendaciones. ``log`` recibe el progreso."""
+
+    def __init__(self, k=RECOMMENDATIONS_PER_STUDENT, profile_terms=PROFILE_TERMS, batch_size=BATCH_SIZE, log=None):
+        self.k = k
+        self.profile_terms = profile_terms
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+
+    def run(self):
+        """Devuelve ``(ofertas, estudiantes, recomendaciones)``."""
+        job_ids, counts = [], []
+        for job_id, title, description in JobPosting.objects.values_list('id', 'title', 'description').iterator(
+            chunk_size=self.batch_size,
+        ):
+            job_ids.append(job_id)
+            counts.append(posting_terms(title, description))
+        frequencies = Counter(term for terms in counts for term in terms)
+        idf = {term: math.log((1 + len(job_ids)) / (1 + frequency)) + 1 for term, frequency in frequencies.items()}
+        job_vectors = [weigh(terms, idf) for terms in counts]
+        self.log(f'{len(job_ids)} ofertas, {len(idf)} términos')
+
+        profiles, applied = self.student_profiles(dict(zip(job_ids, job_vectors)), idf)
+        self.log(f'{len(profiles)} perfiles de estudiantes')
+        score = self.score_sparse if sparse is not None else self.score_python
+        recommendations = list(score(job_ids, job_vectors, profiles, applied))
+        self.save(idf, profiles, recommendations)
+        return len(job_ids), len(profiles), len(recommendations)
+
+    def student_profiles(self, vectors, idf):
+        """Perfiles ``{estudiante: vector}`` y ofertas ya postuladas ``{estudiante: {oferta}}``."""
+        sums, applied = defaultdict(Counter), defaultdict(set)
+        for student_id, job_id in Application.objects.values_list('applicant_id', 'job_posting_id').iterator(
+            chunk_size=self.batch_size,
+        ):
+            applied[student_id].add(job_id)
+            sums[student_id].update(vectors.get(job_id, {}))
+
+        latest_cvs = (
+            Application.objects.exclude(cv_text='').values('applicant_id').annotate(latest=Max('id')).values('latest')
+        )
+        for student_id, cv_text in Application.objects.filter(id__in=latest_cvs).values_list(
+            'applicant_id', 'cv_text',
+        ).iterator(chunk_size=100):
+            cv_vector = weigh(Counter(tokenize(cv_text)), idf)
+            sums[student_id].update({term: weight * CV_WEIGHT for term, weight in cv_vector.items()})
+
+        profiles = {}
+        for student_id, vector in sums.items():
+            profile = truncated(vector, self.profile_terms)
+            if profile:
+                profiles[student_id] = profile
+        return profiles, applied
+
+    def best(self, student_id, scores, applied):
+        """Las ``k`` mejores ``(oferta, puntaje)`` de un estudiante sin las ya postuladas."""
+        candidates = ((job_id, score) for job_id, score in scores if score > 0 and job_id not in applied[student_id])
+        return heapq.nlargest(self.k, candidates, key=itemgetter(1))
+
+    def score_python(self, job_ids, job_vectors, profiles, applied):
+        postings = defaultdict(list)
+        for job_id, vector in zip(job_ids, job_vectors):
+            for term, weight in vector.items():
+                postings[term].append((job_id, weight))
+        for student_id, profile in profiles.items():
+            scores = defaultdict(float)
+            for term, weight in profile.items():
+                for job_id, job_weight in postings.get(term, ()):
+                    scores[job_id] += weight * job_weight
+            for job_id, score in self.best(student_id, scores.items(), applied):
+                yield student_id, job_id, score
+
+    def score_sparse(self, job_ids, job_vectors, profiles, applied):
+        columns = {term: column for column, term in enumerate({term for vector in job_vectors for term in vector})}
+        student_ids = list(profiles)
+        jobs = self.matrix(job_vectors, columns).T.tocsr()
+        students = self.matrix([profiles[student_id] for student_id in student_ids], columns)
+        job_ids = np.asarray(job_ids)
+        # Por bloques: el resultado de todos los estudiantes a la vez no cabría en memoria
+        for start in range(0, len(student_ids), self.batch_size):
+            block = students[start:start + self.batch_size] @ jobs
+            for row, student_id in enumerate(student_ids[start:start + self.batch_size]):
+                begin, end = block.indptr[row], block.indptr[row + 1]
+                scores = zip(job_ids[block.indices[begin:end]].tolist(), block.data[begin:end].tolist())
+                for job_id, score in self.best(student_id, scores, applied):
+                    yield student_id, job_id, score
+
+    def matrix(self, vectors, columns):
+        """Matriz CSR de ``vectors`` (una fila por vector, una columna por término)."""
+        indptr, indices, data = [0], [], []
+        for vector in vectors:
+            for term, weight in vector.items():
+                indices.append(columns[term])
+                data.append(weight)
+            indptr.append(len(indices))
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(vectors), len(columns)), dtype=np.float64)
+
+    @transaction.atomic
+    def save(self, idf, profiles, recommendations):
+        for model in (Recommendation, StudentTerm, RecommendationTerm):
+            model.objects.all().delete()
+        RecommendationTerm.objects.bulk_create(
+            (RecommendationTerm(term=term, idf=value) for term, value in idf.items()), batch_size=self.batch_size,
+        )
+        StudentTerm.objects.bulk_create(
+            (
+                StudentTerm(student_id=student_id, term=term, weight=weight)
+                for student_id, profile in profiles.items() for term, weight in profile.items()
+            ),
+            batch_size=self.batch_size,
+        )
+        Recommendation.objects.bulk_create(
+            (Recommendation(student_id=s, job_posting_id=j, score=score) for s, j, score in recommendations),
+            batch_size=self.batch_size,
+        )
+
+
+def refresh_job(job_id, k=RECOMMENDATIONS_PER_STUDENT):
+    """
+    Actualiza las recomendaciones de la oferta ``job_id`` tras crearla o
+    editarla. Devuelve cuántos estudiantes la tienen ahora recomendada. Si al
+    editarla deja de estar entre las mejores de un estudiante, este se queda
+    con una recomendación menos hasta la siguiente reconstrucción.
+    """
+    job = JobPosting.objects.filter(id=job_id).values_list('title', 'description').first()
+    # Un término que no estaba en ninguna oferta es tan raro como el más raro conocido
+    default_idf = RecommendationTerm.objects.aggregate(Max('idf'))['idf__max']
+    if job is None or default_idf is None:
+        return 0  # Oferta eliminada o recomendaciones aún sin construir
+    counts = posting_terms(*job)
+    idf = dict(RecommendationTerm.objects.filter(term__in=list(counts)).values_list('term', 'idf'))
+    vector = weigh(counts, idf, default_idf)
+
+    scores = defaultdict(float)
+    for student_id, term, weight in StudentTerm.objects.filter(term__in=list(vector)).values_list(
+        'student_id', 'term', 'weight',
+    ).iterator(chunk_size=BATCH_SIZE):
+        scores[student_id] += weight * vector[term]
+    applied = set(Application.objects.filter(job_posting_id=job_id).values_list('applicant_id', flat=True))
+    candidates = {student_id: score for student_id, score in scores.items() if score > 0 and student_id not in applied}
+
+    current = defaultdict(list)
+    student_ids = list(candidates)
+    for start in range(0, len(student_ids), BATCH_SIZE):
+        for recommendation_id, student_id, score in Recommendation.objects.filter(
+            student_id__in=student_ids[start:start + BATCH_SIZE],
+        ).exclude(job_posting_id=job_id).values_list('id', 'student_id', 'score'):
+            current[student_id].append((score, recommendation_id))
+
+    to_create, to_delete = [], []
+    for student_id, score in candidates.items():
+        if len(current[student_id]) >= k:
+            worst_score, worst_id = min(current[student_id])
+            if score <= worst_score:
+                continue
+            to_delete.append(worst_id)
+        to_create.append(Recommendation(student_id=student_id, job_posting_id=job_id, score=score))
+
+    with transaction.atomic():
+        Recommendation.objects.filter(job_posting_id=job_id).delete()
+        for start in range(0, len(to_delete), BATCH_SIZE):
+            Recommendation.objects.filter(id__in=to_delete[start:start + BATCH_SIZE]).delete()
+        Recommendation.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+    return len(to_create)
+
+
+def recommended_for(student, k=RECOMMENDATIONS_PER_STUDENT):
+    """Recomendaciones del dashboard: una lectura por el índice recommendation_student_idx."""
+    return (
+        Recommendation.objects.filter(student=student, job_posting__deleted_at__isnull=True).select_related('job_posting')
+        .only('score', 'job_posting__id', 'job_posting__title', 'job_posting__salary')
+        .order_by('-score')[:k]
+    )
@@ -0,0 +1,155 @@
+# recruiter_app/routers.py
+"""
+Enrutamiento primaria/réplicas.
+
+Las escrituras van siempre a ``default`` (la primaria). Las lecturas de las
+vistas marcadas con ``@replica_reads`` van a una de las réplicas de
+``DATABASE_REPLICAS``, salvo que la misma petición ya haya escrito o que el
+navegador haya escrito hace poco (cookie de ``PrimaryStickinessMiddleware``):
+así un usuario siempre ve sus propios cambios aunque la réplica vaya atrasada.
+Sin réplicas configuradas todo sigue yendo a ``default``. Lo que se guarda
+en la caché compartida se lee dentro de ``primary_reads()``: una réplica
+atrasada no debe rellenarla para todos los usuarios.
+
+Las tablas de archivo (ver recruiter_app/archive.py) van a
+``ARCHIVE_DATABASE`` si está configurada, tanto para leer como para escribir;
+si no, a ``default`` como las demás.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+
+from django.conf import settings
+
+PRIMARY = 'default'
+STICKY_COOKIE = 'primary_pin'
+DEFAULT_STICKY_SECONDS = 10
+# Apps cuyas lecturas nunca van a las réplicas: la sesión se escribe en casi
+# todas las peticiones y una copia atrasada cerraría la sesión del usuario.
+PRIMARY_ONLY_APPS = {'sessions'}
+ARCHIVE_MODELS = {'archivedjobposting', 'archivedapplication'}
+
+
+class RoutingState:
+    """Estado de enrutamiento de una petición."""
+
+    def __init__(self, pinned=False):
+        self.pinned = pinned  # Lecturas forzadas a la primaria
+        self.use_replica = False  # Dentro de una vista de solo lectura
+        self.wrote = False
+
+
+_state = ContextVar('recruiter_app_routing_state', default=None)
+
+
+def start_request(pinned=False):
+    return _state.set(RoutingState(pinned))
+
+
+def end_request(token):
+    _state.reset(token)
+
+
+def current_state():
+    return _state.get()
+
+
+def replica_aliases():
+    return list(getattr(settings, 'DATABASE_REPLICAS', ()))
+
+
+def archive_alias():
+    return getattr(settings, 'ARCHIVE_DATABASE', None) or PRIMARY
+
+
+def is_archive_model(app_label, model_name):
+    return app_label == 'recruiter_app' and model_name in ARCHIVE_MODELS
+
+
+def sticky_seconds():
+    return getattr(settings, 'PRIMARY_STICKY_SECONDS', DEFAULT_STICKY_SECONDS)
+
+
+def replica_reads(view):
+    """Marca una vista de solo lectura (síncrona o async): sus consultas pueden ir a una réplica."""
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            state = current_state()
+            if state is None:
+                return await view(request, *args, **kwargs)
+            previous, state.use_replica = state.use_replica, True
+            try:
+                return await view(request, *args, **kwargs)
+            finally:
+                state.use_replica = previous
+    else:
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            state = current_state()
+            if state is None:
+                return view(request, *args, **kwargs)
+            previous, state.use_replica = state.use_replica, True
+            try:
+                return view(request, *args, **kwargs)
+            finally:
+                state.use_replica = previous
+
+    wrapper.replica_reads = True
+    return wrapper
+
+
+@contextmanager
+def primary_reads():
+    """Dentro del bloque las lecturas van a la primaria, aunque la vista sea ``@replica_reads``."""
+    state = current_state()
+    if state is None:
+        yield
+        return
+    previous, state.use_replica = state.use_replica, False
+    try:
+        yield
+    finally:
+        state.use_replica = previous
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if is_archive_model(model._meta.app_label, model._meta.model_name):
+            return archive_alias()
+        state = current_state()
+        if state is None or not state.use_replica or state.pinned or state.wrote:
+            return PRIMARY
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return PRIMARY
+        replicas = replica_aliases()
+        return random.choice(replicas) if replicas else PRIMARY
+
+    def db_for_write(self, model, **hints):
+        if is_archive_model(model._meta.app_label, model._meta.model_name):
+            return archive_alias()
+        state = current_state()
+        if state is not None and model._meta.app_label not in PRIMARY_ONLY_APPS:
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        pool = {PRIMARY, *replica_aliases()}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        if obj1._state.db == obj2._state.db == archive_alias():
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Las réplicas reciben el esquema junto con los datos (ver sync_replicas).
+        if db in replica_aliases():
+            return False
+        archive = archive_alias()
+        if archive != PRIMARY and (db == archive or is_archive_model(app_label, model_name)):
+            # La base de archivo solo tiene las tablas de archivo, y solo ahí están
+            return db == archive and is_archive_model(app_label, model_name)
+        return None
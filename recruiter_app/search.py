@@ -0,0 +1,150 @@
+# recruiter_app/search.py
+"""
+Backends de búsqueda de texto completo para las ofertas de empleo y para los
+candidatos (texto del CV y respuestas de cada postulación).
+
+El backend se elige con el setting ``JOB_SEARCH_BACKEND`` (ruta con puntos a
+una clase). Por defecto se usan los índices FTS5 de SQLite definidos en
+``recruiter_app.fts``, que se mantienen sincronizados mediante triggers.
+"""
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections, router
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from .fts import CANDIDATE_INDEX, JOB_POSTING_INDEX
+from .models import Answer, Application, JobPosting
+
+DEFAULT_BACKEND = 'recruiter_app.search.SQLiteFTSBackend'
+
+# Palabras de la consulta: letras (con tildes), dígitos y guion bajo.
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(query):
+    """Divide la consulta del usuario en términos, sin operadores FTS."""
+    return TOKEN_RE.findall(query or '')
+
+
+class BaseSearchBackend:
+    """Interfaz común de los backends de búsqueda."""
+    # Ordenación estable de los resultados, usada también por la paginación.
+    ordering = ('-created_at', '-id')
+
+    def search(self, queryset, query):
+        """Filtra ``queryset`` por ``query`` y lo ordena por relevancia."""
+        raise NotImplementedError
+
+    def install(self):
+        """Crea las estructuras del índice si el backend las necesita."""
+
+    def rebuild(self):
+        """Reconstruye el índice completo y devuelve el número de ofertas."""
+        raise NotImplementedError
+
+    def search_candidates(self, queryset, query):
+        """Filtra postulaciones cuyo CV o respuestas contienen todos los términos."""
+        raise NotImplementedError
+
+    def rebuild_candidates(self):
+        """Reconstruye el índice de candidatos y devuelve el número de postulaciones."""
+        raise NotImplementedError
+
+
+class SimpleSearchBackend(BaseSearchBackend):
+    """Búsqueda sin índice (LIKE) para motores que no soportan FTS5."""
+
+    def search(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset.none()
+        for term in terms:
+            queryset = queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+        return queryset.order_by(*self.ordering)
+
+    def rebuild(self):
+        return JobPosting.objects.count()
+
+    def search_candidates(self, queryset, query):
+        terms = tokenize(query)
+        if not terms:
+            return queryset.none()
+        for term in terms:
+            # Subconsulta en lugar de JOIN para no repetir postulaciones.
+            answered = Answer.objects.filter(answer_text__icontains=term).values('application_id')
+            queryset = queryset.filter(Q(cv_text__icontains=term) | Q(id__in=answered))
+        return queryset
+
+    def rebuild_candidates(self):
+        return Application.objects.count()
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    """
+    Índice invertido FTS5 con tokenizador ``unicode61 remove_diacritics 2``:
+    las búsquedas no distinguen mayúsculas ni tildes ("ingenieria" encuentra
+    "Ingeniería") y cada término se busca como prefijo.
+    """
+    index = JOB_POSTING_INDEX
+    ordering = ('search_rank', 'id')
+    # Pesos de bm25() por columna: el título pesa más que la descripción.
+    weights = (10.0, 1.0)
+    candidate_index = CANDIDATE_INDEX
+
+    def build_match(self, query):
+        terms = tokenize(query)
+        return ' '.join(f'"{term}"*' for term in terms)
+
+    def _match(self, queryset, index, model, query):
+        # Se une la tabla virtual por rowid: SQLite resuelve primero el MATCH
+        # en el índice invertido y luego accede a las filas por clave primaria.
+        table = index.table
+        return queryset.extra(
+            tables=[table],
+            where=[f'{table}.rowid = {model._meta.db_table}.id', f'{table} MATCH %s'],
+            params=[self.build_match(query)],
+        )
+
+    def search(self, queryset, query):
+        if not tokenize(query):
+            return queryset.none()
+        table = self.index.table
+        weights = ', '.join(str(w) for w in self.weights)
+        return self._match(queryset, self.index, JobPosting, query).annotate(
+            search_rank=RawSQL(f'bm25({table}, {weights})', [], output_field=FloatField()),
+        ).order_by(*self.ordering)
+
+    def search_candidates(self, queryset, query):
+        if not tokenize(query):
+            return queryset.none()
+        return self._match(queryset, self.candidate_index, Application, query)
+
+    def _connection(self):
+        return connections[router.db_for_write(JobPosting)]
+
+    def install(self):
+        self.index.install(self._connection())
+        self.candidate_index.install(connections[router.db_for_write(Application)])
+
+    def rebuild(self):
+        connection = self._connection()
+        self.index.install(connection)
+        self.index.rebuild(connection)
+        return JobPosting.objects.count()
+
+    def rebuild_candidates(self):
+        connection = connections[router.db_for_write(Application)]
+        self.candidate_index.install(connection)
+        self.candidate_index.rebuild(connection)
+        return Application.objects.count()
+
+
+@lru_cache(maxsize=None)
+def get_search_backend():
+    """Devuelve la instancia del backend configurado en settings."""
+    backend_path = getattr(settings, 'JOB_SEARCH_BACKEND', DEFAULT_BACKEND)
+    return import_string(backend_path)()
@@ -0,0 +1,199 @@
+# recruiter_app/services.py
+"""
+Operaciones de escritura que abarcan varios modelos. Cada una es una unidad de
+trabajo atómica que agrupa las escrituras con bulk_create/bulk_update para
+que el número de consultas no dependa de cuántas preguntas u opciones haya.
+"""
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.utils import timezone
+
+from . import counters
+from .models import Answer, Application, Question, QuestionOption
+from .purge import schedule_cv_sweep
+from .tasks import (
+    enqueue_status_notifications, extract_cv_text, notify_application_received, purge_job_posting,
+    refresh_job_recommendations,
+)
+
+OPTION_SEPARATOR = '||'
+
+
+def parse_options(raw):
+    """Convierte el campo oculto ``"op1||op2"`` en la lista de textos de opciones."""
+    return [text.strip() for text in (raw or '').split(OPTION_SEPARATOR) if text.strip()]
+
+
+def sync_options(pairs):
+    """
+    Ajusta las opciones de cada pregunta a la lista deseada en ``pairs``
+    (pares ``(pregunta, textos)``). Conserva las opciones cuyo texto se mantiene,
+    borra las que sobran y crea solo las nuevas, en tres consultas en total.
+    """
+    existing = defaultdict(lambda: defaultdict(list))
+    saved_ids = [question.pk for question, _ in pairs]
+    for option_id, question_id, text in QuestionOption.objects.filter(
+        question_id__in=saved_ids,
+    ).values_list('id', 'question_id', 'text').order_by('id'):
+        existing[question_id][text].append(option_id)
+
+    to_create = []
+    to_delete = []
+    for question, texts in pairs:
+        current = existing.pop(question.pk, {})
+        for text in texts:
+            if current.get(text):
+                current[text].pop(0)
+            else:
+                to_create.append(QuestionOption(question=question, text=text))
+        for ids in current.values():
+            to_delete.extend(ids)
+
+    if to_delete:
+        QuestionOption.objects.filter(pk__in=to_delete).delete()
+    if to_create:
+        QuestionOption.objects.bulk_create(to_create)
+    return len(to_create), len(to_delete)
+
+
+@transaction.atomic
+def save_job_posting(job_form, question_formset, options_data, recruiter=None):
+    """
+    Guarda una oferta con sus preguntas y opciones a partir de los formularios
+    ya validados de create_job_posting/edit_job_posting.
+
+    ``options_data`` es el diccionario con los campos ``options_for_<prefijo>``
+    (normalmente ``request.POST``). Las preguntas cerradas sin ese campo
+    conservan sus opciones; las abiertas se quedan sin opciones.
+    """
+    job = job_form.save(commit=False)
+    if recruiter is not None:
+        job.recruiter = recruiter
+    job.save()
+    # Las preguntas y opciones se escriben en bloque, sin señales por fila:
+    # job.save() ya invalida la caché de la oferta al confirmar la transacción.
+
+    to_delete, to_create, to_update = [], [], []
+    wanted_options = []
+    for form in question_formset:
+        if not form.cleaned_data:
+            continue  # Formulario extra que se dejó en blanco
+        if form.cleaned_data.get('DELETE'):
+            if form.instance.pk:
+                to_delete.append(form.instance.pk)
+            continue
+
+        question = form.save(commit=False)
+        question.job_posting = job
+        if question.pk is None:
+            to_create.append(question)
+        elif form.has_changed():
+            to_update.append(question)
+
+        key = f'options_for_{form.prefix}'
+        if question.question_type != 'closed':
+            wanted_options.append((question, []))
+        elif key in options_data:
+            wanted_options.append((question, parse_options(options_data[key])))
+
+    if to_delete:
+        Question.objects.filter(job_posting=job, pk__in=to_delete).delete()
+    if to_create:
+        Question.objects.bulk_create(to_create)
+    if to_update:
+        Question.objects.bulk_update(to_update, ['text', 'question_type'])
+    if wanted_options:
+        sync_options(wanted_options)
+    refresh_job_recommendations.enqueue(job_id=job.pk)
+    return job
+
+
+@transaction.atomic
+def soft_delete_job_posting(job):
+    """
+    Oculta la oferta de inmediato y encola su borrado por lotes, fuera de la
+    petición (ver recruiter_app/purge.py).
+    """
+    job.deleted_at = timezone.now()
+    job.save(update_fields=['deleted_at'])
+    purge_job_posting.enqueue(key=f'purge-job:{job.pk}', job_id=job.pk)
+
+
+@transaction.atomic
+def submit_application(job, applicant, application_form, questions, answers_data):
+    """
+    Crea la postulación y todas sus respuestas en una transacción, con una
+    sola inserción en bloque para las respuestas. ``questions`` son las
+    preguntas de la oferta ya cargadas y ``answers_data`` el diccionario con
+    los campos ``answer_text_<id>`` (normalmente ``request.POST``).
+    """
+    application = application_form.save(commit=False)
+    application.job_posting = job
+    application.applicant = applicant
+    application.save()
+    counters.record_created(job.pk, application.status)
+
+    Answer.objects.bulk_create([
+        Answer(application=application, question=question, answer_text=answers_data[f'answer_text_{question.id}'])
+        for question in questions
+        if answers_data.get(f'answer_text_{question.id}')
+    ])
+    # Los avisos se envían fuera de la petición; la tarea se confirma junto con la postulación.
+    notify_application_received.enqueue(key=f'application-received:{application.pk}', application_id=application.pk)
+    extract_cv_text.enqueue(key=f'cv-text:{application.pk}', application_id=application.pk)
+    return application
+
+
+async def astore_cv(application_form):
+    """
+    Copia el CV subido al storage antes de ``submit_application`` desde las
+    vistas async. La copia corre en un hilo propio (no en el de las consultas
+    de la petición), así un CV grande no frena a otras peticiones que esperan
+    la BD; después ``Application.save()`` ya no vuelve a escribir el archivo.
+    """
+    field_file = application_form.instance.cv
+    if field_file and not field_file._committed:
+        await sync_to_async(field_file.save, thread_sensitive=False)(field_file.name, field_file.file, save=False)
+
+
+@transaction.atomic
+def update_status(application, status):
+    """
+    Cambia el estado de una postulación, ajusta los contadores de la oferta y
+    encola el aviso al estudiante. El UPDATE se condiciona al estado anterior
+    para no contar dos veces un cambio hecho en paralelo.
+    """
+    old_status = application.status
+    changed = Application.objects.filter(pk=application.pk, status=old_status).exclude(status=status)
+    if changed.update(status=status):
+        counters.record_status_changes([(application.job_posting_id, old_status)], status)
+        enqueue_status_notifications([application.pk], status)
+    application.status = status
+
+
+@transaction.atomic
+def bulk_update_status(queryset, status):
+    """
+    Cambia el estado de todas las postulaciones del queryset con un solo UPDATE
+    y encola, con una sola inserción, los avisos de las que realmente cambian.
+    """
+    changed = list(queryset.exclude(status=status).values_list('id', 'job_posting_id', 'status'))
+    updated = queryset.update(status=status)
+    counters.record_status_changes([(job_id, old_status) for _, job_id, old_status in changed], status)
+    enqueue_status_notifications([application_id for application_id, _, _ in changed], status)
+    return updated
+
+
+@transaction.atomic
+def bulk_delete_applications(queryset):
+    """
+    Elimina las postulaciones del queryset (y sus respuestas) en una
+    transacción. Los CVs que quedan sin usar se borran después del periodo
+    de gracia (ver recruiter_app/purge.py).
+    """
+    counters.record_deleted(queryset)
+    schedule_cv_sweep(queryset.values_list('cv', flat=True))
+    _, deleted = queryset.delete()
+    return deleted.get(queryset.model._meta.label, 0)
@@ -0,0 +1,102 @@
+# recruiter_app/sessions.py
+"""
+Motor de sesiones (``SESSION_ENGINE``) en caché con respaldo en la BD.
+
+Las lecturas son las de ``cached_db``: la sesión se busca en la caché y solo
+si no está se lee ``django_session``. Las escrituras se agrupan: un cambio
+se guarda en la caché al momento y en la BD como mucho una vez cada
+``SESSION_DB_SAVE_INTERVAL`` segundos. Se escriben siempre en la BD las
+sesiones nuevas y los cambios de usuario (login, logout, cambio de
+contraseña), para que perder la caché nunca cambie quién está autenticado;
+como mucho se pierden los últimos segundos de datos secundarios.
+
+Requiere una caché compartida entre procesos (comprobación
+recruiter_app.E001): con LocMemCache un logout solo borraría la sesión en el
+proceso que lo atiende y settings usa entonces las sesiones en la BD.
+
+Las sesiones iniciadas antes de CachedModelBackend guardan el backend por
+defecto; get_user() rechaza un backend que no está en
+AUTHENTICATION_BACKENDS y las cerraría todas. Al cargarlas se reescribe a
+CachedModelBackend, que acepta a los mismos usuarios.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.sessions.backends import cached_db
+
+logger = logging.getLogger('django.contrib.sessions')
+
+DEFAULT_DB_SAVE_INTERVAL = 60
+# Momento de la última escritura en la BD, guardado junto a los datos
+DB_SAVED_AT_KEY = '_session_db_saved_at'
+AUTH_KEYS = (SESSION_KEY, BACKEND_SESSION_KEY, HASH_SESSION_KEY)
+LEGACY_BACKENDS = {'django.contrib.auth.backends.ModelBackend': 'recruiter_app.auth.CachedModelBackend'}
+
+
+def db_save_interval():
+    return getattr(settings, 'SESSION_DB_SAVE_INTERVAL', DEFAULT_DB_SAVE_INTERVAL)
+
+
+class SessionStore(cached_db.SessionStore):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._db_auth = None  # Claves de autenticación tal como están en la BD
+
+    def auth_snapshot(self, data):
+        return tuple(data.get(key) for key in AUTH_KEYS)
+
+    def upgrade_backend(self, data):
+        """Reescribe el backend de una sesión antigua (ver el docstring del módulo)."""
+        backend = data.get(BACKEND_SESSION_KEY)
+        replacement = LEGACY_BACKENDS.get(backend)
+        backends = settings.AUTHENTICATION_BACKENDS
+        if replacement and backend not in backends and replacement in backends:
+            data[BACKEND_SESSION_KEY] = replacement
+            self.modified = True  # Cambia una clave de autenticación: se guarda en la BD
+        return data
+
+    def load(self):
+        data = super().load()
+        self._db_auth = self.auth_snapshot(data)
+        return self.upgrade_backend(data)
+
+    async def aload(self):
+        data = await super().aload()
+        self._db_auth = self.auth_snapshot(data)
+        return self.upgrade_backend(data)
+
+    def db_save_due(self, must_create):
+        if must_create or self.session_key is None:
+            return True
+        if self.auth_snapshot(self._session) != self._db_auth:
+            return True
+        return time.time() - self._session.get(DB_SAVED_AT_KEY, 0) >= db_save_interval()
+
+    def mark_db_saved(self):
+        self._session[DB_SAVED_AT_KEY] = int(time.time())
+        self._db_auth = self.auth_snapshot(self._session)
+
+    def save(self, must_create=False):
+        if self.db_save_due(must_create):
+            self.mark_db_saved()
+            return super().save(must_create)
+        try:
+            self._cache.set(self.cache_key, self._session, self.get_expiry_age())
+        except Exception:
+            # Sin caché el cambio no puede esperar: se guarda en la BD
+            logger.exception('Error saving to cache (%s)', self._cache)
+            self.mark_db_saved()
+            super().save(must_create)
+
+    async def asave(self, must_create=False):
+        if self.db_save_due(must_create):
+            self.mark_db_saved()
+            return await super().asave(must_create)
+        try:
+            await self._cache.aset(await self.acache_key(), self._session, await self.aget_expiry_age())
+        except Exception:
+            logger.exception('Error saving to cache (%s)', self._cache)
+            self.mark_db_saved()
+            await super().asave(must_create)
@@ -0,0 +1,57 @@
+# recruiter_app/signals.py
+"""Receptores de señales de la aplicación, conectados en RecruiterAppConfig.ready()."""
+from django.db import connections, router
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from .auth import invalidate_user
+from .caching import bump_version, invalidate_job
+from .fts import CANDIDATE_INDEX, JOB_POSTING_INDEX
+from .models import CustomUser, EducationLevel, JobPosting, Question, QuestionOption
+
+
+@receiver(post_migrate)
+def ensure_search_index(sender, using, **kwargs):
+    """Vuelve a crear los índices de búsqueda y sus triggers tras cada migrate."""
+    if sender.name != 'recruiter_app' or not router.allow_migrate_model(using, JobPosting):
+        return  # Otra app, o la base de archivo, que no tiene las tablas indexadas
+    JOB_POSTING_INDEX.install(connections[using])
+    CANDIDATE_INDEX.install(connections[using])
+
+
+# Invalidación de la caché (recruiter_app/caching.py). Las escrituras en bloque
+# (bulk_create, update) no emiten señales; save_job_posting invalida por su cuenta.
+
+@receiver([post_save, post_delete], sender=JobPosting)
+def invalidate_job_posting(sender, instance, **kwargs):
+    invalidate_job(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Question)
+def invalidate_question(sender, instance, **kwargs):
+    invalidate_job(instance.job_posting_id)
+
+
+@receiver([post_save, post_delete], sender=QuestionOption)
+def invalidate_question_option(sender, instance, origin=None, **kwargs):
+    if origin is not None:
+        if getattr(origin, 'model', type(origin)) is not QuestionOption:
+            return  # Borrado en cascada: la pregunta u oferta de origen ya invalida la caché
+        # Un borrado en bloque emite una señal por opción: una consulta por pregunta basta.
+        seen = origin.__dict__.setdefault('_invalidated_questions', set())
+        if instance.question_id in seen:
+            return
+        seen.add(instance.question_id)
+    job_id = Question.objects.filter(id=instance.question_id).values_list('job_posting_id', flat=True).first()
+    if job_id is not None:
+        invalidate_job(job_id)
+
+
+@receiver([post_save, post_delete], sender=EducationLevel)
+def invalidate_education_levels(sender, **kwargs):
+    bump_version('education')
+
+
+@receiver([post_save, post_delete], sender=CustomUser)
+def invalidate_cached_user(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
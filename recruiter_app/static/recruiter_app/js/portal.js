@@ -0,0 +1,146 @@
+// recruiter_app/static/recruiter_app/js/portal.js
+// Scripts de las páginas del portal en un solo archivo: se descarga una vez y
+// queda en la caché del navegador con el resto de los estáticos (ver
+// recruiter_app/assets.py). Cada bloque se activa solo si la página tiene sus
+// elementos.
+(function () {
+    'use strict';
+
+    // Modales de confirmación de borrado: el botón que abre el modal trae la
+    // URL del formulario en data-delete-url.
+    function initDeleteModals() {
+        document.querySelectorAll('.modal').forEach(modal => {
+            modal.addEventListener('show.bs.modal', event => {
+                const button = event.relatedTarget;
+                const form = modal.querySelector('form');
+                if (button && form && button.dataset.deleteUrl) {
+                    form.action = button.dataset.deleteUrl;
+                }
+            });
+        });
+    }
+
+    // Botones que piden confirmación antes de enviar el formulario (data-confirm)
+    function initConfirmButtons() {
+        document.querySelectorAll('[data-confirm]').forEach(button => {
+            button.addEventListener('click', event => {
+                if (!window.confirm(button.dataset.confirm)) {
+                    event.preventDefault();
+                }
+            });
+        });
+    }
+
+    // Acciones en bloque: seleccionar todas las postulaciones de la página
+    function initSelectPage() {
+        const selectPage = document.getElementById('select-page');
+        if (!selectPage) return;
+        selectPage.addEventListener('change', () => {
+            document.querySelectorAll('input[name="application_ids"]').forEach(box => { box.checked = selectPage.checked; });
+        });
+    }
+
+    // Preguntas de una oferta (crear y editar). Con data-remove-mode="hide"
+    // (editar) quitar una pregunta marca su DELETE y la oculta; si no, se
+    // quita del formulario y se reindexan las demás.
+    function initQuestionFormset() {
+        const questionsContainer = document.getElementById('questions-container');
+        if (!questionsContainer) return;
+        const addQuestionButton = document.getElementById('add-question');
+        const totalFormsInput = document.querySelector('input[name="questions-TOTAL_FORMS"]');
+        const questionTemplate = document.getElementById('question-template').innerHTML;
+        const optionTemplate = document.getElementById('option-template').innerHTML;
+        const hideRemoved = questionsContainer.dataset.removeMode === 'hide';
+
+        // Opciones de una pregunta cerrada en el campo oculto, separadas por ||
+        const updateOptionsInput = (questionForm) => {
+            const optionsInput = questionForm.querySelector('.options-input');
+            const optionInputs = questionForm.querySelectorAll('.options-list input[type="text"]');
+            const optionValues = Array.from(optionInputs).map(input => input.value).filter(Boolean);
+            optionsInput.value = optionValues.join('||');
+        };
+
+        const updateIndices = () => {
+            questionsContainer.querySelectorAll('.question-form').forEach((questionForm, q_index) => {
+                const prefix = `questions-${q_index}`;
+                questionForm.querySelectorAll('input, select, label').forEach(input => {
+                    if (input.id) input.id = input.id.replace(/questions-\d+-/, `${prefix}-`);
+                    if (input.name) input.name = input.name.replace(/questions-\d+-/, `${prefix}-`);
+                    if (input.htmlFor) input.htmlFor = input.htmlFor.replace(/questions-\d+-/, `${prefix}-`);
+                });
+                const optionsInput = questionForm.querySelector('.options-input');
+                if (optionsInput) optionsInput.name = `options_for_${prefix}`;
+            });
+            totalFormsInput.value = questionsContainer.querySelectorAll('.question-form').length;
+        };
+
+        const removeQuestion = (questionForm) => {
+            const deleteCheckbox = questionForm.querySelector('input[type="checkbox"][name*="DELETE"]');
+            if (hideRemoved && deleteCheckbox) {
+                // El servidor borra las preguntas marcadas al guardar
+                deleteCheckbox.checked = true;
+                questionForm.style.display = 'none';
+            } else if (hideRemoved) {
+                questionForm.remove();
+                totalFormsInput.value = document.querySelectorAll('.question-form').length;
+            } else {
+                questionForm.remove();
+                updateIndices();
+            }
+        };
+
+        addQuestionButton.addEventListener('click', () => {
+            const totalForms = parseInt(totalFormsInput.value);
+            const newFormHtml = questionTemplate.replace(/__prefix__/g, totalForms);
+            questionsContainer.insertAdjacentHTML('beforeend', newFormHtml);
+            totalFormsInput.value = totalForms + 1;
+        });
+
+        questionsContainer.addEventListener('click', (e) => {
+            if (e.target.classList.contains('remove-question')) {
+                removeQuestion(e.target.closest('.question-form'));
+            }
+            if (e.target.classList.contains('add-option')) {
+                const optionsList = e.target.closest('.options-container').querySelector('.options-list');
+                optionsList.insertAdjacentHTML('beforeend', optionTemplate);
+            }
+            if (e.target.classList.contains('remove-option')) {
+                const questionForm = e.target.closest('.question-form');
+                e.target.closest('.option-input').remove();
+                updateOptionsInput(questionForm);
+            }
+        });
+
+        questionsContainer.addEventListener('change', (e) => {
+            if (e.target.name && e.target.name.includes('question_type')) {
+                const questionForm = e.target.closest('.question-form');
+                const optionsContainer = questionForm.querySelector('.options-container');
+                if (e.target.value === 'closed') {
+                    optionsContainer.style.display = 'block';
+                } else {
+                    optionsContainer.style.display = 'none';
+                    optionsContainer.querySelector('.options-list').innerHTML = '';
+                }
+            }
+        });
+
+        questionsContainer.addEventListener('input', (e) => {
+            const questionForm = e.target.closest('.question-form');
+            if (e.target.closest('.options-list')) {
+                updateOptionsInput(questionForm);
+            }
+        });
+
+        // Inicializar el campo oculto con las opciones existentes: al editar,
+        // el servidor compara esta lista con las opciones guardadas y solo
+        // aplica las diferencias.
+        questionsContainer.querySelectorAll('.question-form').forEach(form => updateOptionsInput(form));
+    }
+
+    document.addEventListener('DOMContentLoaded', () => {
+        initDeleteModals();
+        initConfirmButtons();
+        initSelectPage();
+        initQuestionFormset();
+    });
+})();
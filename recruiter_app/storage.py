@@ -0,0 +1,68 @@
+# recruiter_app/storage.py
+"""
+Almacenamiento direccionado por contenido para los CVs.
+
+Cada archivo se guarda como ``<carpeta>/<aa>/<bb>/<sha256><ext>``: el mismo CV
+subido a varias ofertas ocupa una sola copia en disco, y un archivo existente
+no se vuelve a escribir: solo se actualiza su fecha de modificación (ver el
+barrido de CVs huérfanos en recruiter_app/purge.py).
+"""
+import hashlib
+import os
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def file_sha256(content):
+    """SHA-256 del archivo; reutiliza el calculado por CVUploadHandler si existe."""
+    digest = getattr(content, 'sha256', None)
+    if digest:
+        return digest
+    hasher = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks(HASH_CHUNK_SIZE):
+        hasher.update(chunk)
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    content.sha256 = hasher.hexdigest()
+    return content.sha256
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """FileSystemStorage que nombra los archivos por el hash de su contenido."""
+
+    def __init__(self, **kwargs):
+        # Dos subidas simultáneas del mismo contenido escriben bytes idénticos.
+        kwargs.setdefault('allow_overwrite', True)
+        super().__init__(**kwargs)
+
+    def content_name(self, name, content):
+        directory, filename = os.path.split(name)
+        extension = os.path.splitext(filename)[1].lower()
+        digest = file_sha256(content)
+        return os.path.join(directory, digest[:2], digest[2:4], f'{digest}{extension}').replace(os.sep, '/')
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        name = self.content_name(name, content)
+        if self.exists(name):
+            try:
+                # Marca el archivo como en uso: el barrido de CVs huérfanos
+                # respeta un periodo de gracia desde la última modificación.
+                os.utime(self.path(name))
+                return name
+            except FileNotFoundError:
+                pass  # Se borró entre exists() y utime(): se vuelve a escribir
+        return super().save(name, content, max_length=max_length)
+
+
+def cv_storage():
+    """Storage del campo ``Application.cv`` (callable para no fijarlo en las migraciones)."""
+    return ContentAddressedStorage()
@@ -0,0 +1,212 @@
+# recruiter_app/synthetic.py
+"""
+Generador de datos sintéticos para medir el rendimiento con volúmenes reales.
+
+Todo se deriva de una semilla: la misma semilla y escala producen los mismos
+títulos, salarios, fechas y postulaciones, así que las mediciones de dos
+commits distintos se hacen sobre datos equivalentes. Las filas se insertan con
+``bulk_create`` por lotes de ofertas (cada lote en su propia transacción) y
+los contadores de postulaciones se calculan antes de insertar, así que quedan
+consistentes sin pasar por recruiter_app/counters.py.
+"""
+import hashlib
+import random
+import zlib
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+
+from . import caching
+from .models import Answer, Application, CustomUser, EducationLevel, JobPosting, Question, QuestionOption
+from .storage import cv_storage
+
+USERNAME_PREFIX = 'synth-'
+PASSWORD = 'synthetic-pass'
+
+# Escalas predefinidas; cada valor se puede cambiar con su opción del comando.
+PRESETS = {
+    'small': {
+        'companies': 20, 'students': 500, 'jobs': 500, 'applications_per_job': 8,
+        'questions_per_job': 3, 'options_per_question': 4, 'cv_files': 20,
+    },
+    'medium': {
+        'companies': 500, 'students': 10_000, 'jobs': 10_000, 'applications_per_job': 15,
+        'questions_per_job': 3, 'options_per_question': 4, 'cv_files': 200,
+    },
+    'large': {
+        'companies': 2_000, 'students': 50_000, 'jobs': 100_000, 'applications_per_job': 20,
+        'questions_per_job': 3, 'options_per_question': 4, 'cv_files': 1_000,
+    },
+}
+
+POSITIONS = ('Practicante de', 'Asistente de', 'Analista de', 'Desarrollador de', 'Coordinador de', 'Técnico de')
+AREAS = (
+    'sistemas', 'datos', 'contabilidad', 'marketing', 'ventas', 'logística', 'recursos humanos',
+    'soporte técnico', 'redes', 'producción', 'calidad', 'finanzas',
+)
+SKILLS = (
+    'python', 'django', 'sql', 'excel', 'java', 'javascript', 'linux', 'power bi', 'sap', 'autocad',
+    'inglés', 'atención al cliente', 'redes cisco', 'contabilidad', 'auditoría', 'scrum', 'git', 'docker',
+)
+STATUSES = ('pending', 'pending', 'pending', 'accepted', 'rejected')
+MAX_AGE_DAYS = 365
+
+
+def cv_pdf(text):
+    """PDF de una página con ``text`` en un flujo comprimido (extraíble por extract_pdf_text)."""
+    escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+    stream = zlib.compress(f'BT /F1 12 Tf 72 720 Td ({escaped}) Tj ET'.encode('latin-1', 'replace'))
+    return (
+        b'%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n'
+        b'2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n'
+        b'3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]/Contents 4 0 R>>endobj\n'
+        b'4 0 obj<</Length ' + str(len(stream)).encode() + b'/Filter/FlateDecode>>stream\n'
+        + stream + b'\nendstream endobj\ntrailer<</Root 1 0 R>>\n%%EOF\n'
+    )
+
+
+class SyntheticDataGenerator:
+    """Genera el conjunto de datos; ``log`` recibe mensajes de progreso."""
+
+    def __init__(self, seed=42, batch_size=1000, log=None, **scale):
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.scale = {**PRESETS['small'], **{key: value for key, value in scale.items() if value is not None}}
+        self.log = log or (lambda message: None)
+        self.now = timezone.now()
+        self.created = dict.fromkeys(('companies', 'students', 'jobs', 'questions', 'options', 'applications', 'answers'), 0)
+
+    def run(self):
+        password = make_password(PASSWORD)
+        company_ids = self.create_users('empresa', self.scale['companies'], password, is_company=True)
+        student_ids = self.create_users('alumno', self.scale['students'], password, is_company=False)
+        cvs = self.create_cv_files()
+        self.levels = list(EducationLevel.objects.order_by('rank').values_list('id', flat=True))
+        for start in range(0, self.scale['jobs'], self.batch_size):
+            count = min(self.batch_size, self.scale['jobs'] - start)
+            with transaction.atomic():
+                self.create_job_batch(count, company_ids, student_ids, cvs)
+            self.log(f"{start + count}/{self.scale['jobs']} ofertas, {self.created['applications']} postulaciones")
+        caching.bump_version('jobs')
+        return self.created
+
+    def create_users(self, kind, count, password, is_company):
+        users = [
+            CustomUser(
+                username=f'{USERNAME_PREFIX}{kind}-{index}', email=f'{kind}{index}@example.com',
+                password=password, is_company=is_company,
+            )
+            for index in range(count)
+        ]
+        created = CustomUser.objects.bulk_create(users, batch_size=self.batch_size)
+        self.created['companies' if is_company else 'students'] += len(created)
+        return [user.id for user in created]
+
+    def create_cv_files(self):
+        """Guarda ``cv_files`` CVs distintos; se comparten entre postulaciones como en producción."""
+        storage, cvs = cv_storage(), []
+        for index in range(self.scale['cv_files']):
+            text = f'Curriculum {index}. Experiencia en ' + ', '.join(self.rng.sample(SKILLS, 4))
+            content = cv_pdf(text)
+            name = storage.save('cvs/cv.pdf', ContentFile(content, name='cv.pdf'))
+            cvs.append((name, hashlib.sha256(content).hexdigest(), f'cv-{index}.pdf', text))
+        return cvs
+
+    def create_job_batch(self, count, company_ids, student_ids, cvs):
+        rng = self.rng
+        jobs, plans = [], []
+        for _ in range(count):
+            position, area = rng.choice(POSITIONS), rng.choice(AREAS)
+            skills = rng.sample(SKILLS, 3)
+            # Pocas ofertas concentran muchas postulaciones (distribución sesgada)
+            applicants = min(len(student_ids), int(rng.expovariate(1 / self.scale['applications_per_job'])))
+            plan = [
+                (applicant, rng.choice(STATUSES), rng.choice(cvs))
+                for applicant in rng.sample(student_ids, applicants)
+            ]
+            statuses = [status for _, status, _ in plan]
+            jobs.append(JobPosting(
+                recruiter_id=rng.choice(company_ids),
+                title=f'{position} {area}',
+                description=f'Buscamos {position.lower()} {area} con conocimientos de {", ".join(skills)}. ' * 3,
+                salary=rng.randrange(1025, 9000, 25),
+                min_education_id=rng.choice(self.levels),
+                applications_total=len(plan),
+                applications_pending=statuses.count('pending'),
+                applications_accepted=statuses.count('accepted'),
+                applications_rejected=statuses.count('rejected'),
+            ))
+            plans.append(plan)
+        jobs = JobPosting.objects.bulk_create(jobs)
+        # auto_now_add fija la fecha actual al insertar; se reparte después
+        for job in jobs:
+            job.created_at = self.now - timedelta(seconds=rng.randrange(MAX_AGE_DAYS * 86400))
+        JobPosting.objects.bulk_update(jobs, ['created_at'], batch_size=500)
+
+        questions = []
+        for job in jobs:
+            for index in range(self.scale['questions_per_job']):
+                question_type = 'closed' if index % 2 else 'open'
+                questions.append(Question(job_posting=job, text=f'Pregunta {index + 1}', question_type=question_type))
+        questions = Question.objects.bulk_create(questions)
+        options = [
+            QuestionOption(question=question, text=f'Opción {index + 1}')
+            for question in questions if question.question_type == 'closed'
+            for index in range(self.scale['options_per_question'])
+        ]
+        QuestionOption.objects.bulk_create(options)
+        questions_by_job = {}
+        for question in questions:
+            questions_by_job.setdefault(question.job_posting_id, []).append(question)
+
+        applications = []
+        for job, plan in zip(jobs, plans):
+            for applicant_id, status, (name, digest, filename, text) in plan:
+                applications.append(Application(
+                    job_posting=job, applicant_id=applicant_id, status=status, cv=name, cv_sha256=digest,
+                    cv_filename=filename, cv_text=text, cv_text_extracted_at=self.now,
+                ))
+        applications = Application.objects.bulk_create(applications)
+        for application in applications:
+            application.submitted_at = max(
+                application.job_posting.created_at, self.now - timedelta(seconds=rng.randrange(MAX_AGE_DAYS * 86400)),
+            )
+        Application.objects.bulk_update(applications, ['submitted_at'], batch_size=500)
+
+        answers = []
+        for application in applications:
+            for question in questions_by_job.get(application.job_posting_id, ()):
+                if question.question_type == 'closed':
+                    text = f'Opción {rng.randint(1, self.scale["options_per_question"])}'
+                else:
+                    text = 'Tengo experiencia con ' + ' y '.join(rng.sample(SKILLS, 2))
+                answers.append(Answer(application=application, question=question, answer_text=text))
+        Answer.objects.bulk_create(answers, batch_size=self.batch_size * 5)
+
+        for key, value in (
+            ('jobs', jobs), ('questions', questions), ('options', options),
+            ('applications', applications), ('answers', answers),
+        ):
+            self.created[key] += len(value)
+
+
+def delete_synthetic_data(batch_size=1000):
+    """
+    Elimina los usuarios sintéticos con sus ofertas y postulaciones. Se borra
+    por lotes de ofertas para no cargar millones de filas en el Collector; los
+    archivos de CV se quedan (pueden compartirse con postulaciones reales).
+    """
+    users = CustomUser.objects.filter(username__startswith=USERNAME_PREFIX)
+    job_ids = list(JobPosting.all_objects.filter(recruiter__in=users).values_list('id', flat=True))
+    for start in range(0, len(job_ids), batch_size):
+        chunk = job_ids[start:start + batch_size]
+        with transaction.atomic():
+            Answer.objects.filter(application__job_posting_id__in=chunk).delete()
+            Application.all_objects.filter(job_posting_id__in=chunk).delete()
+            JobPosting.all_objects.filter(id__in=chunk).delete()
+    deleted, _ = users.delete()
+    caching.bump_version('jobs')
+    return deleted
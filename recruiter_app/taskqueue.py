@@ -0,0 +1,193 @@
+# recruiter_app/taskqueue.py
+"""
+Cola de tareas en segundo plano respaldada por la base de datos.
+
+Las vistas llaman a ``enqueue()``, que solo inserta una fila en ``Task`` dentro
+de la misma transacción que la escritura que la origina; los procesos de
+``manage.py run_task_worker`` toman las tareas pendientes y las ejecutan con
+reintentos y espera exponencial. No se necesita un broker externo.
+
+Las tareas se registran con el decorador ``@task`` (ver recruiter_app/tasks.py).
+"""
+import logging
+import os
+import socket
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+registry = {}
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 10  # segundos; se duplica en cada reintento
+# Una tarea "running" sin terminar tras este tiempo se considera huérfana
+# (el worker murió) y vuelve a la cola.
+DEFAULT_LOCK_TIMEOUT = 300
+
+
+class TaskDefinition:
+    def __init__(self, func, name, max_attempts, retry_delay):
+        self.func = func
+        self.name = name
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, key=None, delay=0, **payload):
+        return enqueue(self.name, key=key, delay=delay, **payload)
+
+
+def task(name=None, max_attempts=DEFAULT_MAX_ATTEMPTS, retry_delay=DEFAULT_RETRY_DELAY):
+    """Registra una función como tarea. Sus argumentos deben ser serializables en JSON."""
+    def decorator(func):
+        definition = TaskDefinition(func, name or func.__name__, max_attempts, retry_delay)
+        registry[definition.name] = definition
+        return definition
+    return decorator
+
+
+def _new_task(name, key, delay, payload):
+    if name not in registry:
+        raise KeyError(f'Tarea no registrada: {name}')
+    return Task(
+        name=name,
+        payload=payload,
+        idempotency_key=key,
+        max_attempts=registry[name].max_attempts,
+        run_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def enqueue(name, key=None, delay=0, **payload):
+    """
+    Encola la tarea ``name``. Si ya existe una con la misma ``key`` de
+    idempotencia se devuelve esa en lugar de crear otra.
+    """
+    new_task = _new_task(name, key, delay, payload)
+    if key is not None:
+        try:
+            with transaction.atomic():
+                new_task.save()
+        except IntegrityError:
+            return Task.objects.get(idempotency_key=key)
+    else:
+        new_task.save()
+    if getattr(settings, 'TASKS_RUN_EAGERLY', False):
+        transaction.on_commit(lambda: run_task(new_task.pk))
+    return new_task
+
+
+def enqueue_many(name, payloads, key_func=None):
+    """Encola varias tareas del mismo tipo con una sola inserción."""
+    tasks = [
+        _new_task(name, key_func(payload) if key_func else None, 0, payload)
+        for payload in payloads
+    ]
+    Task.objects.bulk_create(tasks, ignore_conflicts=key_func is not None)
+    if getattr(settings, 'TASKS_RUN_EAGERLY', False):
+        transaction.on_commit(lambda: run_pending(worker_id='eager'))
+    return len(tasks)
+
+
+def default_worker_id():
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def requeue_stale(timeout=DEFAULT_LOCK_TIMEOUT):
+    """Devuelve a la cola las tareas bloqueadas por workers que ya no responden."""
+    limit = timezone.now() - timedelta(seconds=timeout)
+    return Task.objects.filter(status='running', locked_at__lt=limit).update(status='queued', locked_by='')
+
+
+def claim_next(worker_id):
+    """
+    Toma la siguiente tarea lista. La reserva es un UPDATE condicionado al
+    estado 'queued': si otro worker la tomó primero se intenta con la siguiente.
+    """
+    while True:
+        candidate = (
+            Task.objects.filter(status='queued', run_at__lte=timezone.now())
+            .order_by('run_at', 'id').values_list('id', flat=True).first()
+        )
+        if candidate is None:
+            return None
+        claimed = Task.objects.filter(id=candidate, status='queued').update(
+            status='running', locked_by=worker_id, locked_at=timezone.now(),
+        )
+        if claimed:
+            return Task.objects.get(id=candidate)
+
+
+def execute(current):
+    """Ejecuta una tarea ya reservada y registra el resultado o el reintento."""
+    definition = registry.get(current.name)
+    current.attempts += 1
+    try:
+        if definition is None:
+            raise KeyError(f'Tarea no registrada: {current.name}')
+        definition.func(**current.payload)
+    except Exception:
+        error = traceback.format_exc()
+        logger.exception('Falló la tarea %s', current)
+        if current.attempts < current.max_attempts:
+            delay = (definition.retry_delay if definition else DEFAULT_RETRY_DELAY) * 2 ** (current.attempts - 1)
+            current.status = 'queued'
+            current.run_at = timezone.now() + timedelta(seconds=delay)
+        else:
+            current.status = 'failed'
+            current.finished_at = timezone.now()
+        current.last_error = error
+    else:
+        current.status = 'done'
+        current.finished_at = timezone.now()
+        current.last_error = ''
+    current.locked_by = ''
+    current.save(update_fields=['status', 'attempts', 'run_at', 'locked_by', 'last_error', 'finished_at'])
+    return current.status
+
+
+def run_task(task_id, worker_id='eager'):
+    """Reserva y ejecuta una tarea concreta si sigue en cola (modo inmediato)."""
+    if Task.objects.filter(id=task_id, status='queued').update(
+        status='running', locked_by=worker_id, locked_at=timezone.now(),
+    ):
+        return execute(Task.objects.get(id=task_id))
+    return None
+
+
+def run_pending(worker_id=None, limit=None):
+    """Ejecuta tareas listas hasta vaciar la cola (o hasta ``limit``). Devuelve cuántas procesó."""
+    worker_id = worker_id or default_worker_id()
+    processed = 0
+    while limit is None or processed < limit:
+        current = claim_next(worker_id)
+        if current is None:
+            break
+        execute(current)
+        processed += 1
+    return processed
+
+
+def run_worker(worker_id=None, poll_interval=1.0, stop=lambda: False):
+    """Bucle principal de un worker: procesa la cola y espera cuando está vacía."""
+    worker_id = worker_id or default_worker_id()
+    logger.info('Worker %s iniciado', worker_id)
+    last_stale_check = 0.0
+    while not stop():
+        # Igual que al inicio de cada petición: descarta conexiones caídas o vencidas.
+        close_old_connections()
+        if time.monotonic() - last_stale_check > 60:
+            requeue_stale()
+            last_stale_check = time.monotonic()
+        if not run_pending(worker_id, limit=100):
+            time.sleep(poll_interval)
@@ -0,0 +1,123 @@
+# recruiter_app/tasks.py
+"""
+Tareas en segundo plano de la aplicación. Se registran al importar este
+módulo desde RecruiterAppConfig.ready() y las ejecuta `manage.py run_task_worker`.
+"""
+from django.conf import settings
+from django.core.mail import send_mail
+from django.utils import timezone
+
+from .extraction import extract_pdf_text
+from .models import Application
+from .purge import purge_job, remove_orphan_cvs
+from .recommendations import refresh_job
+from .taskqueue import enqueue_many, task
+
+
+def _application(application_id):
+    return (
+        Application.objects.select_related('job_posting__recruiter', 'applicant')
+        .defer('cv_text').filter(id=application_id).first()
+    )
+
+
+@task()
+def notify_application_received(application_id):
+    """Avisa al reclutador de una nueva postulación y confirma al estudiante."""
+    application = _application(application_id)
+    if application is None:
+        return  # La postulación se eliminó antes de procesar la tarea
+    job, applicant = application.job_posting, application.applicant
+    if job.recruiter.email:
+        send_mail(
+            f'Nueva postulación para {job.title}',
+            f'{applicant.username} ha postulado a tu oferta "{job.title}".',
+            settings.DEFAULT_FROM_EMAIL,
+            [job.recruiter.email],
+        )
+    if applicant.email:
+        send_mail(
+            f'Postulación recibida: {job.title}',
+            f'Hola {applicant.username}, recibimos tu postulación a "{job.title}".',
+            settings.DEFAULT_FROM_EMAIL,
+            [applicant.email],
+        )
+
+
+@task()
+def notify_status_change(application_id, status):
+    """Informa al estudiante que su postulación fue aceptada o rechazada."""
+    application = _application(application_id)
+    if application is None or application.status != status or not application.applicant.email:
+        return  # Eliminada, vuelta a cambiar o sin correo: no hay nada que avisar
+    send_mail(
+        f'Actualización de tu postulación: {application.job_posting.title}',
+        f'Hola {application.applicant.username}, tu postulación a "{application.job_posting.title}" '
+        f'ahora está: {application.get_status_display()}.',
+        settings.DEFAULT_FROM_EMAIL,
+        [application.applicant.email],
+    )
+
+
+def status_change_key(payload, changed_at):
+    """
+    Una clave por cambio de estado: aceptada → rechazada → aceptada avisa las
+    dos veces, y volver a encolar el mismo cambio no duplica el correo.
+    """
+    return f"status-email:{payload['application_id']}:{payload['status']}:{changed_at}"
+
+
+def enqueue_status_notifications(application_ids, status):
+    """Encola un aviso por postulación con una sola inserción."""
+    if status == 'pending':
+        return 0
+    changed_at = timezone.now().isoformat()
+    return enqueue_many(
+        'notify_status_change',
+        [{'application_id': application_id, 'status': status} for application_id in application_ids],
+        key_func=lambda payload: status_change_key(payload, changed_at),
+    )
+
+
+@task()
+def extract_cv_text(application_id):
+    """
+    Extrae el texto del CV y lo guarda en la postulación; el trigger del índice
+    de candidatos actualiza solo esa fila. Los CVs se guardan por hash, así que
+    si el mismo archivo ya se procesó en otra postulación se reutiliza el texto.
+    """
+    application = Application.objects.filter(id=application_id).only('id', 'cv', 'cv_sha256').first()
+    if application is None or not application.cv:
+        return
+    text = None
+    if application.cv_sha256:
+        text = (
+            Application.objects.filter(cv_sha256=application.cv_sha256, cv_text_extracted_at__isnull=False)
+            .exclude(id=application_id).values_list('cv_text', flat=True).first()
+        )
+    if text is None:
+        with application.cv.open('rb') as cv:
+            text = extract_pdf_text(cv)
+    Application.objects.filter(id=application_id).update(cv_text=text, cv_text_extracted_at=timezone.now())
+
+
+def cv_text_key(payload):
+    return f"cv-text:{payload['application_id']}"
+
+
+@task()
+def refresh_job_recommendations(job_id):
+    """Recomienda una oferta nueva o editada a los estudiantes afines (ver recruiter_app/recommendations.py)."""
+    refresh_job(job_id)
+
+
+@task()
+def purge_job_posting(job_id):
+    """Borra por lotes una oferta eliminada y todo lo que depende de ella (ver recruiter_app/purge.py)."""
+    purge_job(job_id)
+
+
+@task()
+def sweep_orphan_cvs(names):
+    """Borra los CVs ``names`` que siguen sin usarse al terminar el periodo de gracia (ver recruiter_app/purge.py)."""
+    remove_orphan_cvs(names)
@@ -1,3 +1,1605 @@
-from django.test import TestCase
+import csv
+import gzip
+import hashlib
+import importlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import time
+import zipfile
+import zlib
+from contextlib import closing
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.contrib.sessions.models import Session
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, connections
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import clear_url_caches, reverse
+from django.utils import timezone
+
+from . import assets, benchmarks, checks, counters, pagination, perf, recommendations, routers, sessions, taskqueue, views
+from .auth import CachedModelBackend
+from .extraction import extract_pdf_text
+from .loadtest import SAMPLE_PDF
+from .management.commands.benchmark_job_writes import question_payload
+from .management.commands.benchmark_sqlite_concurrency import profile_settings
+from .management.commands.sync_replicas import copy_database
+from .middleware import PrimaryStickinessMiddleware
+from .models import (
+    Answer, Application, ArchivedApplication, ArchivedJobPosting, CustomUser, EducationLevel, JobPosting, Question, QuestionOption, Recommendation, Task,
+)
+from .purge import purge_job
+from .routers import PrimaryReplicaRouter
+from .search import SimpleSearchBackend, get_search_backend
+from .synthetic import SyntheticDataGenerator, delete_synthetic_data
+
+
+# Las pruebas corren en un solo proceso: ahí LocMemCache sirve para el motor de
+# sesiones en caché (en settings solo se activa con una caché compartida).
+CACHED_SESSIONS = 'recruiter_app.sessions'
+
+
+def create_job(recruiter, title, description='', **extra):
+    """Crea una oferta mínima para las pruebas."""
+    defaults = {'salary': Decimal('1500.00'), 'min_education': EducationLevel.objects.get(name='Universitaria')}
+    defaults.update(extra)
+    return JobPosting.objects.create(recruiter=recruiter, title=title, description=description, **defaults)
+
+
+def create_application(job, applicant, answers=(), **extra):
+    """Crea una postulación con sus respuestas, sin archivo de CV real."""
+    application = Application.objects.create(job_posting=job, applicant=applicant, cv='cvs/prueba.pdf', **extra)
+    counters.record_created(job.pk, application.status)
+    Answer.objects.bulk_create(
+        Answer(application=application, question=question, answer_text=text) for question, text in answers
+    )
+    return application
+
+
+class SearchIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.student = CustomUser.objects.create_user('alumno', password=None)
+        cls.engineer = create_job(cls.company, 'Ingeniería de Software', 'Desarrollo backend en Python')
+        cls.sales = create_job(cls.company, 'Vendedor', 'Atención al cliente, conocimientos de ingeniería deseables')
+        cls.other = create_job(cls.company, 'Contador', 'Contabilidad general')
+
+    def search(self, query):
+        return list(get_search_backend().search(JobPosting.objects.all(), query))
+
+    def test_accent_and_case_insensitive_ranked(self):
+        self.assertEqual(self.search('INGENIERIA'), [self.engineer, self.sales])
+
+    def test_prefix_terms_are_combined(self):
+        self.assertEqual(self.search('desarr pyth'), [self.engineer])
+        self.assertEqual(self.search('"); DROP'), [])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.other.title = 'Analista de datos'
+        self.other.save()
+        self.assertEqual(self.search('analista'), [self.other])
+        self.assertEqual(self.search('contador'), [])
+        self.other.delete()
+        self.assertEqual(self.search('analista'), [])
+
+    def test_rebuild_command(self):
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(self.search('vendedor'), [self.sales])
+
+    def test_search_view(self):
+        self.client.force_login(self.student)
+        response = self.client.get(reverse('search_jobs'), {'q': 'contabilidad'})
+        self.assertEqual(list(response.context['jobs']), [self.other])
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.student = CustomUser.objects.create_user('alumno', password=None)
+        cls.jobs = [create_job(cls.company, f'Practicante {i}', 'Python ' * 100) for i in range(5)]
+
+    def collect(self, url, params):
+        """Recorre todas las páginas siguiendo el cursor."""
+        seen, cursor = [], None
+        while True:
+            response = self.client.get(url, dict(params, page_size=2, **({'cursor': cursor} if cursor else {})))
+            page = response.context['page']
+            seen.extend(job.id for job in page)
+            self.assertLessEqual(len(page), 2)
+            if not page.has_next:
+                return seen
+            cursor = page.next_cursor
+
+    def test_list_jobs_walks_all_pages_newest_first(self):
+        self.client.force_login(self.company)
+        ids = self.collect(reverse('list_jobs'), {})
+        self.assertEqual(ids, [job.id for job in reversed(self.jobs)])
+
+    def test_search_walks_ranked_pages(self):
+        self.client.force_login(self.student)
+        ids = self.collect(reverse('search_jobs'), {'q': 'practicante'})
+        self.assertEqual(sorted(ids), sorted(job.id for job in self.jobs))
+
+    def test_excerpt_is_computed_in_database(self):
+        self.client.force_login(self.student)
+        response = self.client.get(reverse('search_jobs'))
+        job = response.context['jobs'].items[0]
+        self.assertEqual(len(job.excerpt), 151)
+        self.assertIn('description', job.get_deferred_fields())
+
+    def test_invalid_cursor_is_rejected(self):
+        self.client.force_login(self.student)
+        response = self.client.get(reverse('search_jobs'), {'cursor': 'no-valido'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_values_of_the_wrong_type_are_rejected(self):
+        self.client.force_login(self.student)
+        tampered = [['x', 'y'], [None, None], [{'a': 1}, 1], [[1], 2], ['2024-01-01T00:00:00', 'abc']]
+        for values in tampered:
+            cursor = pagination.encode_cursor(values)
+            for params in ({'cursor': cursor}, {'cursor': cursor, 'q': 'analista'}):
+                with self.subTest(values=values, params=params):
+                    self.assertEqual(self.client.get(reverse('search_jobs'), params).status_code, 400)
+
+
+class QueryBudgetTests(TestCase):
+    """
+    Presupuesto fijo de consultas por vista: cada vista se mide con pocas y con
+    muchas filas y debe mantenerse dentro del mismo límite (sin N+1). Incluye
+    la consulta de sesión y la del usuario autenticado.
+    """
+    BUDGETS = {
+        'received_applications': 3,
+        'my_applications': 3,
+        'view_applications': 4,
+        'view_application_detail': 4,
+        'list_jobs': 3,
+        'search_jobs': 5,  # Página, niveles educativos y conteos de facetas (todo en caché después)
+        'apply_to_job': 5,
+        'admin:recruiter_app_application_changelist': 6,
+        'admin:recruiter_app_answer_changelist': 6,
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True, is_staff=True, is_superuser=True)
+        cls.job = create_job(cls.company, 'Practicante de datos')
+        cls.questions = [
+            Question.objects.create(job_posting=cls.job, text=f'Pregunta {i}', question_type='open') for i in range(3)
+        ]
+        closed = Question.objects.create(job_posting=cls.job, text='¿Turno?', question_type='closed')
+        QuestionOption.objects.bulk_create(QuestionOption(question=closed, text=t) for t in ('Mañana', 'Tarde'))
+
+    def setUp(self):
+        self.students = []
+
+    def add_rows(self, count):
+        """Agrega ``count`` estudiantes, cada uno con una postulación y respuestas."""
+        for _ in range(count):
+            index = len(self.students)
+            student = CustomUser.objects.create_user(f'alumno{index}', password=None)
+            self.students.append(student)
+            create_application(self.job, student, [(q, f'Respuesta {index}') for q in self.questions])
+
+    def url_for(self, name):
+        if name == 'view_applications':
+            return reverse(name, args=[self.job.id])
+        if name == 'apply_to_job':
+            return reverse(name, args=[self.job.id])
+        if name == 'view_application_detail':
+            return reverse(name, args=[self.job.applications.latest('id').id])
+        return reverse(name)
+
+    def user_for(self, name):
+        return self.students[0] if name in ('my_applications', 'search_jobs', 'apply_to_job') else self.company
+
+    def assertWithinBudget(self, name):
+        self.client.force_login(self.user_for(name))
+        url = self.url_for(name)
+        cache.clear()  # Se mide el peor caso, sin resultados en caché
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(len(queries), 0)
+        self.assertLessEqual(
+            len(queries), self.BUDGETS[name],
+            f'{name} ejecutó {len(queries)} consultas (presupuesto {self.BUDGETS[name]}):\n'
+            + '\n'.join(query['sql'] for query in queries),
+        )
+        return len(queries)
+
+    def check_budget(self, name):
+        self.add_rows(2)
+        few = self.assertWithinBudget(name)
+        self.add_rows(10)
+        many = self.assertWithinBudget(name)
+        self.assertEqual(few, many, f'{name} depende del número de filas')
+
+    def test_received_applications(self):
+        self.check_budget('received_applications')
+
+    def test_my_applications(self):
+        self.check_budget('my_applications')
+
+    def test_view_applications(self):
+        self.check_budget('view_applications')
+
+    def test_view_application_detail(self):
+        self.check_budget('view_application_detail')
+
+    def test_list_jobs(self):
+        self.check_budget('list_jobs')
+
+    def test_search_jobs(self):
+        self.check_budget('search_jobs')
+
+    def test_apply_to_job(self):
+        self.check_budget('apply_to_job')
+
+    def test_admin_application_changelist(self):
+        self.check_budget('admin:recruiter_app_application_changelist')
+
+    def test_admin_answer_changelist(self):
+        self.check_budget('admin:recruiter_app_answer_changelist')
+
+
+@override_settings(SESSION_ENGINE=CACHED_SESSIONS)
+class JobPostingWriteTests(TestCase):
+    BASE = {'title': 'Analista', 'description': 'Oferta', 'salary': '1200', 'min_education': 'Técnica'}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+
+    def setUp(self):
+        self.client.force_login(self.company)
+
+    def test_create_is_bounded_for_large_postings(self):
+        data = {**self.BASE, **question_payload(50, 20)}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('create_job_posting'), data)
+        self.assertLessEqual(len(queries), 12)
+        self.assertRedirects(response, reverse('list_jobs'))
+        job = JobPosting.objects.get(recruiter=self.company)
+        self.assertEqual(job.questions.count(), 50)
+        self.assertEqual(QuestionOption.objects.filter(question__job_posting=job).count(), 1000)
+
+    def test_edit_diffs_options_and_deletes_questions(self):
+        self.client.post(reverse('create_job_posting'), {**self.BASE, **question_payload(3, 3)})
+        job = JobPosting.objects.get(recruiter=self.company)
+        questions = list(job.questions.order_by('id'))
+        kept = questions[0].options.get(text='Opción 1')
+
+        data = {**self.BASE, **question_payload(3, 3, existing=[q.id for q in questions])}
+        data['options_for_questions-0'] = 'Opción 1||Nueva'
+        data['questions-1-question_type'] = 'open'
+        data['questions-2-DELETE'] = 'on'
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('edit_job_posting', args=[job.id]), data)
+        # Incluye las lecturas que Django hace antes de borrar filas con receptores
+        # de post_delete (invalidación de caché), una consulta por pregunta editada
+        # y dos para validar el nivel educativo (campo del formulario y ForeignKey).
+        self.assertLessEqual(len(queries), 21)
+        self.assertRedirects(response, reverse('list_jobs'))
+
+        options = list(questions[0].options.order_by('id').values_list('id', 'text'))
+        self.assertEqual(options[0], (kept.id, 'Opción 1'))
+        self.assertEqual([text for _, text in options], ['Opción 1', 'Nueva'])
+        questions[1].refresh_from_db()
+        self.assertEqual(questions[1].question_type, 'open')
+        self.assertFalse(questions[1].options.exists())
+        self.assertFalse(Question.objects.filter(id=questions[2].id).exists())
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ApplyToJobTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.student = CustomUser.objects.create_user('alumno', password=None)
+        cls.job = create_job(cls.company, 'Soporte TI')
+        cls.questions = [
+            Question.objects.create(job_posting=cls.job, text=f'Pregunta {i}', question_type='open') for i in range(10)
+        ]
+
+    def test_submission_inserts_answers_in_bulk(self):
+        self.client.force_login(self.student)
+        data = {f'answer_text_{q.id}': f'Respuesta {q.id}' for q in self.questions}
+        data['cv'] = SimpleUploadedFile('cv.pdf', SAMPLE_PDF, content_type='application/pdf')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('apply_to_job', args=[self.job.id]), data)
+        # Se inspeccionan antes de assertRedirects, que hace otra petición
+        inserts = [q for q in queries if q['sql'].startswith('INSERT INTO "recruiter_app_answer"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertRedirects(response, reverse('my_applications'))
+        application = Application.objects.get(applicant=self.student)
+        self.assertEqual(application.answers.count(), 10)
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp(), CV_MAX_UPLOAD_SIZE=1024)
+class CVUploadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.student = CustomUser.objects.create_user('alumno', password=None)
+        cls.jobs = [create_job(cls.company, f'Oferta {i}') for i in range(2)]
+
+    def setUp(self):
+        self.client.force_login(self.student)
+
+    def apply(self, job, content, name='cv.pdf', content_type='application/pdf'):
+        upload = SimpleUploadedFile(name, content, content_type=content_type)
+        return self.client.post(reverse('apply_to_job', args=[job.id]), {'cv': upload})
+
+    def test_identical_cvs_are_stored_once(self):
+        for job in self.jobs:
+            self.assertEqual(self.apply(job, SAMPLE_PDF, name='Mi CV.pdf').status_code, 302)
+        first, second = Application.objects.order_by('id')
+        digest = hashlib.sha256(SAMPLE_PDF).hexdigest()
+        self.assertEqual(first.cv.name, f'cvs/{digest[:2]}/{digest[2:4]}/{digest}.pdf')
+        self.assertEqual(first.cv.name, second.cv.name)
+        self.assertEqual((first.cv_sha256, first.cv_filename), (digest, 'Mi CV.pdf'))
+        self.assertEqual(first.cv.read(), SAMPLE_PDF)
+
+    def test_oversized_and_non_pdf_files_are_rejected(self):
+        response = self.apply(self.jobs[0], SAMPLE_PDF + b'0' * 2048)
+        self.assertFormError(response.context['application_form'], 'cv', 'El CV no puede superar 1.0\xa0KB.')
+        response = self.apply(self.jobs[0], b'MZ\x90\x00', name='cv.pdf')
+        self.assertFormError(response.context['application_form'], 'cv', 'El archivo no es un PDF válido.')
+        response = self.apply(self.jobs[0], SAMPLE_PDF, name='cv.docx', content_type='application/msword')
+        self.assertFormError(response.context['application_form'], 'cv', 'Solo se aceptan CVs en formato PDF.')
+        self.assertFalse(Application.objects.exists())
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class CVDownloadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.other_company = CustomUser.objects.create_user('otra', password=None, is_company=True)
+        cls.student = CustomUser.objects.create_user('alumno', password=None)
+        cls.job = create_job(cls.company, 'Oferta')
+
+    def setUp(self):
+        self.client.force_login(self.student)
+        self.client.post(reverse('apply_to_job', args=[self.job.id]), {
+            'cv': SimpleUploadedFile('Mi CV.pdf', SAMPLE_PDF, content_type='application/pdf'),
+        })
+        self.application = Application.objects.get()
+        self.url = reverse('download_cv', args=[self.application.id])
+        self.client.force_login(self.company)
+
+    def test_full_download_with_validators(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), SAMPLE_PDF)
+        self.assertEqual(response['ETag'], f'"{self.application.cv_sha256}"')
+        self.assertIn("filename*=UTF-8''Mi%20CV.pdf", response['Content-Disposition'])
+        self.assertIn('private', response['Cache-Control'])
+
+    def test_if_none_match_returns_304(self):
+        etag = f'"{self.application.cv_sha256}"'
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_range_requests(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-7')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), SAMPLE_PDF[:8])
+        self.assertEqual(response['Content-Range'], f'bytes 0-7/{len(SAMPLE_PDF)}')
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-6')
+        self.assertEqual(b''.join(response.streaming_content), SAMPLE_PDF[-6:])
+        response = self.client.get(self.url, HTTP_RANGE=f'bytes={len(SAMPLE_PDF)}-')
+        self.assertEqual(response.status_code, 416)
+
+    def test_only_owner_recruiter_can_download(self):
+        self.client.force_login(self.other_company)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    @override_settings(DEBUG=True)
+    def test_media_url_does_not_serve_cvs(self):
+        # Ni con DEBUG: la única vía es download_cv, con su control de permisos
+        import job_portal.urls
+        self.addCleanup(clear_url_caches)
+        self.addCleanup(importlib.reload, job_portal.urls)  # Con DEBUG ya restaurado
+        importlib.reload(job_portal.urls)
+        clear_url_caches()
+        self.assertEqual(self.client.get(settings.MEDIA_URL + self.application.cv.name).status_code, 404)
+
+    @override_settings(CV_SENDFILE_BACKEND='x-accel-redirect')
+    def test_accel_redirect_hands_off_to_web_server(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.application.cv.name}')
+        self.assertEqual(response.content, b'')
+
+
+class BulkApplicationActionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.other_company = CustomUser.objects.create_user('otra', password=None, is_company=True)
+        cls.job = create_job(cls.company, 'Oferta')
+        cls.foreign_job = create_job(cls.other_company, 'Ajena')
+        question = Question.objects.create(job_posting=cls.job, text='¿Por qué?', question_type='open')
+        cls.apps = [
+            create_application(cls.job, CustomUser.objects.create_user(f'alumno{i}', password=None), [(question, 'x')])
+            for i in range(20)
+        ]
+        cls.foreign = create_application(cls.foreign_job, cls.apps[0].applicant)
+
+    def setUp(self):
+        self.client.force_login(self.company)
+
+    def test_bulk_status_is_a_single_update_and_skips_foreign_ids(self):
+        ids = [app.id for app in self.apps[:10]] + [self.foreign.id]
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(reverse('bulk_update_application_status'), {'application_ids': ids, 'status': 'accepted'})
+        updates = [q for q in queries if q['sql'].startswith('UPDATE "recruiter_app_application"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(Application.objects.filter(status='accepted').count(), 10)
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.status, 'pending')
+        response = self.client.get(reverse('received_applications'))
+        self.assertContains(response, '10 postulaciones marcadas como aceptado.')
+        self.assertContains(response, '1 postulaciones no se actualizaron')
+
+    def test_bulk_status_by_filter(self):
+        Application.objects.filter(id=self.apps[0].id).update(status='accepted')
+        self.client.post(reverse('bulk_update_application_status'), {
+            'select_all': '1', 'current_status': 'pending', 'job_id': self.job.id, 'status': 'rejected',
+        })
+        self.assertEqual(Application.objects.filter(job_posting=self.job, status='rejected').count(), 19)
+        self.assertEqual(Application.objects.get(id=self.apps[0].id).status, 'accepted')
+
+    def test_bulk_delete(self):
+        ids = [app.id for app in self.apps[:5]] + [self.foreign.id]
+        response = self.client.post(reverse('bulk_delete_applications'), {
+            'application_ids': ids, 'next': reverse('view_applications', args=[self.job.id]),
+        })
+        self.assertRedirects(response, reverse('view_applications', args=[self.job.id]))
+        self.assertEqual(self.job.applications.count(), 15)
+        self.assertEqual(Answer.objects.filter(application_id__in=ids).count(), 0)
+        self.assertTrue(Application.objects.filter(id=self.foreign.id).exists())
+
+    def test_empty_selection_is_rejected(self):
+        response = self.client.post(reverse('bulk_delete_applications'), {}, follow=True)
+        self.assertContains(response, 'Selecciona al menos una postulación.')
+        self.assertEqual(Application.objects.count(), 21)
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend', MEDIA_ROOT=tempfile.mkdtemp())
+class TaskQueueTests(TestCase):
+    def setUp(self):
+        self.company = CustomUser.objects.create_user('empresa', 'rrhh@empresa.pe', None, is_company=True)
+        self.student = CustomUser.objects.create_user('alumno', 'alumno@untels.edu.pe', None)
+        self.job = create_job(self.company, 'Analista de datos')
+
+    def test_enqueue_is_idempotent(self):
+        first = taskqueue.enqueue('notify_status_change', key='k1', application_id=1, status='accepted')
+        second = taskqueue.enqueue('notify_status_change', key='k1', application_id=1, status='accepted')
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_apply_enqueues_notification_without_sending_mail(self):
+        self.client.force_login(self.student)
+        self.client.post(reverse('apply_to_job', args=[self.job.id]), {
+            'cv': SimpleUploadedFile('cv.pdf', SAMPLE_PDF, content_type='application/pdf'),
+        })
+        self.assertEqual(len(mail.outbox), 0)
+        notification = Task.objects.get(name='notify_application_received')
+
+        taskqueue.run_pending()
+        notification.refresh_from_db()
+        self.assertEqual(notification.status, 'done')
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), ['alumno@untels.edu.pe', 'rrhh@empresa.pe'])
+
+    def test_bulk_status_enqueues_one_task_per_changed_application(self):
+        apps = [create_application(self.job, self.student) for _ in range(3)]
+        Application.objects.filter(id=apps[0].id).update(status='accepted')
+        self.client.force_login(self.company)
+        self.client.post(reverse('bulk_update_application_status'), {
+            'application_ids': [app.id for app in apps], 'status': 'accepted',
+        })
+        self.client.post(reverse('bulk_update_application_status'), {
+            'application_ids': [app.id for app in apps], 'status': 'accepted',
+        })
+        self.assertEqual(Task.objects.filter(name='notify_status_change').count(), 2)
+        taskqueue.run_pending()
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_repeated_transition_notifies_again(self):
+        app = create_application(self.job, self.student)
+        self.client.force_login(self.company)
+        for status in ('accepted', 'rejected', 'accepted'):
+            self.client.post(reverse('bulk_update_application_status'), {'application_ids': [app.id], 'status': status})
+            taskqueue.run_pending()
+        self.assertEqual(Task.objects.filter(name='notify_status_change', status='done').count(), 3)
+        self.assertEqual([m.body.rsplit(': ', 1)[1] for m in mail.outbox], ['Aceptado.', 'Rechazado.', 'Aceptado.'])
+
+    def test_failed_task_is_retried_with_backoff(self):
+        calls = []
+
+        @taskqueue.task(name='test_flaky', max_attempts=2, retry_delay=30)
+        def flaky():
+            calls.append(1)
+            raise RuntimeError('fallo')
+
+        self.addCleanup(taskqueue.registry.pop, 'test_flaky')
+        pending = taskqueue.enqueue('test_flaky')
+        with self.assertLogs('recruiter_app.taskqueue', 'ERROR'):
+            self.assertEqual(taskqueue.run_pending(), 1)
+        pending.refresh_from_db()
+        self.assertEqual((pending.status, pending.attempts), ('queued', 1))
+        self.assertGreater(pending.run_at, timezone.now() + timedelta(seconds=25))
+        self.assertEqual(taskqueue.run_pending(), 0)  # Aún no le toca
+
+        Task.objects.filter(pk=pending.pk).update(run_at=timezone.now())
+        with self.assertLogs('recruiter_app.taskqueue', 'ERROR'):
+            taskqueue.run_pending()
+        pending.refresh_from_db()
+        self.assertEqual((pending.status, pending.attempts, len(calls)), ('failed', 2, 2))
+        self.assertIn('RuntimeError', pending.last_error)
+
+    def test_worker_command_burst(self):
+        taskqueue.enqueue('notify_application_received', application_id=create_application(self.job, self.student).id)
+        out = StringIO()
+        call_command('run_task_worker', '--burst', stdout=out)
+        self.assertIn('1 tareas procesadas', out.getvalue())
+        self.assertEqual(len(mail.outbox), 2)
+
+
+def text_pdf(text):
+    """PDF de una página con ``text`` en un flujo comprimido con FlateDecode."""
+    content = zlib.compress(f'BT /F1 12 Tf 72 700 Td ({text}) Tj ET'.encode('latin-1'))
+    return (
+        SAMPLE_PDF.split(b'trailer')[0]
+        + b'4 0 obj<</Length %d/Filter/FlateDecode>>stream\n' % len(content) + content + b'\nendstream endobj\n'
+        + b'trailer<</Root 1 0 R>>\n%%EOF\n'
+    )
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class CandidateSearchTests(TestCase):
+    def setUp(self):
+        self.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        self.student = CustomUser.objects.create_user('alumno', password=None)
+        self.job = create_job(self.company, 'Analista de datos')
+        self.question = Question.objects.create(job_posting=self.job, text='¿Qué sabes?', question_type='open')
+
+    def apply(self, username, cv_text):
+        applicant = CustomUser.objects.create_user(username, password=None)
+        self.client.force_login(applicant)
+        self.client.post(reverse('apply_to_job', args=[self.job.id]), {
+            'cv': SimpleUploadedFile('cv.pdf', text_pdf(cv_text), content_type='application/pdf'),
+        })
+        return Application.objects.get(applicant=applicant)
+
+    def search(self, query, backend=None):
+        queryset = Application.objects.filter(job_posting=self.job)
+        return set((backend or get_search_backend()).search_candidates(queryset, query))
+
+    def test_extract_text_without_pypdf(self):
+        # \\363 es la "ó" escrita como escape octal de PDF
+        self.assertEqual(extract_pdf_text(BytesIO(text_pdf('Ingeniero en Computaci\\363n'))), 'Ingeniero en Computación')
+        self.assertEqual(extract_pdf_text(BytesIO(b'no es un pdf')), '')
+
+    def test_cv_text_is_extracted_in_background_and_searchable(self):
+        python_dev = self.apply('ana', 'Experiencia en Python y Django')
+        java_dev = self.apply('beto', 'Experiencia en Java')
+        self.assertEqual(python_dev.cv_text, '')
+        taskqueue.run_pending()
+        python_dev.refresh_from_db()
+        self.assertEqual(python_dev.cv_text, 'Experiencia en Python y Django')
+        self.assertEqual(self.search('djang experiencia'), {python_dev})
+        self.assertEqual(self.search('experiencia'), {python_dev, java_dev})
+
+        self.client.force_login(self.company)
+        response = self.client.get(reverse('received_applications'), {'q': 'python'})
+        self.assertEqual(list(response.context['received_apps']), [python_dev])
+
+    def test_answers_are_indexed_incrementally(self):
+        application = create_application(self.job, self.student, [(self.question, 'Manejo SQL avanzado')])
+        self.assertEqual(self.search('sql'), {application})
+        application.answers.update(answer_text='Manejo Excel')
+        self.assertEqual(self.search('sql'), set())
+        self.assertEqual(self.search('excel'), {application})
+        Application.objects.filter(id=application.id).update(cv_text='Contador público')
+        self.assertEqual(self.search('excel contador'), {application})
+        application.delete()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT count(*) FROM recruiter_app_application_fts')
+            self.assertEqual(cursor.fetchone()[0], 0)
+
+    def test_simple_backend_matches_fts(self):
+        application = create_application(self.job, self.student, [(self.question, 'Manejo SQL')], cv_text='Python')
+        create_application(self.job, self.student, cv_text='Java')
+        self.assertEqual(self.search('python sql', SimpleSearchBackend()), {application})
+        self.assertEqual(self.search('python sql'), {application})
+
+    def test_bulk_select_all_respects_search(self):
+        match = create_application(self.job, self.student, cv_text='Python')
+        other = create_application(self.job, self.student, cv_text='Java')
+        self.client.force_login(self.company)
+        self.client.post(reverse('bulk_update_application_status'), {
+            'select_all': '1', 'q': 'python', 'status': 'accepted',
+        })
+        self.assertEqual(Application.objects.get(id=match.id).status, 'accepted')
+        self.assertEqual(Application.objects.get(id=other.id).status, 'pending')
+
+
+@override_settings(SESSION_ENGINE=CACHED_SESSIONS)
+class CachingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        self.student = CustomUser.objects.create_user('alumno', password=None)
+        self.job = create_job(self.company, 'Analista de datos', 'Python y SQL')
+        self.question = Question.objects.create(job_posting=self.job, text='¿Turno?', question_type='closed')
+        self.option = QuestionOption.objects.create(question=self.question, text='Mañana')
+        self.client.force_login(self.student)
+
+    def get(self, url, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params or {})
+        return response, len(queries)
+
+    def test_search_pages_are_cached_until_a_posting_changes(self):
+        url = reverse('search_jobs')
+        _, cold = self.get(url, {'q': 'analista'})
+        response, warm = self.get(url, {'q': 'analista'})
+        self.assertEqual(warm, 0)  # Ni la sesión ni el usuario: también vienen de la caché
+        self.assertLess(warm, cold)
+        self.assertContains(response, 'Analista de datos')
+
+        self.job.title = 'Analista senior'
+        self.job.save()
+        response, _ = self.get(url, {'q': 'analista'})
+        self.assertContains(response, 'Analista senior')
+
+    def test_question_block_is_invalidated_by_option_and_question_changes(self):
+        url = reverse('apply_to_job', args=[self.job.id])
+        self.get(url)
+        response, warm = self.get(url)
+        self.assertEqual(warm, 0)
+        self.assertContains(response, 'Mañana')
+
+        QuestionOption.objects.create(question=self.question, text='Tarde')
+        self.assertContains(self.get(url)[0], 'Tarde')
+        self.option.delete()
+        self.assertNotContains(self.get(url)[0], 'Mañana')
+        self.question.delete()
+        self.assertNotContains(self.get(url)[0], '¿Turno?')
+
+    def test_bulk_edit_through_service_invalidates(self):
+        url = reverse('apply_to_job', args=[self.job.id])
+        self.get(url)
+        self.client.force_login(self.company)
+        self.client.post(reverse('edit_job_posting', args=[self.job.id]), {
+            'title': 'Analista de datos', 'description': 'Python', 'salary': '1200.00', 'min_education': 'Técnica',
+            **question_payload(1, 2, existing=[self.question.id]),
+        })
+        self.client.force_login(self.student)
+        response, _ = self.get(url)
+        self.assertContains(response, 'Opción 1')
+        self.assertNotContains(response, 'Mañana')
+
+    def test_home_is_served_from_cache(self):
+        self.client.logout()
+        self.client.get(reverse('home'))
+        response, queries = self.get(reverse('home'))
+        self.assertEqual(queries, 0)
+        self.assertContains(response, 'Iniciar Sesión')
+
+    def test_missing_posting_is_404(self):
+        self.assertEqual(self.get(reverse('apply_to_job', args=[999]))[0].status_code, 404)
+        self.assertEqual(self.get(reverse('apply_to_job', args=[999]))[0].status_code, 404)
+
+
+class SQLiteProfileTests(SimpleTestCase):
+    def test_production_profile_pragmas(self):
+        name = os.path.join(tempfile.mkdtemp(), 'perfil.sqlite3')
+        database = connections.configure_settings({'default': profile_settings('production', name)})['default']
+        wrapper = DatabaseWrapper(database, alias='perfil')
+        self.addCleanup(wrapper.close)
+        with wrapper.cursor() as cursor:
+            pragmas = {}
+            for pragma in ('journal_mode', 'synchronous', 'busy_timeout', 'mmap_size'):
+                cursor.execute(f'PRAGMA {pragma}')
+                pragmas[pragma] = cursor.fetchone()[0]
+        self.assertEqual(pragmas, {'journal_mode': 'wal', 'synchronous': 1, 'busy_timeout': 20000, 'mmap_size': 134217728})
+        self.assertEqual(wrapper.transaction_mode, 'IMMEDIATE')
+        self.assertEqual(database['CONN_MAX_AGE'], 600)
+
+
+@override_settings(DATABASE_REPLICAS=['replica1', 'replica2'])
+class ReplicaRoutingTests(SimpleTestCase):
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+        self.token = routers.start_request()
+        self.addCleanup(routers.end_request, self.token)
+
+    def read_inside_view(self, model=JobPosting, write_first=False):
+        @routers.replica_reads
+        def view(request):
+            if write_first:
+                self.router.db_for_write(Application)
+            return self.router.db_for_read(model)
+        return view(None)
+
+    def test_read_only_views_use_a_replica(self):
+        self.assertIn(self.read_inside_view(), {'replica1', 'replica2'})
+        self.assertEqual(self.router.db_for_read(JobPosting), 'default')  # Fuera de la vista
+        self.assertEqual(self.read_inside_view(Session), 'default')
+
+    def test_writes_pin_the_request_to_the_primary(self):
+        self.assertEqual(self.read_inside_view(write_first=True), 'default')
+        self.assertEqual(self.router.db_for_write(JobPosting), 'default')
+
+    def test_sticky_cookie_after_write(self):
+        def write_view(request):
+            self.router.db_for_write(Application)
+            return HttpResponse()
+
+        response = PrimaryStickinessMiddleware(write_view)(RequestFactory().post('/'))
+        self.assertEqual(response.cookies[routers.STICKY_COOKIE]['max-age'], 10)
+
+        request = RequestFactory().get('/')
+        request.COOKIES[routers.STICKY_COOKIE] = '1'
+        read = routers.replica_reads(lambda request: HttpResponse(self.router.db_for_read(JobPosting)))
+        self.assertEqual(PrimaryStickinessMiddleware(read)(request).content, b'default')
+        self.assertIn(PrimaryStickinessMiddleware(read)(RequestFactory().get('/')).content, {b'replica1', b'replica2'})
+
+    def test_read_only_views_are_marked(self):
+        for view in (views.search_jobs, views.list_job_postings, views.received_applications,
+                     views.my_applications, views.view_application_detail):
+            self.assertTrue(getattr(view, 'replica_reads', False), view.__name__)
+        self.assertFalse(getattr(views.apply_to_job, 'replica_reads', False))
+
+    def test_sync_replicas_copies_the_primary(self):
+        directory = tempfile.mkdtemp()
+        primary, replica = os.path.join(directory, 'primary.sqlite3'), os.path.join(directory, 'replica.sqlite3')
+        with closing(sqlite3.connect(primary)) as db, db:
+            db.execute('CREATE TABLE oferta (titulo TEXT)')
+            db.execute("INSERT INTO oferta VALUES ('Analista')")
+        copy_database(primary, replica)
+        with closing(sqlite3.connect(replica)) as db:
+            self.assertEqual(db.execute('SELECT titulo FROM oferta').fetchall(), [('Analista',)])
+
+
+@override_settings(DATABASE_REPLICAS=['lagging'])
+class ReplicaCacheTests(TransactionTestCase):
+    """Búsquedas en caché con una réplica real (otra base SQLite) que no recibe los cambios."""
+    serialized_rollback = True  # Conserva los niveles educativos de las migraciones
+
+    def setUp(self):
+        cache.clear()
+        self.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        self.student = CustomUser.objects.create_user('alumno', password=None)
+        self.job = create_job(self.company, 'Analista de datos', 'Python y SQL')
+
+        # La réplica se queda con la copia de este momento. Se registra solo
+        # durante el test: no se vacía al terminar, se descarta con su archivo.
+        path = os.path.join(tempfile.mkdtemp(), 'lagging.sqlite3')
+        connection.ensure_connection()
+        with closing(sqlite3.connect(path)) as replica:
+            connection.connection.backup(replica)
+        connections.settings['lagging'] = {**connections['default'].settings_dict, 'NAME': path, 'TEST': {}}
+        type(self).databases = {'default', 'lagging'}
+        self.addCleanup(self.remove_replica)
+
+    def remove_replica(self):
+        connections['lagging'].close()
+        del connections.settings['lagging']
+        type(self).databases = {'default'}
+
+    def test_search_after_an_edit_is_not_cached_from_the_replica(self):
+        editor = self.client
+        editor.force_login(self.company)
+        editor.post(reverse('edit_job_posting', args=[self.job.id]), {
+            'title': 'Analista senior', 'description': 'Python', 'salary': '1500.00', 'min_education': 'Universitaria',
+            **question_payload(0, 0),
+        })
+        self.assertEqual(JobPosting.objects.get(id=self.job.id).title, 'Analista senior')
+        self.assertEqual(JobPosting.objects.using('lagging').get(id=self.job.id).title, 'Analista de datos')
+
+        # Otro usuario busca primero: sus lecturas van a la réplica atrasada,
+        # pero lo que se guarda en la caché se calcula en la primaria.
+        other = self.client_class()
+        other.force_login(self.student)
+        self.assertContains(other.get(reverse('search_jobs'), {'q': 'analista'}), 'Analista senior')
+
+        response = editor.get(reverse('search_jobs'), {'q': 'analista'})
+        self.assertContains(response, 'Analista senior')
+        self.assertNotContains(response, 'Analista de datos')
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ApplicationCounterTests(TestCase):
+    def setUp(self):
+        self.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        self.job = create_job(self.company, 'Analista de datos')
+        self.apps = [
+            create_application(self.job, CustomUser.objects.create_user(f'alumno{i}', password=None)) for i in range(4)
+        ]
+        self.client.force_login(self.company)
+
+    def assertCounters(self, total, pending, accepted, rejected):
+        self.job.refresh_from_db()
+        self.assertEqual(
+            [getattr(self.job, field) for field in JobPosting.COUNTER_FIELDS], [total, pending, accepted, rejected],
+        )
+        self.assertFalse(counters.find_drift().exists())
+
+    def test_apply_increments_counters(self):
+        student = CustomUser.objects.create_user('nuevo', password=None)
+        self.client.force_login(student)
+        self.client.post(reverse('apply_to_job', args=[self.job.id]), {
+            'cv': SimpleUploadedFile('cv.pdf', SAMPLE_PDF, content_type='application/pdf'),
+        })
+        self.assertCounters(5, 5, 0, 0)
+
+    def test_status_changes_and_deletes(self):
+        url = reverse('update_application_status', args=[self.apps[0].id, 'accepted'])
+        self.client.post(url)
+        self.client.post(url)  # Repetir el mismo cambio no vuelve a contar
+        self.assertCounters(4, 3, 1, 0)
+
+        self.client.post(reverse('bulk_update_application_status'), {
+            'application_ids': [app.id for app in self.apps[:3]], 'status': 'rejected',
+        })
+        self.assertCounters(4, 1, 0, 3)
+
+        self.client.post(reverse('bulk_delete_applications'), {'application_ids': [self.apps[0].id, self.apps[3].id]})
+        self.client.post(reverse('delete_application', args=[self.apps[1].id]))
+        self.assertCounters(1, 0, 0, 1)
+
+    def test_editing_a_posting_keeps_counters(self):
+        stale = JobPosting.objects.get(id=self.job.id)
+        create_application(self.job, self.company)
+        stale.title = 'Analista senior'
+        stale.save()
+        self.assertCounters(5, 5, 0, 0)
+
+    def test_list_jobs_shows_stats(self):
+        response = self.client.get(reverse('list_jobs'))
+        self.assertContains(response, '4 Postulaciones')
+        self.assertContains(response, '4 pendientes')
+
+    def test_reconcile_command_repairs_drift(self):
+        JobPosting.objects.filter(id=self.job.id).update(applications_total=9, applications_rejected=-2)
+        out = StringIO()
+        call_command('reconcile_application_counters', '--dry-run', stdout=out)
+        self.assertIn('1 ofertas con diferencias', out.getvalue())
+        call_command('reconcile_application_counters', stdout=out)
+        self.assertIn('1 ofertas corregidas', out.getvalue())
+        self.assertCounters(4, 4, 0, 0)
+
+
+class PerfMonitoringTests(TestCase):
+    def setUp(self):
+        perf.STATS.reset()
+        self.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        create_job(self.company, 'Analista de datos')
+        self.client.force_login(self.company)
+
+    def test_requests_are_aggregated_by_url_name(self):
+        response = self.client.get(reverse('list_jobs'))
+        self.assertRegex(response['Server-Timing'], r'^app;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries", tpl;dur=[\d.]+$')
+        stats = perf.STATS.snapshot()['list_jobs']
+        self.assertEqual(stats['requests'], 1)
+        self.assertGreater(stats['queries_per_request'], 0)
+        self.assertGreater(stats['template_ms_per_request'], 0)
+
+    def test_flags_slow_queries_and_n_plus_one(self):
+        metrics = perf.RequestMetrics()
+        with connection.execute_wrapper(metrics):
+            for job_id in range(5):
+                JobPosting.objects.filter(id=job_id).exists()
+        self.assertEqual(metrics.queries, 5)
+        [(sql, count)] = metrics.repeated_statements()
+        self.assertEqual(count, 5)
+
+        with override_settings(PERF_SLOW_QUERY_MS=0), self.assertLogs('recruiter_app.perf', 'WARNING') as logs:
+            self.client.get(reverse('list_jobs'))
+        self.assertIn('Consulta lenta en list_jobs', logs.output[0])
+        self.assertGreater(perf.STATS.snapshot()['list_jobs']['slow_queries'], 0)
+
+    def test_metrics_endpoint_is_staff_only(self):
+        self.client.get(reverse('list_jobs'))
+        url = reverse('perf_metrics')
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.client.force_login(CustomUser.objects.create_user('admin', password=None, is_staff=True))
+        self.assertEqual(self.client.get(url).json()['views']['list_jobs']['requests'], 1)
+        text = self.client.get(url, {'format': 'prometheus'}).content.decode()
+        self.assertIn('recruiter_request_seconds_count{view="list_jobs"} 1', text)
+        self.assertIn('# TYPE recruiter_db_queries_total counter', text)
+
+    @override_settings(PERF_MONITORING=False)
+    def test_can_be_disabled(self):
+        self.client.get(reverse('list_jobs'))
+        self.assertNotIn('Server-Timing', self.client.get(reverse('list_jobs')))
+        self.assertEqual(perf.STATS.snapshot(), {})
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp(), ALLOWED_HOSTS=['localhost'], SESSION_ENGINE=CACHED_SESSIONS)
+class BenchmarkSuiteTests(TestCase):
+    SCALE = {'companies': 3, 'students': 30, 'jobs': 12, 'applications_per_job': 5, 'cv_files': 3}
+
+    def generate(self, seed=7):
+        return SyntheticDataGenerator(seed=seed, batch_size=5, **self.SCALE).run()
+
+    def test_generator_is_reproducible_and_consistent(self):
+        created = self.generate()
+        self.assertEqual(created['jobs'], 12)
+        self.assertEqual(created['applications'], Application.objects.count())
+        self.assertEqual(created['answers'], created['applications'] * 3)
+        self.assertFalse(counters.find_drift().exists())
+        titles = list(JobPosting.objects.order_by('id').values_list('title', 'salary', 'min_education'))
+
+        delete_synthetic_data(batch_size=5)
+        self.assertFalse(JobPosting.objects.exists())
+        self.generate()
+        self.assertEqual(list(JobPosting.objects.order_by('id').values_list('title', 'salary', 'min_education')), titles)
+
+    def test_every_url_has_a_scenario(self):
+        self.assertEqual(set(benchmarks.url_names()) - set(benchmarks.SCENARIOS), set())
+
+    def test_benchmark_report(self):
+        self.generate()
+        out = StringIO()
+        call_command('benchmark_views', '--iterations', '1', '--warmup', '0', stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report['missing'], [])
+        for label, result in report['views'].items():
+            self.assertEqual(result['requests'], 1, label)
+            self.assertTrue(all(status < 400 for status in result['status']), (label, result['status']))
+        self.assertEqual(report['views']['list_jobs']['queries'], 1)  # Sesión y usuario en caché
+        # Las escrituras medidas se revierten
+        self.assertFalse(counters.find_drift().exists())
+        self.assertEqual(JobPosting.objects.count(), 12)
+
+
+@override_settings(SESSION_ENGINE=CACHED_SESSIONS)
+class FacetedSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.student = CustomUser.objects.create_user('alumno', password=None)
+        cls.technical = EducationLevel.objects.get(name='Técnica')
+        cls.university = EducationLevel.objects.get(name='Universitaria')
+        now = timezone.now()
+        for title, salary, level, age in (
+            ('Analista junior', 1200, cls.technical, 0),
+            ('Analista de datos', 2000, cls.university, 3),
+            ('Analista senior', 2800, cls.university, 20),
+            ('Gerente comercial', 6000, cls.university, 90),
+        ):
+            job = create_job(cls.company, title, salary=Decimal(salary), min_education=level)
+            JobPosting.objects.filter(id=job.id).update(created_at=now - timedelta(days=age, hours=1))
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.student)
+
+    def search(self, **params):
+        response = self.client.get(reverse('search_jobs'), params)
+        self.assertEqual(response.status_code, 200)
+        counts = {
+            group: {option['value']: option['count'] for option in options}
+            for group, options in response.context['facets'].items()
+        }
+        return [job.title for job in response.context['jobs']], counts
+
+    def test_filters_and_facet_counts(self):
+        titles, counts = self.search(salary='1500-3000')
+        self.assertEqual(titles, ['Analista de datos', 'Analista senior'])
+        # El grupo filtrado cuenta sin su propio filtro; los demás con él
+        self.assertEqual(counts['salary'], {'hasta-1500': 1, '1500-3000': 2, '3000-5000': 0, 'desde-5000': 1})
+        self.assertEqual(counts['education'][self.university.id], 2)
+        self.assertEqual(counts['education'][self.technical.id], 0)
+        self.assertEqual(counts['posted'], {'24h': 0, '7d': 1, '30d': 2})
+
+        titles, counts = self.search(salary='1500-3000', education=self.university.id, posted='7d')
+        self.assertEqual(titles, ['Analista de datos'])
+        self.assertEqual(counts['posted'], {'24h': 0, '7d': 1, '30d': 2})
+
+    def test_facets_follow_the_text_query(self):
+        titles, counts = self.search(q='analista', education=self.university.id)
+        self.assertCountEqual(titles, ['Analista de datos', 'Analista senior'])
+        self.assertEqual(counts['education'][self.technical.id], 1)
+        self.assertEqual(counts['salary']['desde-5000'], 0)
+
+    def test_unknown_values_are_ignored(self):
+        titles, _ = self.search(salary='gratis', posted='ayer', education='x')
+        self.assertEqual(len(titles), 4)
+
+    def test_counts_are_cached_per_signature(self):
+        self.search(salary='hasta-1500')
+        with CaptureQueriesContext(connection) as queries:
+            self.search(salary='hasta-1500')
+        self.assertEqual(len(queries), 0)  # Sesión y usuario en caché
+        create_job(self.company, 'Analista nuevo', salary=Decimal(1000))
+        titles, counts = self.search(salary='hasta-1500')
+        self.assertEqual(counts['salary']['hasta-1500'], 2)
+
+    def test_pagination_keeps_filters(self):
+        response = self.client.get(reverse('search_jobs'), {'salary': '1500-3000', 'page_size': 1})
+        self.assertContains(response, 'href="?salary=1500-3000&amp;page_size=1&amp;cursor=')
+
+    def test_job_form_takes_level_names(self):
+        self.client.force_login(self.company)
+        data = {'title': 'Soporte', 'description': 'Oferta', 'salary': '1300', 'min_education': 'Técnica'}
+        self.client.post(reverse('create_job_posting'), {**data, **question_payload(0, 0)})
+        self.assertEqual(JobPosting.objects.get(title='Soporte').min_education, self.technical)
+        response = self.client.post(
+            reverse('create_job_posting'), {**data, 'min_education': 'Doctorado', **question_payload(0, 0)},
+        )
+        self.assertIn('min_education', response.context['job_form'].errors)
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class AsyncViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.student = CustomUser.objects.create_user('alumno', password=None)
+        cls.job = create_job(cls.company, 'Analista de datos', salary=Decimal(2000))
+        cls.question = Question.objects.create(job_posting=cls.job, text='¿Experiencia?', question_type='open')
+
+    def setUp(self):
+        cache.clear()
+        perf.STATS.reset()
+
+    def test_student_views_are_coroutines(self):
+        for view in (views.search_jobs, views.my_applications, views.apply_to_job):
+            self.assertTrue(iscoroutinefunction(view), view.__name__)
+
+    async def test_search_and_my_applications(self):
+        await self.async_client.aforce_login(self.student)
+        response = await self.async_client.get(reverse('search_jobs'), {'q': 'analista', 'salary': '1500-3000'})
+        self.assertEqual([job.title for job in response.context['jobs']], ['Analista de datos'])
+        self.assertEqual(response.context['facets']['salary'][1]['count'], 1)
+        # PerfMiddleware también mide las consultas de las vistas async
+        self.assertGreater(perf.STATS.snapshot()['search_jobs']['queries_per_request'], 0)
+
+        await Application.objects.acreate(job_posting=self.job, applicant=self.student, cv='cvs/cv.pdf')
+        response = await self.async_client.get(reverse('my_applications'))
+        self.assertContains(response, 'Analista de datos')
+
+    async def test_apply_stores_cv_and_answers(self):
+        await self.async_client.aforce_login(self.student)
+        url = reverse('apply_to_job', args=[self.job.id])
+        self.assertEqual((await self.async_client.get(url)).status_code, 200)
+        response = await self.async_client.post(url, {
+            'cv': SimpleUploadedFile('cv.pdf', SAMPLE_PDF, content_type='application/pdf'),
+            f'answer_text_{self.question.id}': 'Dos años',
+        })
+        self.assertRedirects(response, reverse('my_applications'), fetch_redirect_response=False)
+        application = await Application.objects.select_related('job_posting').aget(applicant=self.student)
+        digest = hashlib.sha256(SAMPLE_PDF).hexdigest()
+        self.assertEqual(application.cv.name, f'cvs/{digest[:2]}/{digest[2:4]}/{digest}.pdf')
+        self.assertTrue(application.cv.storage.exists(application.cv.name))
+        self.assertEqual(await application.answers.acount(), 1)
+        self.assertEqual(application.job_posting.applications_total, 1)
+
+        self.assertEqual((await self.async_client.get(reverse('apply_to_job', args=[0]))).status_code, 404)
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ApplicationExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.job = create_job(cls.company, 'Analista de datos')
+        cls.questions = [
+            Question.objects.create(job_posting=cls.job, text=text, question_type='open')
+            for text in ('¿Experiencia?', '¿Disponibilidad?')
+        ]
+        for index in range(3):
+            student = CustomUser.objects.create_user(f'alumno{index}', email=f'a{index}@example.com', password=None)
+            create_application(cls.job, student, [(cls.questions[0], f'{index} años')])
+        # Respuesta que Excel tomaría como fórmula
+        Answer.objects.create(application=Application.objects.first(), question=cls.questions[1], answer_text='=1+1')
+
+    def setUp(self):
+        self.client.force_login(self.company)
+        self.url = reverse('export_applications', args=[self.job.id])
+
+    def test_csv_has_one_column_per_question(self):
+        response = self.client.get(self.url)
+        self.assertTrue(response.streaming)
+        self.assertIn('postulaciones-', response['Content-Disposition'])
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(csv.reader(b''.join(response.streaming_content).decode('utf-8-sig').splitlines()))
+        self.assertEqual(len(queries), 2)  # Postulaciones y sus respuestas, por bloque
+        self.assertEqual(rows[0][-2:], ['¿Experiencia?', '¿Disponibilidad?'])
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[1][1:3], ['alumno0', 'a0@example.com'])
+        self.assertEqual(rows[1][-2:], ['0 años', "'=1+1"])
+        self.assertEqual(rows[3][-2:], ['2 años', ''])
+
+    def test_xlsx_and_zip_bundle(self):
+        response = self.client.get(self.url, {'format': 'xlsx'})
+        with zipfile.ZipFile(BytesIO(b''.join(response.streaming_content))) as archive:
+            sheet = archive.read('xl/worksheets/sheet1.xml').decode()
+        self.assertIn('<t xml:space="preserve">¿Disponibilidad?</t>', sheet)
+        self.assertIn('<row r="4">', sheet)
+
+        application = Application.objects.order_by('id').first()
+        application.cv_filename = 'cv.pdf'
+        application.cv.save('cv.pdf', ContentFile(SAMPLE_PDF), save=True)
+        response = self.client.get(self.url, {'format': 'zip'})
+        with zipfile.ZipFile(BytesIO(b''.join(response.streaming_content))) as archive:
+            names = archive.namelist()
+            self.assertEqual(archive.read(names[1]), SAMPLE_PDF)
+        # Las postulaciones cuyo archivo no existe se omiten
+        self.assertEqual(names, ['postulaciones.csv', f'cvs/{application.id}-alumno0-cv.pdf'])
+
+    def test_only_the_owner_can_export(self):
+        self.client.force_login(CustomUser.objects.create_user('otra', password=None, is_company=True))
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+class JobImportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        EducationLevel.objects.get_or_create(name='Técnica')
+
+    def test_csv_upload_creates_valid_rows_and_reports_errors(self):
+        content = '\n'.join([
+            'title,description,salary,min_education,question_1,question_1_options,question_2',
+            'Analista,Datos,1500,Técnica,¿Turno?,Mañana||Tarde,¿Experiencia?',
+            ',Sin título,abc,Doctorado,,,',
+            'Soporte,Mesa de ayuda,900,Técnica,,,',
+        ])
+        self.client.force_login(self.company)
+        response = self.client.post(reverse('import_job_postings'), {
+            'file': SimpleUploadedFile('ofertas.csv', content.encode()),
+        })
+        result = response.context['result']
+        self.assertEqual((result.created, result.questions, result.options), (2, 2, 2))
+        self.assertEqual([line for line, _ in result.errors], [3])
+        self.assertEqual(set(result.errors[0][1]), {'title', 'salary', 'min_education'})
+        job = JobPosting.objects.get(title='Analista')
+        self.assertEqual(job.recruiter, self.company)
+        closed = job.questions.get(question_type='closed')
+        self.assertEqual(list(closed.options.values_list('text', flat=True)), ['Mañana', 'Tarde'])
+
+    def test_imported_ids_are_not_stuck_as_missing(self):
+        # Un id pedido antes de existir no queda en caché como 404
+        cache.clear()
+        next_id = (JobPosting.all_objects.order_by('-id').values_list('id', flat=True).first() or 0) + 1
+        self.client.force_login(CustomUser.objects.create_user('alumno', password=None))
+        self.assertEqual(self.client.get(reverse('apply_to_job', args=[next_id])).status_code, 404)
+        content = 'title,description,salary,min_education\nAnalista,Datos,1500,Técnica\n'
+        self.client.force_login(self.company)
+        self.client.post(reverse('import_job_postings'), {'file': SimpleUploadedFile('ofertas.csv', content.encode())})
+        self.assertEqual(JobPosting.objects.get(title='Analista').id, next_id)
+        self.client.force_login(CustomUser.objects.get(username='alumno'))
+        self.assertEqual(self.client.get(reverse('apply_to_job', args=[next_id])).status_code, 200)
+
+    def test_command_imports_jsonl_in_batches(self):
+        base = {'description': 'x', 'salary': '1200', 'min_education': 'Técnica'}
+        lines = [json.dumps({**base, 'title': f'Oferta {index}', 'questions': [
+            {'text': '¿Inglés?', 'question_type': 'closed', 'options': ['Sí', 'No']},
+        ]}) for index in range(5)]
+        lines.insert(2, '{no es json')
+        lines.append(json.dumps({**base, 'title': 'Mala', 'questions': [{'question_type': 'otro'}]}))
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False, encoding='utf-8') as file:
+            file.write('\n'.join(lines))
+        self.addCleanup(os.remove, file.name)
+        stdout, stderr = StringIO(), StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command(
+                'import_job_postings', file.name, recruiter='empresa', batch_size=2, stdout=stdout, stderr=stderr,
+            )
+        summary = json.loads(stdout.getvalue())
+        self.assertEqual((summary['created'], summary['options'], summary['invalid_rows']), (5, 10, 2))
+        self.assertIn('Línea 3', stderr.getvalue())
+        self.assertIn('questions[0].question_type', stderr.getvalue())
+        self.assertEqual(JobPosting.objects.count(), 5)
+        # Tres lotes: las consultas no crecen con el número de filas
+        self.assertLess(len(queries), 30)
+
+        call_command('import_job_postings', file.name, recruiter='empresa', dry_run=True, stdout=StringIO(), stderr=StringIO())
+        self.assertEqual(JobPosting.objects.count(), 5)
+
+
+@override_settings(SESSION_ENGINE=CACHED_SESSIONS)
+class CachedAuthTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.company = CustomUser.objects.create_user('empresa', password='clave-segura-123', is_company=True)
+
+    def test_cached_sessions_require_a_shared_cache(self):
+        self.assertEqual([error.id for error in checks.check_session_cache(None)], ['recruiter_app.E001'])
+        shared = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': tempfile.mkdtemp()}}
+        with override_settings(CACHES=shared):
+            self.assertEqual(checks.check_session_cache(None), [])
+        with override_settings(SESSION_ENGINE='django.contrib.sessions.backends.db'):
+            self.assertEqual(checks.check_session_cache(None), [])
+
+    def auth_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [q['sql'] for q in queries if 'django_session' in q['sql'] or 'recruiter_app_customuser' in q['sql']]
+
+    def test_steady_state_pages_make_no_auth_queries(self):
+        self.assertTrue(self.client.login(username='empresa', password='clave-segura-123'))
+        # El login se escribe en la BD aunque las escrituras se agrupen
+        self.assertTrue(Session.objects.filter(session_key=self.client.session.session_key).exists())
+        self.auth_queries(reverse('dashboard'))
+        self.assertEqual(self.auth_queries(reverse('list_jobs')), [])
+        self.assertEqual(self.auth_queries(reverse('dashboard')), [])
+
+        # Sin caché se vuelve a la BD y la sesión sigue siendo válida
+        cache.clear()
+        self.assertEqual(len(self.auth_queries(reverse('dashboard'))), 2)
+
+    def test_user_cache_is_invalidated_on_save(self):
+        backend = CachedModelBackend()
+        self.assertTrue(backend.get_user(self.company.id).is_company)
+        self.company.is_company = False
+        self.company.save()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertFalse(backend.get_user(self.company.id).is_company)
+            self.assertFalse(backend.get_user(self.company.id).is_company)
+        self.assertEqual(len(queries), 1)
+        self.company.is_active = False
+        self.company.save()
+        self.assertIsNone(backend.get_user(self.company.id))
+
+    def test_sessions_from_the_default_backend_stay_logged_in(self):
+        self.client.force_login(self.company, backend='django.contrib.auth.backends.ModelBackend')
+        key = self.client.session.session_key
+        cache.clear()
+        response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.wsgi_request.user, self.company)
+        stored = Session.objects.get(session_key=key).get_decoded()
+        self.assertEqual(stored['_auth_user_backend'], 'recruiter_app.auth.CachedModelBackend')
+
+    @override_settings(SESSION_DB_SAVE_INTERVAL=60)
+    def test_session_saves_are_coalesced(self):
+        store = sessions.SessionStore()
+        store['filtro'] = 'a'
+        store.create()
+        key = store.session_key
+
+        store = sessions.SessionStore(key)
+        store['filtro'] = 'b'
+        with CaptureQueriesContext(connection) as queries:
+            store.save()
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(sessions.SessionStore(key)['filtro'], 'b')
+        self.assertEqual(Session.objects.get(session_key=key).get_decoded()['filtro'], 'a')
+
+        # Un cambio de usuario no espera al intervalo
+        store = sessions.SessionStore(key)
+        store['_auth_user_id'] = str(self.company.id)
+        store.save()
+        self.assertEqual(Session.objects.get(session_key=key).get_decoded()['filtro'], 'b')
+
+        with override_settings(SESSION_DB_SAVE_INTERVAL=0):
+            store = sessions.SessionStore(key)
+            store['filtro'] = 'c'
+            store.save()
+        self.assertEqual(Session.objects.get(session_key=key).get_decoded()['filtro'], 'c')
+
+
+@override_settings(SESSION_ENGINE=CACHED_SESSIONS)
+class RecommendationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        cls.student = CustomUser.objects.create_user('alumno', password=None)
+        cls.other = CustomUser.objects.create_user('otro', password=None)
+        cls.applied = create_job(cls.company, 'Desarrollador Python', 'Django, APIs REST y SQL')
+        cls.python = create_job(cls.company, 'Programador Python junior', 'Django y PostgreSQL')
+        cls.sales = create_job(cls.company, 'Vendedor de seguros', 'Atención comercial y ventas')
+        create_job(cls.company, 'Chofer repartidor', 'Licencia de conducir')
+        create_application(cls.applied, cls.student, cv_text='Experiencia en Python, Django y SQL')
+        create_application(cls.sales, cls.other, cv_text='Ventas y atención al cliente')
+
+    def recommended(self, student):
+        return [r.job_posting.title for r in recommendations.recommended_for(student)]
+
+    def test_build_ranks_similar_postings_and_skips_applied(self):
+        out = StringIO()
+        call_command('build_recommendations', stdout=out)
+        self.assertIn('recomendaciones para 2 estudiantes', out.getvalue())
+        self.assertEqual(self.recommended(self.student)[0], 'Programador Python junior')
+        self.assertNotIn('Desarrollador Python', self.recommended(self.student))
+        self.assertNotIn('Vendedor de seguros', self.recommended(self.other))
+
+        self.client.force_login(self.student)
+        self.client.get(reverse('dashboard'))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('dashboard'))
+        self.assertEqual(len(queries), 1)
+        self.assertContains(response, 'Recomendadas para ti')
+        self.assertContains(response, reverse('apply_to_job', args=[self.python.id]))
+
+    def test_python_fallback_matches_sparse_scores(self):
+        recommendations.RecommendationBuilder().run()
+        sparse_scores = set(Recommendation.objects.values_list('student_id', 'job_posting_id', 'score'))
+        with mock.patch.object(recommendations, 'sparse', None):
+            recommendations.RecommendationBuilder().run()
+        python_scores = set(Recommendation.objects.values_list('student_id', 'job_posting_id', 'score'))
+        self.assertEqual(
+            {(s, j, round(score, 9)) for s, j, score in sparse_scores},
+            {(s, j, round(score, 9)) for s, j, score in python_scores},
+        )
+
+    def test_new_postings_are_added_incrementally(self):
+        self.assertEqual(recommendations.refresh_job(self.python.id), 0)  # Sin construir aún
+        recommendations.RecommendationBuilder(k=1).run()
+        job = create_job(self.company, 'Python Django senior', 'Python, Django, SQL y Kubernetes')
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(recommendations.refresh_job(job.id, k=1), 1)
+        self.assertLessEqual(len(queries), 11)  # No depende del número de estudiantes
+        self.assertEqual(self.recommended(self.student), ['Python Django senior'])
+        self.assertEqual(Recommendation.objects.filter(student=self.student).count(), 1)
+
+        # Al editarla deja de ser afín y se retira
+        job.title, job.description = 'Cocinero', 'Cocina criolla'
+        job.save()
+        self.assertEqual(recommendations.refresh_job(job.id, k=1), 0)
+        self.assertFalse(Recommendation.objects.filter(job_posting=job).exists())
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class JobPurgeTests(TestCase):
+    def setUp(self):
+        self.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        self.job = create_job(self.company, 'Analista de datos')
+        self.other_job = create_job(self.company, 'Soporte')
+        question = Question.objects.create(job_posting=self.job, text='¿Turno?', question_type='closed')
+        QuestionOption.objects.bulk_create(QuestionOption(question=question, text=text) for text in ('Mañana', 'Tarde'))
+        self.files = []
+        for index in range(5):
+            student = CustomUser.objects.create_user(f'alumno{index}', password=None)
+            application = create_application(self.job, student, [(question, 'Mañana')])
+            application.cv.save('cv.pdf', ContentFile(SAMPLE_PDF + str(index).encode()), save=True)
+            self.files.append(application.cv.name)
+        # El mismo CV en otra oferta: el archivo debe conservarse
+        shared = create_application(self.other_job, CustomUser.objects.create_user('alumno9', password=None))
+        shared.cv = self.files[0]
+        shared.save()
+        self.client.force_login(self.company)
+
+    def test_delete_hides_immediately_and_defers_the_purge(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('delete_job_posting', args=[self.job.id]))
+        self.assertRedirects(response, reverse('list_jobs'))
+        self.assertFalse(any(
+            q['sql'].startswith('DELETE') for q in queries if 'django_session' not in q['sql']
+        ))
+        self.assertEqual(list(JobPosting.objects.values_list('title', flat=True)), ['Soporte'])
+        self.assertEqual(Application.objects.count(), 1)
+        self.assertEqual(Application.all_objects.count(), 6)
+        self.assertEqual(self.client.get(reverse('view_applications', args=[self.job.id])).status_code, 404)
+        self.assertTrue(Task.objects.filter(name='purge_job_posting', payload={'job_id': self.job.id}).exists())
+
+        taskqueue.run_pending(worker_id='test')
+        self.assertFalse(JobPosting.all_objects.filter(id=self.job.id).exists())
+        self.assertEqual(Application.all_objects.count(), 1)
+        self.assertFalse(Question.objects.filter(job_posting_id=self.job.id).exists())
+        self.assertEqual(QuestionOption.objects.count(), 0)
+        self.assertEqual(Answer.objects.count(), 0)
+        # Los CVs se barren recién después del periodo de gracia
+        storage = Application._meta.get_field('cv').storage
+        self.assertTrue(all(storage.exists(name) for name in self.files))
+        sweep = Task.objects.get(name='sweep_orphan_cvs', status='queued')
+        self.assertEqual(sorted(sweep.payload['names']), sorted(self.files))
+        self.assertGreater(sweep.run_at, timezone.now() + timedelta(minutes=30))
+
+    def test_orphan_cvs_survive_reuse_during_the_grace_period(self):
+        storage = Application._meta.get_field('cv').storage
+        old = time.time() - 2 * 3600
+        for name in self.files:
+            os.utime(storage.path(name), (old, old))
+        self.client.post(reverse('delete_job_posting', args=[self.job.id]))
+        taskqueue.run_pending(worker_id='test')
+
+        # Una postulación nueva reutiliza el archivo antes de confirmarse
+        reused = storage.save('cvs/cv.pdf', ContentFile(SAMPLE_PDF + b'1'))
+        self.assertEqual(reused, self.files[1])
+        Task.objects.filter(name='sweep_orphan_cvs').update(run_at=timezone.now())
+        taskqueue.run_pending(worker_id='test')
+        self.assertEqual([storage.exists(name) for name in self.files], [True, True, False, False, False])
+
+        # Pasado el periodo de gracia el barrido completo lo borra
+        os.utime(storage.path(self.files[1]), (old, old))
+        out = StringIO()
+        call_command('sweep_orphan_cvs', stdout=out)
+        self.assertIn('1 CVs huérfanos eliminados', out.getvalue())
+        self.assertEqual([storage.exists(name) for name in self.files], [True, False, False, False, False])
+
+    def test_purge_runs_in_bounded_batches(self):
+        self.assertEqual(purge_job(self.job.id), {})  # Solo se purgan ofertas eliminadas
+        JobPosting.objects.filter(id=self.job.id).update(deleted_at=timezone.now())
+        with CaptureQueriesContext(connection) as queries:
+            deleted = purge_job(self.job.id, batch_size=2)
+        self.assertEqual((deleted[Application], deleted[Answer], deleted[QuestionOption]), (5, 5, 2))
+        application_deletes = [q for q in queries if q['sql'].startswith('DELETE FROM "recruiter_app_application"')]
+        self.assertEqual(len(application_deletes), 3)
+
+        out = StringIO()
+        call_command('purge_deleted_job_postings', stdout=out)
+        self.assertIn('0 ofertas purgadas', out.getvalue())
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ArchiveTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        self.student = CustomUser.objects.create_user('alumno', password=None)
+        old = timezone.now() - timedelta(days=400)
+        self.closed = create_job(self.company, 'Analista 2024', 'Oferta cerrada')
+        self.open = create_job(self.company, 'Soporte 2024')
+        self.recent = create_job(self.company, 'Analista actual')
+        JobPosting.objects.filter(id__in=[self.closed.id, self.open.id]).update(created_at=old)
+        question = Question.objects.create(job_posting=self.closed, text='¿Turno?', question_type='closed')
+        QuestionOption.objects.create(question=question, text='Mañana')
+        self.application = create_application(self.closed, self.student, [(question, 'Mañana')], status='accepted')
+        self.application.cv.save('cv.pdf', ContentFile(SAMPLE_PDF), save=True)
+        create_application(self.open, self.student)  # Pendiente: la oferta aún no se archiva
+
+    def test_command_moves_closed_postings_to_the_archive(self):
+        out = StringIO()
+        call_command('archive_job_postings', '--dry-run', stdout=out)
+        self.assertIn('1 ofertas', out.getvalue())
+        call_command('archive_job_postings', '--batch-size', '1', stdout=out)
+        self.assertIn('1 ofertas y 1 postulaciones archivadas', out.getvalue())
+
+        self.assertEqual(set(JobPosting.all_objects.values_list('title', flat=True)), {'Soporte 2024', 'Analista actual'})
+        self.assertFalse(Application.all_objects.filter(id=self.application.id).exists())
+        self.assertFalse(Question.objects.filter(job_posting_id=self.closed.id).exists())
+        self.assertEqual(Answer.objects.count(), 0)
+
+        job = ArchivedJobPosting.objects.get(id=self.closed.id)
+        self.assertEqual((job.recruiter_id, job.min_education), (self.company.id, 'Universitaria'))
+        self.assertEqual(job.questions[0]['options'], ['Mañana'])
+        archived = job.applications.get()
+        self.assertEqual((archived.id, archived.applicant_username, archived.status), (self.application.id, 'alumno', 'accepted'))
+        self.assertEqual(archived.answers, [{'question': '¿Turno?', 'answer': 'Mañana'}])
+
+        # Repetir no archiva nada más; include_pending también toma la oferta pendiente
+        call_command('archive_job_postings', stdout=out)
+        call_command('archive_job_postings', '--include-pending', stdout=out)
+        self.assertEqual(ArchivedJobPosting.objects.count(), 2)
+
+    def test_archived_records_stay_readable(self):
+        call_command('archive_job_postings', stdout=StringIO())
+        self.client.force_login(self.company)
+        response = self.client.get(reverse('archived_jobs'))
+        self.assertContains(response, 'Analista 2024')
+        self.assertEqual([job.applications_count for job in response.context['jobs']], [1])
+        response = self.client.get(reverse('view_archived_applications', args=[self.closed.id]))
+        self.assertContains(response, 'Mañana')
+        response = self.client.get(reverse('download_archived_cv', args=[self.application.id]))
+        self.assertEqual(b''.join(response.streaming_content), SAMPLE_PDF)
+
+        self.client.force_login(self.student)
+        response = self.client.get(reverse('my_archived_applications'))
+        self.assertContains(response, 'Analista 2024')
+        self.assertEqual(self.client.get(reverse('view_archived_applications', args=[self.closed.id])).status_code, 404)
+
+    @override_settings(ARCHIVE_DATABASE='archive')
+    def test_archive_tables_can_live_in_their_own_database(self):
+        router = PrimaryReplicaRouter()
+        self.assertEqual(router.db_for_read(ArchivedApplication), 'archive')
+        self.assertEqual(router.db_for_write(ArchivedJobPosting), 'archive')
+        self.assertEqual(router.db_for_write(JobPosting), 'default')
+        self.assertTrue(router.allow_migrate('archive', 'recruiter_app', model_name='archivedjobposting'))
+        self.assertFalse(router.allow_migrate('archive', 'recruiter_app', model_name='jobposting'))
+        self.assertFalse(router.allow_migrate('archive', 'auth', model_name='permission'))
+        self.assertFalse(router.allow_migrate('default', 'recruiter_app', model_name='archivedapplication'))
+        self.assertIsNone(router.allow_migrate('default', 'recruiter_app', model_name='jobposting'))
+
+
+@override_settings(STATIC_ROOT=tempfile.mkdtemp())
+class StaticAssetTests(SimpleTestCase):
+    def setUp(self):
+        call_command('collectstatic', interactive=False, verbosity=0)
+        self.hashed = staticfiles_storage.stored_name('recruiter_app/js/portal.js')
+        with open(os.path.join(settings.STATIC_ROOT, self.hashed), 'rb') as file:
+            self.content = file.read()
+
+    def get(self, name, **headers):
+        response = self.client.get(settings.STATIC_URL + name, headers=headers)
+        body = b''.join(response.streaming_content) if response.streaming else response.content
+        response.close()
+        return response, body
+
+    def test_collectstatic_writes_hashed_and_precompressed_files(self):
+        self.assertRegex(self.hashed, r'^recruiter_app/js/portal\.[0-9a-f]{12}\.js$')
+        self.assertTrue(os.path.exists(os.path.join(settings.STATIC_ROOT, self.hashed + '.gz')))
+        self.assertIn(self.hashed, staticfiles_storage.immutable_names)
+
+    def test_hashed_files_are_immutable_and_served_compressed(self):
+        response, body = self.get(self.hashed, accept_encoding='gzip, deflate, br;q=0')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('javascript', response['Content-Type'])
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('max-age=31536000', response['Cache-Control'])
+        self.assertEqual(gzip.decompress(body), self.content)
+        self.assertNotIn('Server-Timing', response)  # No pasa por el resto de middlewares
+
+        response, body = self.get(self.hashed, accept_encoding='identity')
+        self.assertNotIn('Content-Encoding', response)
+        self.assertEqual(body, self.content)
+
+    def test_unhashed_names_are_revalidated(self):
+        response, _ = self.get('recruiter_app/js/portal.js', accept_encoding='gzip')
+        self.assertNotIn('immutable', response['Cache-Control'])
+        response, body = self.get('recruiter_app/js/portal.js', accept_encoding='gzip', if_none_match=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(body, b'')
+
+    def test_only_collected_files_are_served(self):
+        self.assertEqual(self.get('recruiter_app/js/missing.js')[0].status_code, 404)
+        self.assertEqual(self.get('../manage.py')[0].status_code, 404)
+        self.assertEqual(assets.accepted_encodings('gzip;q=0, br'), {'br'})
+
+
+class StaticTemplateTests(TestCase):
+    STATIC_TAG_RE = re.compile(r"""{%\s*static\s+['"]([^'"]+)['"]\s*%}""")
+
+    def test_static_references_have_source_files(self):
+        # Con el manifiesto de collectstatic, una referencia sin archivo rompe la página (500)
+        templates = os.path.join(os.path.dirname(__file__), 'templates')
+        references = []
+        for directory, _, filenames in os.walk(templates):
+            for filename in filenames:
+                with open(os.path.join(directory, filename), encoding='utf-8') as file:
+                    references += [(filename, path) for path in self.STATIC_TAG_RE.findall(file.read())]
+        self.assertTrue(references)
+        self.assertEqual([(name, path) for name, path in references if not finders.find(path)], [])
+
+    def test_pages_use_local_assets(self):
+        response = self.client.get(reverse('home'))
+        self.assertNotContains(response, '<style>')
+        self.assertContains(response, settings.STATIC_URL + 'recruiter_app/css/portal.css')
+        self.assertContains(response, settings.STATIC_URL + 'recruiter_app/js/portal.js')
+        self.assertNotContains(response, 'cdn.jsdelivr.net')
+        for _, name, _ in assets.VENDOR_ASSETS:
+            self.assertIsNotNone(finders.find(name))
+            self.assertContains(response, settings.STATIC_URL + name)
+
+    def test_page_scripts_are_bundled(self):
+        company = CustomUser.objects.create_user('empresa', password=None, is_company=True)
+        job = create_job(company, 'Analista')
+        self.client.force_login(company)
+        response = self.client.get(reverse('list_jobs'))
+        self.assertNotContains(response, '<script>')
+        self.assertContains(response, f'data-delete-url="{reverse("delete_job_posting", args=[job.id])}"')
+
+        response = self.client.get(reverse('received_applications'))
+        self.assertNotContains(response, 'onclick=')
+        self.assertContains(response, 'data-confirm=')
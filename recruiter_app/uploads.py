@@ -0,0 +1,89 @@
+# recruiter_app/uploads.py
+"""
+Manejo de subida de CVs.
+
+``CVUploadHandler`` reemplaza a los handlers por defecto de Django: escribe el
+archivo a disco por bloques (nunca lo mantiene completo en memoria), rechaza
+tamaños y tipos no permitidos en cuanto los detecta y calcula el SHA-256
+mientras llegan los datos. El hash lo usa ``ContentAddressedStorage`` para
+guardar una sola copia de cada CV.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.files.uploadhandler import SkipFile, TemporaryFileUploadHandler
+from django.template.defaultfilters import filesizeformat
+
+DEFAULT_MAX_SIZE = 5 * 1024 * 1024
+DEFAULT_CONTENT_TYPES = ('application/pdf',)
+# Campos de formulario a los que se aplican los límites de CV.
+CV_FIELD_NAMES = ('cv',)
+# Firma de los archivos PDF; se comprueba en el primer bloque recibido.
+PDF_SIGNATURE = b'%PDF-'
+
+
+def max_cv_size():
+    return getattr(settings, 'CV_MAX_UPLOAD_SIZE', DEFAULT_MAX_SIZE)
+
+
+def allowed_content_types():
+    return getattr(settings, 'CV_ALLOWED_CONTENT_TYPES', DEFAULT_CONTENT_TYPES)
+
+
+def validate_cv_header(content_type, first_bytes):
+    """Devuelve un mensaje de error si el tipo o la firma del archivo no son válidos."""
+    if content_type not in allowed_content_types():
+        return 'Solo se aceptan CVs en formato PDF.'
+    if not first_bytes.startswith(PDF_SIGNATURE):
+        return 'El archivo no es un PDF válido.'
+    return None
+
+
+def size_error():
+    return f'El CV no puede superar {filesizeformat(max_cv_size())}.'
+
+
+class CVUploadHandler(TemporaryFileUploadHandler):
+    """
+    Guarda cada archivo en un temporal por bloques y calcula su SHA-256. Si un
+    CV no cumple los límites se descarta el resto del flujo y el motivo queda
+    en ``request.upload_errors`` para que el formulario lo muestre.
+    """
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        self.request_length = content_length
+        return super().handle_raw_input(input_data, META, content_length, boundary, encoding)
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        self.hasher = hashlib.sha256()
+        self.received = 0
+        self.is_cv = field_name in CV_FIELD_NAMES
+        # La petición completa ya excede el límite: no vale la pena leer el archivo.
+        request_length = getattr(self, 'request_length', None) or 0
+        if self.is_cv and request_length > max_cv_size() + 64 * 1024:
+            self.reject(size_error())
+
+    def reject(self, message):
+        if not hasattr(self.request, 'upload_errors'):
+            self.request.upload_errors = {}
+        self.request.upload_errors[self.field_name] = message
+        # El parser cierra el temporal y descarta el resto del archivo.
+        raise SkipFile(message)
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.is_cv:
+            if self.received == 0:
+                error = validate_cv_header(self.content_type, raw_data)
+                if error:
+                    self.reject(error)
+            if self.received + len(raw_data) > max_cv_size():
+                self.reject(size_error())
+        self.received += len(raw_data)
+        self.hasher.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded = super().file_complete(file_size)
+        uploaded.sha256 = self.hasher.hexdigest()
+        return uploaded
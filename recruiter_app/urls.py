@@ -14,18 +14,30 @@ urlpatterns = [
     # URLs para reclutadores
     path('jobs/create/', views.create_job_posting, name='create_job_posting'),
     path('jobs/', views.list_job_postings, name='list_jobs'),
+    path('jobs/import/', views.import_job_postings, name='import_job_postings'),
     path('jobs/<int:job_id>/applications/', views.view_applications, name='view_applications'),
+    path('jobs/<int:job_id>/applications/export/', views.export_applications, name='export_applications'),
     path('jobs/edit/<int:job_id>/', views.edit_job_posting, name='edit_job_posting'),
     path('jobs/delete/<int:job_id>/', views.delete_job_posting, name='delete_job_posting'),
+    path('jobs/archived/', views.archived_jobs, name='archived_jobs'),
+    path('jobs/archived/<int:job_id>/applications/', views.view_archived_applications, name='view_archived_applications'),
+    path('application/archived/<int:application_id>/cv/', views.download_archived_cv, name='download_archived_cv'),
     
     # URLs de gestión de postulaciones
     path('received-applications/', views.received_applications, name='received_applications'),
+    path('applications/bulk/status/', views.bulk_update_application_status, name='bulk_update_application_status'),
+    path('applications/bulk/delete/', views.bulk_delete_applications_view, name='bulk_delete_applications'),
     path('application/<int:application_id>/detail/', views.view_application_detail, name='view_application_detail'),
+    path('application/<int:application_id>/cv/', views.download_cv, name='download_cv'),
     path('application/<int:application_id>/<str:status>/', views.update_application_status, name='update_application_status'),
     
     # URLs para estudiantes
     path('my-applications/', views.my_applications, name='my_applications'),
+    path('my-applications/archived/', views.my_archived_applications, name='my_archived_applications'),
     path('search-jobs/', views.search_jobs, name='search_jobs'),
     path('apply/<int:job_id>/', views.apply_to_job, name='apply_to_job'),
     path('application/delete/<int:application_id>/', views.delete_application, name='delete_application'),
+
+    # Métricas de rendimiento (solo staff)
+    path('perf/metrics/', views.perf_metrics, name='perf_metrics'),
 ]
\ No newline at end of file
@@ -1,18 +1,55 @@
+import os
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.utils.text import slugify
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import require_POST
 from django.shortcuts import render, redirect, get_object_or_404
-from django.db.models import Q
 from django.contrib import messages
+from django.db.models import Count
+from django.db.models.functions import Substr
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.forms import modelformset_factory
 
 # Importaciones de modelos y formularios
-from .models import JobPosting, Question, Application, Answer, CustomUser, QuestionOption
-from .forms import JobPostingForm, QuestionForm, ApplicationForm, StudentRegistrationForm, CompanyRegistrationForm, AnswerForm
+from .models import ArchivedApplication, ArchivedJobPosting, JobPosting, Question, Application, CustomUser
+from .forms import BaseQuestionFormSet, BulkApplicationForm, BulkStatusForm, JobImportUploadForm, JobPostingForm, QuestionForm, ApplicationForm, StudentRegistrationForm, CompanyRegistrationForm, AnswerForm
+from . import caching, exports, perf
+from .downloads import serve_file
+from .facets import JobFilters, afacet_counts
+from .imports import ImportFormatError, JobImporter, detect_format
+from .pagination import akeyset_paginate, get_page_size, keyset_paginate
+from .recommendations import recommended_for
+from .routers import replica_reads
+from .search import get_search_backend
+from .services import (
+    astore_cv, bulk_delete_applications, bulk_update_status, save_job_posting, soft_delete_job_posting,
+    submit_application, update_status,
+)
 
 # Formsets para la creación y edición de ofertas
-QuestionFormSet = modelformset_factory(Question, form=QuestionForm, extra=1, can_delete=True)
+QuestionFormSet = modelformset_factory(Question, form=QuestionForm, formset=BaseQuestionFormSet, extra=1, can_delete=True)
+
+# Errores de importación que se muestran en la página (el resto solo se cuenta)
+MAX_IMPORT_ERRORS_SHOWN = 200
+
+# Orden de los listados de ofertas, respaldado por índices compuestos
+JOB_LIST_ORDERING = ('-created_at', '-id')
+
+def job_list_queryset(excerpt_length, *fields):
+    """Ofertas con solo las columnas que muestran los listados (más ``fields``) y un extracto calculado en la BD."""
+    return JobPosting.objects.only('id', 'title', 'salary', 'created_at', *fields).annotate(
+        # Un carácter extra permite a truncatechars añadir los puntos suspensivos
+        excerpt=Substr('description', 1, excerpt_length + 1),
+    )
 
+@cache_page(caching.cache_timeout(), cache=getattr(settings, 'JOB_CACHE_ALIAS', 'default'), key_prefix='home')
 def home(request):
-    """Renderiza la página de inicio."""
+    """Renderiza la página de inicio (estática, igual para todos los visitantes)."""
     return render(request, 'recruiter_app/home.html')
 
 # ---
@@ -50,7 +87,10 @@ def register_company(request):
 @login_required
 def dashboard(request):
     """Renderiza el dashboard del usuario según su rol."""
-    return render(request, 'recruiter_app/dashboard.html')
+    context = {}
+    if not request.user.is_company:
+        context['recommendations'] = recommended_for(request.user)
+    return render(request, 'recruiter_app/dashboard.html', context)
 
 # ---
 # Gestión de Ofertas de Empleo (Reclutadores)
@@ -61,41 +101,53 @@ def create_job_posting(request):
     """Permite a los reclutadores crear una nueva oferta con preguntas dinámicas."""
     if request.method == 'POST':
         job_form = JobPostingForm(request.POST)
-        question_formset = QuestionFormSet(request.POST, prefix='questions')
-        
+        question_formset = QuestionFormSet(request.POST, prefix='questions', queryset=Question.objects.none())
+
         if job_form.is_valid() and question_formset.is_valid():
-            job = job_form.save(commit=False)
-            job.recruiter = request.user
-            job.save()
-            
-            for form_q in question_formset:
-                if form_q.is_valid() and form_q.cleaned_data and not form_q.cleaned_data.get('DELETE'):
-                    question = form_q.save(commit=False)
-                    question.job_posting = job
-                    question.save()
-
-                    if question.question_type == 'closed':
-                        options_text = request.POST.get(f'options_for_{form_q.prefix}', '')
-                        if options_text:
-                            for option_text in options_text.split('||'):
-                                QuestionOption.objects.create(question=question, text=option_text.strip())
+            # Oferta, preguntas y opciones se guardan en una sola transacción
+            save_job_posting(job_form, question_formset, request.POST, recruiter=request.user)
             return redirect('list_jobs')
     else:
         job_form = JobPostingForm()
         # Para crear una oferta, el `formset` debe tener al menos una pregunta en blanco.
         question_formset = QuestionFormSet(queryset=Question.objects.none(), prefix='questions')
-        # Lógica para añadir una pregunta en blanco
-        extra_form = QuestionFormSet(queryset=Question.objects.none(), prefix='questions')
-        context = {
-            'job_form': job_form,
-            'question_formset': extra_form,
-        }
+
+    context = {
+        'job_form': job_form,
+        'question_formset': question_formset,
+    }
     return render(request, 'recruiter_app/create_job.html', context)
+
+@login_required
+def import_job_postings(request):
+    """Crea ofertas en bloque desde un archivo CSV o JSONL (ver recruiter_app/imports.py)."""
+    result = None
+    if request.method == 'POST':
+        form = JobImportUploadForm(request.POST, request.FILES)
+        if form.is_valid():
+            upload = form.cleaned_data['file']
+            try:
+                importer = JobImporter(request.user, dry_run=form.cleaned_data['dry_run'])
+                result = importer.run(upload, detect_format(upload.name))
+            except (ImportFormatError, UnicodeDecodeError) as error:
+                form.add_error('file', str(error))
+    else:
+        form = JobImportUploadForm()
+    context = {
+        'form': form,
+        'result': result,
+        'errors': result.errors[:MAX_IMPORT_ERRORS_SHOWN] if result else [],
+    }
+    return render(request, 'recruiter_app/import_jobs.html', context)
+
+@replica_reads
 @login_required
 def list_job_postings(request):
     """Muestra una lista de ofertas creadas por el usuario actual."""
-    jobs = JobPosting.objects.filter(recruiter=request.user)
-    return render(request, 'recruiter_app/list_jobs.html', {'jobs': jobs})
+    # Los contadores son columnas de la oferta: no hace falta contar postulaciones
+    jobs = job_list_queryset(100, *JobPosting.COUNTER_FIELDS).filter(recruiter=request.user)
+    page = keyset_paginate(jobs, JOB_LIST_ORDERING, request.GET.get('cursor'), get_page_size(request))
+    return render(request, 'recruiter_app/list_jobs.html', {'jobs': page, 'page': page})
 
 @login_required
 def edit_job_posting(request, job_id):
@@ -107,40 +159,15 @@ def edit_job_posting(request, job_id):
         question_formset = QuestionFormSet(request.POST, prefix='questions', queryset=Question.objects.filter(job_posting=job))
 
         if job_form.is_valid() and question_formset.is_valid():
-            job_form.save()
-            
-            # Guardamos las preguntas y sus opciones
-            for form_q in question_formset:
-                if form_q.is_valid():
-                    # Si el formulario está marcado para borrarse, se elimina la instancia
-                    if form_q.cleaned_data.get('DELETE'):
-                        if form_q.instance.pk: # Solo si ya existe en la BD
-                            form_q.instance.delete()
-                        continue # Pasa al siguiente formulario
-
-                    # Procesa solo si el formulario tiene datos (evita guardar formularios vacíos)
-                    if form_q.cleaned_data and form_q.has_changed():
-                        question = form_q.save(commit=False)
-                        question.job_posting = job
-                        question.save() # <-- ¡PASO CLAVE! Guarda la pregunta para obtener un ID.
-
-                        # Ahora que 'question' tiene un ID, podemos gestionar sus opciones
-                        if question.question_type == 'closed':
-                            options_text = request.POST.get(f'options_for_{form_q.prefix}', '')
-                            
-                            # Borramos las opciones antiguas para luego crear las nuevas (más simple)
-                            question.options.all().delete() 
-                            
-                            if options_text:
-                                for option_text in options_text.split('||'):
-                                    if option_text.strip(): # Evita guardar opciones vacías
-                                        QuestionOption.objects.create(question=question, text=option_text.strip())
+            # Preguntas nuevas, editadas y borradas, y el diff de sus opciones,
+            # se aplican en una sola transacción con operaciones en bloque
+            save_job_posting(job_form, question_formset, request.POST)
             
             messages.success(request, 'La oferta se ha actualizado correctamente.')
             return redirect('list_jobs')
     else:
         job_form = JobPostingForm(instance=job)
-        question_formset = QuestionFormSet(prefix='questions', queryset=job.questions.all())
+        question_formset = QuestionFormSet(prefix='questions', queryset=job.questions.prefetch_related('options'))
 
     context = {
         'job_form': job_form,
@@ -153,21 +180,33 @@ def edit_job_posting(request, job_id):
 def delete_job_posting(request, job_id):
     job = get_object_or_404(JobPosting, id=job_id, recruiter=request.user)
     if request.method == 'POST':
-        job.delete()
+        soft_delete_job_posting(job)
         messages.success(request, 'La oferta se ha eliminado correctamente.')
         return redirect('list_jobs')
     
     context = {'job': job}
     return render(request, 'recruiter_app/delete_job.html', context)
 
+@replica_reads
 @login_required
 def received_applications(request):
-    """Muestra todas las postulaciones recibidas por el reclutador."""
-    user_jobs = request.user.jobposting_set.all()
-    received_apps = Application.objects.filter(job_posting__in=user_jobs).order_by('-submitted_at')
-    
+    """
+    Muestra las postulaciones recibidas por el reclutador. Con ``q`` filtra a
+    los candidatos cuyo CV o respuestas contienen los términos (índice FTS).
+    """
+    received_apps = (
+        Application.objects.filter(job_posting__recruiter=request.user)
+        .select_related('job_posting', 'applicant')
+        .defer('job_posting__description', 'cv_text')
+        .order_by('-submitted_at')
+    )
+    query = request.GET.get('q', '').strip()
+    if query:
+        received_apps = get_search_backend().search_candidates(received_apps, query)
+
     context = {
         'received_apps': received_apps,
+        'query': query,
     }
     return render(request, 'recruiter_app/received_applications.html', context)
 
@@ -175,25 +214,104 @@ def received_applications(request):
 def view_applications(request, job_id):
     """Shows all applications for a specific job posting."""
     job = get_object_or_404(JobPosting, id=job_id, recruiter=request.user)
-    applications = job.applications.all()
+    applications = job.applications.select_related('applicant').defer('cv_text').order_by('-submitted_at')
     return render(request, 'recruiter_app/applications.html', {'job': job, 'applications': applications})
 
+@replica_reads
 @login_required
 def view_application_detail(request, application_id):
     """Displays the full details of a single application."""
-    application = get_object_or_404(Application, id=application_id)
-    answers = application.answers.all()
+    application = get_object_or_404(
+        Application.objects.select_related('applicant').defer('cv_text'), id=application_id,
+        job_posting__recruiter=request.user,
+    )
+    answers = application.answers.select_related('question')
     return render(request, 'recruiter_app/application_detail.html', {'application': application, 'answers': answers})
 
+@login_required
+def download_cv(request, application_id):
+    """Entrega el CV de una postulación solo al reclutador dueño de la oferta."""
+    application = get_object_or_404(
+        Application.objects.only('id', 'cv', 'cv_sha256', 'cv_filename'),
+        id=application_id, job_posting__recruiter=request.user,
+    )
+    return serve_cv(request, application)
+
+def serve_cv(request, application):
+    """Respuesta con el CV de ``application`` (activa o archivada)."""
+    storage, name = application.cv.storage, application.cv.name
+    if not name or not storage.exists(name):
+        raise Http404('El CV no está disponible.')
+    filename = application.cv_filename or os.path.basename(name)
+    return serve_file(request, storage, name, filename, etag=application.cv_sha256 or None)
+
+# ---
+# Ofertas y postulaciones archivadas (ver recruiter_app/archive.py). Se leen
+# de las tablas de archivo, sin caché ni réplicas: es el camino lento.
+# ---
+
+@login_required
+def archived_jobs(request):
+    """Ofertas archivadas del reclutador."""
+    jobs = ArchivedJobPosting.objects.filter(recruiter_id=request.user.id).only(
+        'id', 'title', 'salary', 'created_at', 'archived_at',
+    ).annotate(excerpt=Substr('description', 1, 101), applications_count=Count('applications'))
+    page = keyset_paginate(jobs, JOB_LIST_ORDERING, request.GET.get('cursor'), get_page_size(request))
+    return render(request, 'recruiter_app/archived_jobs.html', {'jobs': page, 'page': page})
+
+@login_required
+def view_archived_applications(request, job_id):
+    """Postulaciones de una oferta archivada, con sus respuestas."""
+    job = get_object_or_404(ArchivedJobPosting, id=job_id, recruiter_id=request.user.id)
+    applications = job.applications.order_by('-submitted_at')
+    return render(request, 'recruiter_app/archived_applications.html', {'job': job, 'applications': applications})
+
+@login_required
+def download_archived_cv(request, application_id):
+    """Como download_cv, para una postulación archivada."""
+    application = get_object_or_404(
+        ArchivedApplication.objects.only('id', 'cv', 'cv_sha256', 'cv_filename'),
+        id=application_id, job_posting__recruiter_id=request.user.id,
+    )
+    return serve_cv(request, application)
+
+@login_required
+def my_archived_applications(request):
+    """Postulaciones archivadas del estudiante."""
+    my_apps = (
+        ArchivedApplication.objects.filter(applicant_id=request.user.id).select_related('job_posting')
+        .defer('answers', 'job_posting__questions').order_by('-submitted_at')
+    )
+    return render(request, 'recruiter_app/my_applications.html', {'my_apps': my_apps, 'archived': True})
+
+@login_required
+def export_applications(request, job_id):
+    """
+    Descarga las postulaciones de una oferta con una columna por pregunta:
+    ``?format=csv`` (por defecto), ``xlsx`` o ``zip`` (CSV más los CVs).
+    """
+    job = get_object_or_404(JobPosting.objects.only('id', 'title', 'recruiter_id'), id=job_id, recruiter=request.user)
+    export_format = request.GET.get('format', 'csv')
+    if export_format not in exports.FORMATS:
+        export_format = 'csv'
+    content_type, extension = exports.FORMATS[export_format]
+    questions = list(job.questions.only('id', 'text').order_by('id'))
+    response = StreamingHttpResponse(exports.stream_export(job, questions, export_format), content_type=content_type)
+    filename = f'postulaciones-{job.id}-{slugify(job.title)}.{extension}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
 @login_required
 def update_application_status(request, application_id, status):
     """Updates the status of an application (accepted or rejected)."""
-    application = get_object_or_404(Application, id=application_id)
+    application = get_object_or_404(
+        Application.objects.select_related('applicant').defer('cv_text'), id=application_id,
+        job_posting__recruiter=request.user,
+    )
     
     if request.method == 'POST':
         if status in ['accepted', 'rejected']:
-            application.status = status
-            application.save()
+            update_status(application, status)
             messages.success(request, f'La postulación de {application.applicant.username} ha sido {status} correctamente.')
             return redirect('received_applications') 
     
@@ -207,64 +325,139 @@ def delete_application(request, application_id):
     # Verificamos si el usuario actual es el reclutador de la oferta
     if request.user == app.job_posting.recruiter:
         if request.method == 'POST':
-            app.delete()
+            bulk_delete_applications(Application.objects.filter(pk=app.pk))
             messages.success(request, 'La postulación se ha eliminado correctamente.')
             return redirect('received_applications')
     
     messages.error(request, 'No tienes permiso para realizar esta acción.')
     return redirect('received_applications')
 
+def redirect_back(request, default='received_applications'):
+    """Redirige a ``next`` si es una URL local segura, o a ``default``."""
+    next_url = request.POST.get('next')
+    if next_url and url_has_allowed_host_and_scheme(next_url, allowed_hosts={request.get_host()}):
+        return redirect(next_url)
+    return redirect(default)
+
+def bulk_selection_errors(request, form):
+    for error in form.errors.get('__all__', []) or ['La selección no es válida.']:
+        messages.error(request, error)
+
+@login_required
+@require_POST
+def bulk_update_application_status(request):
+    """Cambia el estado de varias postulaciones con un solo UPDATE."""
+    form = BulkStatusForm(request.POST)
+    if not form.is_valid():
+        bulk_selection_errors(request, form)
+        return redirect_back(request)
+
+    requested = len(form.cleaned_data['application_ids'])
+    updated = bulk_update_status(form.get_queryset(request.user), form.cleaned_data['status'])
+    label = dict(Application.STATUS_CHOICES)[form.cleaned_data['status']].lower()
+    messages.success(request, f'{updated} postulaciones marcadas como {label}.')
+    if not form.cleaned_data['select_all'] and updated < requested:
+        messages.warning(request, f'{requested - updated} postulaciones no se actualizaron (no existen o no son tuyas).')
+    return redirect_back(request)
+
+@login_required
+@require_POST
+def bulk_delete_applications_view(request):
+    """Elimina varias postulaciones (y sus respuestas) en una transacción."""
+    form = BulkApplicationForm(request.POST)
+    if not form.is_valid():
+        bulk_selection_errors(request, form)
+        return redirect_back(request)
+
+    requested = len(form.cleaned_data['application_ids'])
+    deleted = bulk_delete_applications(form.get_queryset(request.user))
+    messages.success(request, f'{deleted} postulaciones eliminadas.')
+    if not form.cleaned_data['select_all'] and deleted < requested:
+        messages.warning(request, f'{requested - deleted} postulaciones no se eliminaron (no existen o no son tuyas).')
+    return redirect_back(request)
+
 # ---
 # Búsqueda de Empleo y Postulaciones (Estudiantes)
 # ---
 
+@replica_reads
 @login_required
-def my_applications(request):
+async def my_applications(request):
     """Muestra todas las postulaciones del usuario logeado."""
-    my_apps = Application.objects.filter(applicant=request.user).order_by('-submitted_at')
+    # El usuario se carga aquí para que las plantillas no consulten la BD desde el bucle de eventos
+    request.user = await request.auser()
+    my_apps = [
+        application async for application in
+        Application.objects.filter(applicant=request.user).select_related('job_posting')
+        .defer('cv_text').order_by('-submitted_at')
+    ]
     return render(request, 'recruiter_app/my_applications.html', {'my_apps': my_apps})
 
+@replica_reads
 @login_required
-def search_jobs(request):
-    """Permite a los estudiantes buscar y filtrar ofertas."""
+async def search_jobs(request):
+    """
+    Permite a los estudiantes buscar ofertas y filtrarlas por salario, nivel
+    educativo y antigüedad, con el número de ofertas de cada filtro.
+    """
+    request.user = await request.auser()
     query = request.GET.get('q')
-    jobs = JobPosting.objects.all()
+    filters = JobFilters(request.GET)
+    cursor, page_size = request.GET.get('cursor'), get_page_size(request)
 
-    if query:
-        jobs = jobs.filter(Q(title__icontains=query) | Q(description__icontains=query))
-    
+    def matching(queryset):
+        # Resultados ordenados por relevancia desde el índice de texto completo
+        return get_search_backend().search(queryset, query) if query else queryset
+
+    async def load_page():
+        jobs = matching(job_list_queryset(150)).filter(filters.q())
+        ordering = get_search_backend().ordering if query else JOB_LIST_ORDERING
+        return await akeyset_paginate(jobs, ordering, cursor, page_size)
+
+    # Páginas y conteos se guardan en caché hasta que cambie alguna oferta
+    signature = filters.signature()
+    page = await caching.asearch_page(query, signature, cursor, page_size, load_page)
+    facets = await caching.afacet_counts(
+        query, signature, lambda: afacet_counts(matching(JobPosting.objects.all()), filters),
+    )
     context = {
-        'jobs': jobs,
+        'jobs': page,
+        'page': page,
         'query': query,
+        'filters': filters,
+        'facets': facets,
     }
     return render(request, 'recruiter_app/search_jobs.html', context)
 
 @login_required
-def apply_to_job(request, job_id):
+async def apply_to_job(request, job_id):
     """Maneja el proceso de postulación a una oferta."""
-    job = get_object_or_404(JobPosting, id=job_id)
-    
+
+    async def load_job():
+        job = await JobPosting.objects.filter(id=job_id).afirst()
+        # Preguntas y opciones en dos consultas, compartidas por GET y POST
+        return job and (job, [question async for question in job.questions.prefetch_related('options')])
+
+    # La oferta con su bloque de preguntas se guarda en caché hasta que cambie
+    job_detail = await caching.ajob_detail(job_id, load_job)
+    if job_detail is None:
+        raise Http404('La oferta no existe.')
+    job, questions = job_detail
+    request.user = await request.auser()
+
     if request.method == 'POST':
-        application_form = ApplicationForm(request.POST, request.FILES)
+        application_form = ApplicationForm(
+            request.POST, request.FILES, upload_errors=getattr(request, 'upload_errors', None),
+        )
         
-        if application_form.is_valid():
-            application = application_form.save(commit=False)
-            application.job_posting = job
-            application.applicant = request.user
-            application.save()
-            
-            for question in job.questions.all():
-                answer_text = request.POST.get(f'answer_text_{question.id}', '')
-                if answer_text:
-                    Answer.objects.create(application=application, question=question, answer_text=answer_text)
-            
+        if await sync_to_async(application_form.is_valid)():
+            await astore_cv(application_form)
+            await sync_to_async(submit_application)(job, request.user, application_form, questions, request.POST)
             messages.success(request, 'Tu postulación se ha enviado correctamente.')
             return redirect('my_applications')
     else:
         application_form = ApplicationForm()
     
-    questions = job.questions.all()
-    
     context = {
         'job': job,
         'application_form': application_form,
@@ -272,3 +465,13 @@ def apply_to_job(request, job_id):
     }
     return render(request, 'recruiter_app/apply_to_job.html', context)
 
+# ---
+# Métricas de rendimiento
+# ---
+
+@staff_member_required
+def perf_metrics(request):
+    """Agregado de recruiter_app/perf.py como JSON o, con ?format=prometheus, en texto de Prometheus."""
+    if request.GET.get('format') == 'prometheus':
+        return HttpResponse(perf.STATS.prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+    return JsonResponse({'views': perf.STATS.snapshot()})